@@ -1,10 +1,18 @@
+import argparse
+
 from src.controller import run_phonebook
 
 if __name__ == "__main__":
 
+    parser = argparse.ArgumentParser(description="Phonebook Application")
+    parser.add_argument("--db", help="keep contacts in this SQLite database instead of memory")
+    parser.add_argument("--readonly", action="store_true",
+                        help="open the contacts file read-only through its memory-mapped snapshot")
+    args = parser.parse_args()
+
     # Entry point of the phonebook application
     print("Welcome to the Phonebook Application!")
     print("Use the menu to navigate through options.")
     
     # Start the phonebook program
-    run_phonebook()
\ No newline at end of file
+    run_phonebook(args.db, args.readonly)
\ No newline at end of file
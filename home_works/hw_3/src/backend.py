@@ -0,0 +1,129 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.model_contact import Contact
+
+
+class ContactBackend(ABC):
+    """
+    Interface of a contact store used by PhoneBook.
+
+    A backend owns the contacts and their indexes; PhoneBook adds error
+    handling and file import/export on top of it.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Returns the number of stored contacts.
+        """
+
+    @property
+    def read_only(self) -> bool:
+        """
+        Tells whether the backend rejects changes.
+        """
+        return False
+
+    @property
+    def contacts(self) -> list[Contact]:
+        """
+        Returns all contacts as a list.
+
+        Backends that do not keep contacts in memory build the list on
+        every call, so prefer iter_contacts for large books.
+        """
+        return list(self.iter_contacts())
+
+    @abstractmethod
+    def iter_contacts(self) -> Iterator[Contact]:
+        """
+        Yields all contacts in insertion order.
+        """
+
+    def contact_sequence(self) -> Optional[Sequence[Contact]]:
+        """
+        Returns the contacts in insertion order as a sequence, without copying.
+
+        Returns:
+            Sequence[Contact] | None: None if the backend has no cheap random access.
+        """
+        return None
+
+    @abstractmethod
+    def replace(self, contacts: Iterable[Contact]) -> None:
+        """
+        Replaces all stored contacts with the given ones.
+
+        Args:
+            contacts (Iterable[Contact]): New contacts, consumed lazily.
+        """
+
+    @abstractmethod
+    def add(self, name: str, phone: str, comment: str) -> Contact:
+        """
+        Adds a contact with the next free id.
+
+        Returns:
+            Contact: The added contact.
+        """
+
+    @abstractmethod
+    def add_many(self, rows: Iterable[tuple[str, str, str]]) -> List[Contact]:
+        """
+        Adds (name, phone, comment) rows with consecutive ids.
+
+        Returns:
+            list[Contact]: The added contacts.
+        """
+
+    @abstractmethod
+    def get(self, contact_id: int) -> Optional[Contact]:
+        """
+        Returns the contact with the given id or None.
+        """
+
+    @abstractmethod
+    def find(self, info: str) -> List[Contact]:
+        """
+        Returns contacts whose id, name, phone or comment equals `info`.
+        """
+
+    @abstractmethod
+    def search(self, fragment: str) -> List[Contact]:
+        """
+        Returns contacts whose name or comment contains `fragment`.
+        """
+
+    @abstractmethod
+    def fuzzy(self, query: str, limit: int, max_distance: int) -> List[Tuple[Contact, float]]:
+        """
+        Returns up to `limit` (contact, score) pairs ranked by similarity to `query`.
+        """
+
+    @abstractmethod
+    def update(self,
+               contact_id: int,
+               name: Optional[str] = None,
+               phone: Optional[str] = None,
+               comment: Optional[str] = None) -> Optional[Contact]:
+        """
+        Updates the provided fields of a contact.
+
+        Returns:
+            Contact | None: The updated contact, or None if it does not exist.
+        """
+
+    @abstractmethod
+    def delete(self, contact_id: int) -> bool:
+        """
+        Deletes a contact.
+
+        Returns:
+            bool: False if the contact does not exist.
+        """
+
+    def close(self) -> None:
+        """
+        Releases resources held by the backend.
+        """
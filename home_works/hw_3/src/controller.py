@@ -3,25 +3,41 @@
 # from src.exceptions import FileError, ContactError
 from src import view
 from src.model_phonebook import PhoneBook
+from src.sqlite_backend import SQLiteBackend
 from src.exceptions import FileError, ContactError
+from typing import Optional
 import os
 
 
-def run_phonebook():
+def run_phonebook(database: Optional[str] = None, readonly: bool = False):
     """
     Orchestrates the phone book application by managing user input, 
     handling the menu, and connecting the model and view.
-    """
 
-    FILE_NAME = "contacts.json"
+    Args:
+        database (str, optional): Path to a SQLite database. When given,
+            contacts are kept in the database and options 1 and 2 only
+            import and export the JSON file.
+        readonly (bool): Open the contacts file read-only through its
+            memory-mapped snapshot instead of loading it.
+    """
 
-    phonebook = PhoneBook()
+    FILE_NAME = "contacts.jsonl"
 
     # Get the directory where the current script is located
     directory = os.path.dirname(__file__)
 
     # Join the directory path with the filename FILE_NAME
     file_name = os.path.join(directory, FILE_NAME)
+
+    if readonly:
+        try:
+            phonebook = PhoneBook.open_snapshot(file_name)
+        except FileError as e:
+            view.show_message(str(e))
+            return
+    else:
+        phonebook = PhoneBook(SQLiteBackend(database)) if database else PhoneBook()
     
     exit_program = False
     while not exit_program:
@@ -43,8 +59,8 @@ def run_phonebook():
             
              # Show all contacts
             elif choice == '3': 
-                if phonebook.contacts:
-                    view.show_contacts(phonebook.contacts)
+                if len(phonebook):
+                    view.show_contacts_paged(phonebook.browse_contacts(), len(phonebook))
                 else:
                     view.show_message("No contacts to display.")
             
@@ -57,8 +73,15 @@ def run_phonebook():
             # Find contact
             elif choice == '5':  
                 info = input("Enter ID, name, phone, or comment to search: ")
-                results = phonebook.find_contact(info)
-                view.show_contacts(results)
+                try:
+                    view.show_contacts(phonebook.find_contact(info))
+                except ContactError:
+                    try:
+                        # No exact match, fall back to partial name/comment search
+                        view.show_contacts(phonebook.search_contacts(info))
+                    except ContactError:
+                        # Still nothing, show the closest names (typos, similar sound)
+                        view.show_ranked_contacts(phonebook.fuzzy_find(info))
             
             # Change contact
             elif choice == '6':  
@@ -76,6 +99,7 @@ def run_phonebook():
             # Exit
             elif choice == '8':  
                 exit_program = True
+                phonebook.close()
                 view.show_message("Exiting the program.")
             else:
                 view.show_message("Invalid choice. Please try again.")
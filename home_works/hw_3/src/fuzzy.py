@@ -0,0 +1,100 @@
+import heapq
+from typing import Iterable, List, Optional, Tuple
+
+from src.model_contact import Contact
+from src.search_index import normalize_phone, normalize_text, soundex
+
+
+# Score given to a contact found only by how its name sounds
+PHONETIC_SCORE = 0.5
+
+
+def bounded_levenshtein(first: str, second: str, max_distance: int) -> Optional[int]:
+    """
+    Computes the edit distance between two strings if it is small enough.
+
+    Only a band of 2 * max_distance + 1 cells per row is evaluated, and the
+    computation stops as soon as the distance is known to exceed the bound.
+
+    Args:
+        first (str): First string.
+        second (str): Second string.
+        max_distance (int): Largest distance of interest.
+
+    Returns:
+        int | None: The distance, or None if it exceeds max_distance.
+    """
+    if abs(len(first) - len(second)) > max_distance:
+        return None
+    if len(first) > len(second):
+        first, second = second, first
+    too_far = max_distance + 1
+    previous = [i if i <= max_distance else too_far for i in range(len(second) + 1)]
+    for i, char in enumerate(first, start=1):
+        current = [too_far] * (len(second) + 1)
+        if i <= max_distance:
+            current[0] = i
+        low, high = max(1, i - max_distance), min(len(second), i + max_distance)
+        for j in range(low, high + 1):
+            cost = 0 if char == second[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost, too_far)
+        if min(current[low - 1:high + 1]) > max_distance:
+            return None
+        previous = current
+    distance = previous[-1]
+    return distance if distance <= max_distance else None
+
+
+def score_match(query: str, contact: Contact, max_distance: int) -> float:
+    """
+    Scores how well a contact matches a fuzzy query.
+
+    A query with a single word is compared with every word of the name,
+    a longer query with the whole name. Equal phone digits give a full score.
+
+    Args:
+        query (str): Raw search query.
+        contact (Contact): Candidate contact.
+        max_distance (int): Largest edit distance that still counts as a match.
+
+    Returns:
+        float: Score from 0 (no match) to 1 (exact match).
+    """
+    digits = normalize_phone(query)
+    if digits and digits == normalize_phone(contact.phone):
+        return 1.0
+
+    text = normalize_text(query)
+    name = normalize_text(contact.name)
+    targets = [name]
+    if " " not in text:
+        targets.extend(name.split())
+
+    best = 0.0
+    for target in targets:
+        distance = bounded_levenshtein(text, target, max_distance)
+        if distance is not None:
+            best = max(best, 1 - distance / max(len(text), len(target), 1))
+
+    query_codes = {soundex(word) for word in text.split()} - {""}
+    if best < PHONETIC_SCORE and query_codes & {soundex(word) for word in name.split()}:
+        best = PHONETIC_SCORE
+    return best
+
+
+def rank(query: str, candidates: Iterable[Contact], limit: int, max_distance: int) -> List[Tuple[Contact, float]]:
+    """
+    Scores candidates and returns the best ones.
+
+    Args:
+        query (str): Raw search query.
+        candidates (Iterable[Contact]): Contacts to score.
+        limit (int): Number of results to return.
+        max_distance (int): Largest edit distance that still counts as a match.
+
+    Returns:
+        list[tuple[Contact, float]]: Up to `limit` (contact, score) pairs, best first.
+    """
+    scored = ((contact, score_match(query, contact, max_distance)) for contact in candidates)
+    return heapq.nsmallest(limit, ((contact, score) for contact, score in scored if score > 0),
+                           key=lambda pair: (-pair[1], pair[0].id))
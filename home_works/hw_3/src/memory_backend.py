@@ -0,0 +1,129 @@
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.backend import ContactBackend
+from src.fuzzy import rank
+from src.model_contact import Contact
+from src.search_index import ContactIndex, paused_gc
+
+
+class MemoryBackend(ContactBackend):
+    """
+    Keeps all contacts in a list with in-memory search indexes.
+    """
+
+    # Deleted contacts stay in the list as tombstones until
+    # at least this many (and half of the list) pile up
+    COMPACT_MIN_TOMBSTONES = 1024
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty store.
+        """
+        self._index = ContactIndex()
+        self._records: list[Contact] = []
+        self._tombstones = 0
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def contacts(self) -> list[Contact]:
+        """
+        Returns the contacts in insertion order without copying them.
+        """
+        if self._tombstones:
+            self._compact()
+        return self._records
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        by_id = self._index.by_id
+        # Skip tombstones of deleted contacts
+        for contact in self._records:
+            if by_id.get(contact.id) is contact:
+                yield contact
+
+    def contact_sequence(self) -> Optional[Sequence[Contact]]:
+        return self.contacts
+
+    def replace(self, contacts: Iterable[Contact]) -> None:
+        self._records = list(contacts)
+        self._tombstones = 0
+        self._index.rebuild(self._records)
+        self._next_id = max((contact.id for contact in self._records), default=0) + 1
+
+    def add(self, name: str, phone: str, comment: str) -> Contact:
+        # Automatically assign a unique ID
+        new_contact = Contact(self._next_id, name, phone, comment)
+        self._next_id += 1
+
+        self._records.append(new_contact)
+        self._index.add(new_contact)
+        return new_contact
+
+    def add_many(self, rows: Iterable[tuple[str, str, str]]) -> List[Contact]:
+        """
+        Adds rows in bulk.
+
+        Only the id index is filled right away; the other indexes are
+        built on the first query that needs them, and the garbage
+        collector is paused while the rows are created.
+        """
+        first_id = self._next_id
+        with paused_gc():
+            new_contacts = [Contact(contact_id, name, phone, comment)
+                            for contact_id, (name, phone, comment) in enumerate(rows, start=first_id)]
+            self._next_id = first_id + len(new_contacts)
+
+            self._records.extend(new_contacts)
+            self._index.add_many(new_contacts)
+        return new_contacts
+
+    def get(self, contact_id: int) -> Optional[Contact]:
+        return self._index.by_id.get(contact_id)
+
+    def find(self, info: str) -> List[Contact]:
+        return self._index.lookup(info)
+
+    def search(self, fragment: str) -> List[Contact]:
+        return self._index.search(fragment)
+
+    def fuzzy(self, query: str, limit: int, max_distance: int) -> List[Tuple[Contact, float]]:
+        return rank(query, self._index.fuzzy_candidates(query, max_distance), limit, max_distance)
+
+    def update(self,
+               contact_id: int,
+               name: Optional[str] = None,
+               phone: Optional[str] = None,
+               comment: Optional[str] = None) -> Optional[Contact]:
+        contact = self._index.by_id.get(contact_id)
+        if contact is None:
+            return None
+        # Re-index the contact under its new values
+        self._index.remove(contact)
+        # Update only the fields provided
+        contact.name = name or contact.name
+        contact.phone = phone or contact.phone
+        contact.comment = comment or contact.comment
+        self._index.add(contact)
+        return contact
+
+    def delete(self, contact_id: int) -> bool:
+        contact = self._index.by_id.get(contact_id)
+        if contact is None:
+            return False
+        # Leave a tombstone: the contact is gone from the indexes
+        # and is dropped from the list on the next compaction
+        self._index.remove(contact)
+        self._tombstones += 1
+        if self._tombstones >= max(self.COMPACT_MIN_TOMBSTONES, len(self._records) // 2):
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        """
+        Drops tombstones of deleted contacts from the list.
+        """
+        by_id = self._index.by_id
+        self._records = [contact for contact in self._records if by_id.get(contact.id) is contact]
+        self._tombstones = 0
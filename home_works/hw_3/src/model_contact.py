@@ -4,8 +4,13 @@ from typing import Any
 class Contact:
     """
     Represents a single contact in the phonebook.
+
+    Uses __slots__ instead of a per-instance __dict__ to keep
+    large phone books small in memory.
     """
 
+    __slots__ = ("id", "name", "phone", "comment")
+
     def __init__(self, id: int, name: str, phone: str, comment: str) -> None:
     
         """
@@ -1,8 +1,15 @@
 import json
 import os
-from typing import List, Optional
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+from src.backend import ContactBackend
 from src.exceptions import FileError, ContactError
+from src.memory_backend import MemoryBackend
 from src.model_contact import Contact
+from src.snapshot import SnapshotBackend, snapshot_name, write_snapshot
+from src.storage import JsonLinesStorage, write_json_array
+
+
+JSON_LINES_EXTENSION = ".jsonl"
 
 
 class PhoneBook:
@@ -10,22 +17,113 @@ class PhoneBook:
     Represents the phone book that manages multiple contacts.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, backend: Optional[ContactBackend] = None) -> None:
+        """
+        Initializes a phone book.
+
+        Args:
+            backend (ContactBackend, optional): Where contacts are stored.
+                Defaults to an empty in-memory store.
+        """
+        self._backend = backend if backend is not None else MemoryBackend()
+        # Storage the book was loaded from and changes not saved to it yet
+        self._storage: Optional[JsonLinesStorage] = None
+        self._changes: list[dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._backend)
+
+    @property
+    def contacts(self) -> list[Contact]:
+        """
+        Returns the contacts of the phone book in insertion order.
+        """
+        return self._backend.contacts
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        """
+        Yields the contacts of the phone book without building a list.
+        """
+        return self._backend.iter_contacts()
+
+    def browse_contacts(self) -> Iterable[Contact]:
+        """
+        Returns the contacts for page-by-page browsing.
+
+        Returns:
+            Iterable[Contact]: A sequence over the backend's own storage when
+                it has random access, otherwise a lazy iterator.
+        """
+        sequence = self._backend.contact_sequence()
+        return sequence if sequence is not None else self.iter_contacts()
+
+    @classmethod
+    def open_snapshot(cls, file_name: str) -> "PhoneBook":
+        """
+        Opens a contacts file read-only through its memory-mapped snapshot.
+
+        The snapshot `<file>.snapshot` is (re)built from the file first if it
+        is missing or older than the file or its write-ahead log; otherwise
+        opening takes the same time for any number of contacts. Changing
+        the returned book raises ContactError.
+
+        Args:
+            file_name (str): Path to the JSON or JSON Lines file.
+
+        Returns:
+            PhoneBook: A read-only phone book.
+
+        Raises:
+            FileError: If neither the file nor its snapshot exists.
+        """
+        snapshot = snapshot_name(file_name)
+        storage = JsonLinesStorage(file_name)
+        sources = [name for name in (storage.file_name, storage.log_name, storage.old_log_name)
+                   if os.path.exists(name)]
+        if not os.path.exists(snapshot) or any(
+                os.path.getmtime(name) > os.path.getmtime(snapshot) for name in sources):
+            if not sources:
+                raise FileError(f"File '{file_name}' not found.")
+            if file_name.endswith(JSON_LINES_EXTENSION):
+                # Stream straight from the file without building indexes
+                write_snapshot(snapshot, (Contact(**contact) for contact in storage.iter_contacts()))
+            else:
+                source = cls()
+                source.load_from_file(file_name)
+                write_snapshot(snapshot, source.iter_contacts())
+        return cls(SnapshotBackend(snapshot))
+
+    def close(self) -> None:
         """
-        Initializes an empty phone book.
+        Waits for background file work and releases the backend.
         """
-        self.contacts: list[Contact] = []
+        if self._storage is not None:
+            self._storage.wait()
+        self._backend.close()
 
     def load_from_file(self, file_name: str) -> None:
         """
         Loads contacts from a JSON file.
 
+        Files with the `.jsonl` extension are streamed line by line through
+        a JsonLinesStorage, and later saves to the same file only append
+        the changes made since the load to its write-ahead log.
+
         Args:
-            file_name (str): Path to the JSON file.
+            file_name (str): Path to the JSON or JSON Lines file.
         
         Raises:
             FileError: If the file does not exist or cannot be read.
         """
+        if file_name.endswith(JSON_LINES_EXTENSION):
+            storage = JsonLinesStorage(file_name)
+            if not storage.exists():
+                raise FileError(f"File '{file_name}' not found.")
+            self._backend.replace(Contact(**contact) for contact in storage.iter_contacts())
+            self._storage = storage
+            self._changes.clear()
+            return
+
         if not os.path.exists(file_name):
             raise FileError(f"File '{file_name}' not found.")
         with open(file_name, 'r') as file:
@@ -33,27 +131,64 @@ class PhoneBook:
                 # Load JSON data
                 data = json.load(file)  
                 # Convert the loaded dictionaries into Contact objects
-                self.contacts = [Contact(**contact) for contact in data]
+                self._backend.replace(Contact(**contact) for contact in data)
+                self._storage = None
+                self._changes.clear()
             except json.JSONDecodeError:
                 raise FileError(f"File '{file_name}' is not a valid JSON file.")
 
-    def save_to_file(self, file_name: str) -> None:
+    def save_to_file(self, file_name: str, snapshot: bool = False) -> None:
         """
         Saves all contacts to a JSON file.
 
+        The file is replaced atomically, so a crash during the save keeps
+        the previous version intact. For a `.jsonl` file that was loaded
+        or saved before, only the changes since then are appended.
+
         Args:
-            file_name (str): Path to save the JSON file.
+            file_name (str): Path to save the JSON or JSON Lines file.
+            snapshot (bool): Also write the binary snapshot used by
+                open_snapshot. This rewrites the whole snapshot, so it is
+                off by default.
         
         Raises:
             FileError: If the file cannot be written to.
+            ContactError: If the phone book is opened read-only.
         """
+        if self._backend.read_only:
+            raise ContactError("The phone book is opened read-only.")
         try:
-            with open(file_name, 'w') as file:
+            if not file_name.endswith(JSON_LINES_EXTENSION):
                 # Serialize the contacts as dictionaries
-                json.dump([contact.__dict__ for contact in self.contacts], file, indent=4)
+                write_json_array(file_name, (contact.to_dict() for contact in self.iter_contacts()))
+            elif self._is_attached(file_name):
+                self._storage.append(self._changes)
+                self._changes.clear()
+            else:
+                storage = JsonLinesStorage(file_name)
+                storage.write(contact.to_dict() for contact in self.iter_contacts())
+                self._storage = storage
+                self._changes.clear()
+            if snapshot:
+                write_snapshot(snapshot_name(file_name), self.iter_contacts())
         except Exception as e:
             raise FileError(f"Failed to save to file '{file_name}': {e}")
 
+    def _is_attached(self, file_name: str) -> bool:
+        """
+        Checks whether the journal of unsaved changes applies to the given file.
+        """
+        return (self._storage is not None
+                and os.path.abspath(self._storage.file_name) == os.path.abspath(file_name)
+                and self._storage.exists())
+
+    def _log_change(self, record: dict[str, Any]) -> None:
+        """
+        Remembers a change to append to the attached storage on the next save.
+        """
+        if self._storage is not None:
+            self._changes.append(record)
+
     def add_contact(self, name: str, phone: str, comment: str) -> None:
         """
         Adds a new contact to the phone book.
@@ -63,19 +198,34 @@ class PhoneBook:
             phone (str): Phone number of the contact.
             comment (str): Additional notes about the contact.
         """
-        # Automatically assign a unique ID
-        contact_ids = [contact.id for contact in self.contacts]
-        max_contact_id = max(contact_ids, default=0) # If list is empty max_contact_id = 0
-        contact_id = max_contact_id + 1
+        new_contact = self._backend.add(name, phone, comment)
+        self._log_change({"op": "put", "contact": new_contact.to_dict()})
 
-        new_contact = Contact(contact_id, name, phone, comment)
+    def add_contacts(self, rows: Iterable[tuple[str, str, str]]) -> int:
+        """
+        Adds many contacts at once.
 
-        self.contacts.append(new_contact)
+        Much faster than calling add_contact in a loop, as the backend
+        can index or insert the rows in bulk.
+
+        Args:
+            rows (Iterable[tuple]): (name, phone, comment) of every new contact.
+
+        Returns:
+            int: Number of added contacts.
+        """
+        new_contacts = self._backend.add_many(rows)
+        if self._storage is not None:
+            self._changes.extend({"op": "put", "contact": contact.to_dict()} for contact in new_contacts)
+        return len(new_contacts)
 
     def find_contact(self, info: str) -> List[Contact]:
         """
         Searches for contacts that match the given information.
 
+        Name and comment are matched case-insensitively, phone numbers
+        are matched by digits only (so "+1 800 123" equals "1800123").
+
         Args:
             info (str): Search term (matches ID, name, phone, or comment).
         
@@ -85,8 +235,48 @@ class PhoneBook:
         Raises:
             ContactError: If no contacts match the search term.
         """
-        results = [contact for contact in self.contacts 
-                   if info in (str(contact.id), contact.name, contact.phone, contact.comment)]
+        results = self._backend.find(info)
+        if not results:
+            raise ContactError("No contacts found matching the given information.")
+        return results
+
+    def search_contacts(self, fragment: str) -> List[Contact]:
+        """
+        Searches for contacts whose name or comment contains the given fragment.
+
+        Args:
+            fragment (str): Part of a name or comment.
+
+        Returns:
+            list[Contact]: A list of matching contacts.
+
+        Raises:
+            ContactError: If no contacts match the fragment.
+        """
+        results = self._backend.search(fragment)
+        if not results:
+            raise ContactError("No contacts found matching the given information.")
+        return results
+
+    def fuzzy_find(self, query: str, limit: int = 5, max_distance: int = 2) -> List[Tuple[Contact, float]]:
+        """
+        Searches for contacts similar to the query, tolerating typos.
+
+        Names are compared case-insensitively with a bounded edit distance
+        and by how they sound (Soundex); phone numbers by digits only.
+
+        Args:
+            query (str): Name or phone number, possibly misspelled.
+            limit (int): Maximum number of results.
+            max_distance (int): Largest number of typos to tolerate.
+
+        Returns:
+            list[tuple[Contact, float]]: Contacts with scores from 0 to 1, best first.
+
+        Raises:
+            ContactError: If no contacts are similar to the query.
+        """
+        results = self._backend.fuzzy(query, limit, max_distance)
         if not results:
             raise ContactError("No contacts found matching the given information.")
         return results
@@ -108,14 +298,10 @@ class PhoneBook:
         Raises:
             ContactError: If the contact with the given ID is not found.
         """
-        for contact in self.contacts:
-            if contact.id == contact_id:
-                # Update only the fields provided
-                contact.name = name or contact.name
-                contact.phone = phone or contact.phone
-                contact.comment = comment or contact.comment
-                return
-        raise ContactError(f"Contact with ID {contact_id} not found.")
+        contact = self._backend.update(contact_id, name, phone, comment)
+        if contact is None:
+            raise ContactError(f"Contact with ID {contact_id} not found.")
+        self._log_change({"op": "put", "contact": contact.to_dict()})
 
     def delete_contact(self, contact_id: int) -> None:
         """
@@ -127,8 +313,6 @@ class PhoneBook:
         Raises:
             ContactError: If the contact with the given ID is not found.
         """
-        for contact in self.contacts:
-            if contact.id == contact_id:
-                self.contacts.remove(contact)
-                return
-        raise ContactError(f"Contact with ID {contact_id} not found.")
\ No newline at end of file
+        if not self._backend.delete(contact_id):
+            raise ContactError(f"Contact with ID {contact_id} not found.")
+        self._log_change({"op": "delete", "id": contact_id})
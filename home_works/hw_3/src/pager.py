@@ -0,0 +1,173 @@
+from array import array
+from collections.abc import Sequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.search_index import normalize_phone, normalize_text
+
+
+PAGE_SIZE = 20
+
+# Sort key of every field; text is compared the same way find_contact matches it
+SORT_KEYS: Dict[str, Callable[[Any], Any]] = {
+    "id": lambda contact: contact.id,
+    "name": lambda contact: normalize_text(contact.name),
+    "phone": lambda contact: normalize_phone(contact.phone),
+    "comment": lambda contact: normalize_text(contact.comment),
+}
+
+
+class ContactPager:
+    """
+    Splits contacts into pages without copying them.
+
+    A sequence (such as the list of an in-memory book) is sliced one page
+    at a time. Any other iterable is pulled lazily: only the contacts up to
+    the requested page are read, and they are kept so that earlier pages
+    can be shown again.
+
+    Sorting does not reorder the contacts either: the key of each contact
+    is computed once per field, and the resulting order of positions is
+    stored in an array and reused (backwards for descending order).
+    """
+
+    def __init__(self, contacts: Iterable[Any], page_size: int = PAGE_SIZE, total: Optional[int] = None) -> None:
+        """
+        Initializes a pager positioned on the first page.
+
+        Args:
+            contacts (Iterable): Contacts to page through.
+            page_size (int): Number of contacts per page.
+            total (int, optional): Number of contacts, if `contacts` is not a sequence.
+
+        Raises:
+            ValueError: If page_size is not positive.
+        """
+        if page_size < 1:
+            raise ValueError("Page size must be positive.")
+        self.page_size = page_size
+        self.page = 0
+        if isinstance(contacts, Sequence):
+            self._contacts: Sequence[Any] = contacts
+            self._iterator = None
+            total = len(contacts)
+        else:
+            # Contacts pulled from the iterator so far
+            self._contacts = []
+            self._iterator = iter(contacts)
+        self._total = total
+        self._orders: Dict[str, array] = {}
+        self._sort: Optional[Tuple[str, bool]] = None
+
+    @property
+    def page_count(self) -> Optional[int]:
+        """
+        Returns the number of pages, or None if it is not known yet.
+        """
+        if self._total is None:
+            return None
+        return max(1, -(-self._total // self.page_size))
+
+    @property
+    def sort(self) -> Optional[Tuple[str, bool]]:
+        """
+        Returns the (field, reverse) pair of the current order, or None.
+        """
+        return self._sort
+
+    def current(self) -> List[Any]:
+        """
+        Returns the contacts of the current page.
+        """
+        return self._page(self.page)
+
+    def has_next(self) -> bool:
+        """
+        Checks whether there is a page after the current one.
+        """
+        return bool(self._page(self.page + 1))
+
+    def next_page(self) -> List[Any]:
+        """
+        Moves to the next page, staying on the last one.
+        """
+        if self.has_next():
+            self.page += 1
+        return self.current()
+
+    def prev_page(self) -> List[Any]:
+        """
+        Moves to the previous page, staying on the first one.
+        """
+        self.page = max(0, self.page - 1)
+        return self.current()
+
+    def jump(self, page: int) -> List[Any]:
+        """
+        Moves to the given page.
+
+        Args:
+            page (int): Page number, starting from 0.
+
+        Raises:
+            ValueError: If the page does not exist.
+        """
+        if page < 0 or (page > 0 and not self._page(page)):
+            raise ValueError(f"Page {page + 1} does not exist.")
+        self.page = page
+        return self.current()
+
+    def sort_by(self, field: str, reverse: bool = False) -> List[Any]:
+        """
+        Orders the contacts by a field and moves to the first page.
+
+        Sorting needs every contact, so an iterator is read to the end.
+
+        Args:
+            field (str): One of "id", "name", "phone" or "comment".
+            reverse (bool): Sort in descending order.
+
+        Raises:
+            ValueError: If the field is unknown.
+        """
+        if field not in SORT_KEYS:
+            raise ValueError(f"Cannot sort by '{field}'. Choose one of: {', '.join(SORT_KEYS)}.")
+        if self._iterator is not None:
+            self._contacts.extend(self._iterator)
+            self._iterator = None
+            self._total = len(self._contacts)
+        if field not in self._orders:
+            key = SORT_KEYS[field]
+            keys = [key(contact) for contact in self._contacts]
+            self._orders[field] = array('q', sorted(range(len(keys)), key=keys.__getitem__))
+        self._sort = (field, reverse)
+        self.page = 0
+        return self.current()
+
+    def _page(self, page: int) -> List[Any]:
+        start = page * self.page_size
+        end = start + self.page_size
+        if self._sort is None:
+            self._pull(end)
+            return list(self._contacts[start:end])
+        field, reverse = self._sort
+        order = self._orders[field]
+        if reverse:
+            last = len(order) - 1
+            positions = [order[last - i] for i in range(start, min(end, len(order)))]
+        else:
+            positions = order[start:end]
+        return [self._contacts[position] for position in positions]
+
+    def _pull(self, count: int) -> None:
+        """
+        Reads contacts from the iterator until `count` are available.
+        """
+        if self._iterator is None:
+            return
+        while len(self._contacts) < count:
+            contact = next(self._iterator, None)
+            if contact is None:
+                self._iterator = None
+                self._total = len(self._contacts)
+                return
+            self._contacts.append(contact)
@@ -0,0 +1,384 @@
+import gc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterable, Iterator, List
+
+from src.model_contact import Contact
+
+
+NGRAM_SIZE = 3
+
+# Upper bound of n-gram candidates checked by a fuzzy search
+FUZZY_CANDIDATES = 200
+
+# Posting lists longer than this are only used to score candidates found
+# through rarer n-grams, never to collect candidates themselves
+FUZZY_POSTING_LIMIT = 10_000
+
+
+def normalize_text(value: str) -> str:
+    """
+    Normalizes a text field for case-insensitive matching.
+
+    Args:
+        value (str): Raw text (name or comment).
+
+    Returns:
+        str: Case-folded text with collapsed whitespace.
+    """
+    return " ".join(value.casefold().split())
+
+
+def normalize_phone(value: str) -> str:
+    """
+    Normalizes a phone number by keeping only its digits.
+
+    Args:
+        value (str): Raw phone number, e.g. "+1 800 123-45-67".
+
+    Returns:
+        str: Digits of the phone number, e.g. "18001234567".
+    """
+    return "".join(filter(str.isdigit, value))
+
+
+_PHONE_SEPARATORS = set("+-() ")
+
+
+def looks_like_phone(value: str) -> bool:
+    """
+    Tells whether a query is a phone number: digits with only "+-()" and spaces between them.
+
+    Args:
+        value (str): Search query.
+
+    Returns:
+        bool: True if the query has digits and no other characters.
+    """
+    return any(char.isdigit() for char in value) and all(
+        char.isdigit() or char in _PHONE_SEPARATORS for char in value)
+
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+# Names repeat a lot, so bulk indexing mostly hits the cache
+@lru_cache(maxsize=65536)
+def soundex(word: str) -> str:
+    """
+    Returns the Soundex code of a word, e.g. "Robert" -> "R163".
+
+    Letters outside the Latin alphabet are ignored.
+
+    Args:
+        word (str): A single word.
+
+    Returns:
+        str: Four-character code, or "" if the word has no Latin letters.
+    """
+    letters = [char for char in word.casefold() if "a" <= char <= "z"]
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        digit = _SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        # "h" and "w" do not separate letters with the same code
+        if char not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Disables the cyclic garbage collector for the duration of a bulk build.
+
+    Building millions of sets and objects triggers repeated full collections
+    that find nothing to free, since these structures have no cycles.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def make_ngrams(value: str) -> set[str]:
+    """
+    Splits normalized text into overlapping n-grams.
+
+    Args:
+        value (str): Normalized text.
+
+    Returns:
+        set[str]: All substrings of length NGRAM_SIZE.
+    """
+    return {value[i:i + NGRAM_SIZE] for i in range(len(value) - NGRAM_SIZE + 1)}
+
+
+class ContactIndex:
+    """
+    In-memory search engine maintained alongside the phone book contacts.
+
+    Keeps hash indexes for exact lookups by id, name, phone and comment,
+    an n-gram index for partial name and comment matches and a phonetic
+    (Soundex) index of name words for fuzzy matches.
+
+    Contacts added in bulk are only put into `by_id`; the other indexes
+    are built for them in one pass when a query first needs them.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes empty indexes.
+        """
+        self.by_id: dict[int, Contact] = {}
+        self.by_name: defaultdict[str, set[int]] = defaultdict(set)
+        self.by_phone: defaultdict[str, set[int]] = defaultdict(set)
+        self.by_comment: defaultdict[str, set[int]] = defaultdict(set)
+        self.ngrams: defaultdict[str, set[int]] = defaultdict(set)
+        # Soundex codes of every word of the name
+        self.phonetic: defaultdict[str, set[int]] = defaultdict(set)
+        # Contacts added in bulk whose hash and phonetic keys are built on the first lookup
+        self._pending_keys: list[Contact] = []
+        # Contacts added in bulk whose n-grams are built on the first partial search
+        self._pending: list[Contact] = []
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def clear(self) -> None:
+        """
+        Removes all contacts from the indexes.
+        """
+        for index in (self.by_id, self.by_name, self.by_phone, self.by_comment, self.ngrams, self.phonetic):
+            index.clear()
+        self._pending_keys.clear()
+        self._pending.clear()
+
+    def rebuild(self, contacts: Iterable[Contact]) -> None:
+        """
+        Drops all indexes and builds them from scratch.
+
+        Args:
+            contacts (Iterable[Contact]): Contacts to index.
+        """
+        self.clear()
+        self.add_many(contacts)
+
+    def add(self, contact: Contact) -> None:
+        """
+        Adds a contact to all indexes.
+
+        Args:
+            contact (Contact): Contact to index.
+        """
+        self.by_id[contact.id] = contact
+        for index, key in self._keys(contact):
+            index[key].add(contact.id)
+        for gram in self._contact_ngrams(contact):
+            self.ngrams[gram].add(contact.id)
+
+    def add_many(self, contacts: Iterable[Contact]) -> None:
+        """
+        Adds contacts by id right away and defers the other indexes:
+        the hash and phonetic keys until the next lookup, the n-grams
+        until the next partial search.
+
+        Args:
+            contacts (Iterable[Contact]): Contacts to index.
+        """
+        contacts = list(contacts)
+        with paused_gc():
+            self.by_id.update({contact.id: contact for contact in contacts})
+            self._pending_keys.extend(contacts)
+            self._pending.extend(contacts)
+
+    def remove(self, contact: Contact) -> None:
+        """
+        Removes a contact from all indexes.
+
+        Must be called before the contact fields are changed,
+        so that the old keys can be found.
+
+        Args:
+            contact (Contact): Contact to remove.
+        """
+        self.by_id.pop(contact.id, None)
+        for index, key in self._keys(contact):
+            self._discard(index, key, contact.id)
+        for gram in self._contact_ngrams(contact):
+            self._discard(self.ngrams, gram, contact.id)
+
+    def lookup(self, info: str) -> List[Contact]:
+        """
+        Finds contacts whose id, name, phone or comment equals the search term.
+
+        Name and comment are compared case-insensitively; phone numbers
+        are compared by digits only, and only for queries that look like
+        a phone number.
+
+        Args:
+            info (str): Search term.
+
+        Returns:
+            list[Contact]: Matching contacts ordered by id.
+        """
+        self._flush_pending_keys()
+        ids: set[int] = set()
+        if info.strip().isdecimal() and int(info) in self.by_id:
+            ids.add(int(info))
+        text = normalize_text(info)
+        ids |= self.by_name.get(text, set())
+        ids |= self.by_comment.get(text, set())
+        if looks_like_phone(info):
+            ids |= self.by_phone.get(normalize_phone(info), set())
+        return self._contacts(ids)
+
+    def search(self, fragment: str) -> List[Contact]:
+        """
+        Finds contacts whose name or comment contains the given fragment.
+
+        Fragments of NGRAM_SIZE characters and longer are resolved through
+        the n-gram index; shorter ones match too many contacts for an index
+        to help, so they are checked against every contact.
+
+        Args:
+            fragment (str): Part of a name or comment.
+
+        Returns:
+            list[Contact]: Matching contacts ordered by id.
+        """
+        self._flush_pending()
+        text = normalize_text(fragment)
+        if not text:
+            return []
+        if len(text) < NGRAM_SIZE:
+            candidates: Iterable[int] = self.by_id
+        else:
+            postings = sorted((self.ngrams.get(gram, set()) for gram in make_ngrams(text)), key=len)
+            candidates = set.intersection(*postings)
+        ids = [contact_id for contact_id in candidates
+               if text in normalize_text(self.by_id[contact_id].name)
+               or text in normalize_text(self.by_id[contact_id].comment)]
+        return self._contacts(ids)
+
+    def fuzzy_candidates(self, query: str, max_distance: int) -> List[Contact]:
+        """
+        Selects contacts that may be within a small edit distance of the query.
+
+        Contacts with equal phone digits are always candidates. Others are
+        ranked by the number of n-grams they share with the query, with a
+        bonus for names whose words sound like all query words, and at most
+        FUZZY_CANDIDATES of them are returned. Two strings within edit
+        distance k share at least len(grams) - k * NGRAM_SIZE n-grams, so
+        contacts sharing fewer (and not sounding alike) are skipped.
+
+        Such a contact holds at least one of the len(grams) - min_shared + 1
+        rarest query n-grams, so only those posting lists are scanned for
+        candidates, rarest first. Lists longer than FUZZY_POSTING_LIMIT,
+        except the rarest one, are skipped, so a match sharing only very
+        common n-grams is found just through its phonetic code.
+
+        Args:
+            query (str): Raw search query.
+            max_distance (int): Largest edit distance of interest.
+
+        Returns:
+            list[Contact]: Candidate contacts ordered by id.
+        """
+        self._flush_pending_keys()
+        self._flush_pending()
+        ids: set[int] = set()
+        if looks_like_phone(query):
+            ids |= self.by_phone.get(normalize_phone(query), set())
+
+        text = normalize_text(query)
+        postings = sorted((self.ngrams.get(gram, set()) for gram in make_ngrams(text)), key=len)
+        codes = {soundex(word) for word in text.split()} - {""}
+        sounding = set.intersection(*(self.phonetic.get(code, set()) for code in codes)) if codes else set()
+
+        min_shared = max(1, len(postings) - max_distance * NGRAM_SIZE)
+        candidates = set(sounding)
+        for position, posting in enumerate(postings[:len(postings) - min_shared + 1]):
+            if position and len(posting) > FUZZY_POSTING_LIMIT:
+                break
+            candidates |= posting
+        counts: Counter[int] = Counter()
+        for posting in postings:
+            counts.update(posting & candidates)
+        for contact_id in sounding:
+            counts[contact_id] += NGRAM_SIZE
+
+        for contact_id, shared in counts.most_common(FUZZY_CANDIDATES):
+            if shared >= min_shared or contact_id in sounding:
+                ids.add(contact_id)
+        return self._contacts(ids)
+
+    def _flush_pending_keys(self) -> None:
+        if not self._pending_keys:
+            return
+        by_id = self.by_id
+        with paused_gc():
+            for contact in self._pending_keys:
+                # Skip contacts deleted or replaced while waiting
+                if by_id.get(contact.id) is contact:
+                    contact_id = contact.id
+                    for index, key in self._keys(contact):
+                        index[key].add(contact_id)
+        self._pending_keys.clear()
+
+    def _flush_pending(self) -> None:
+        by_id, ngrams = self.by_id, self.ngrams
+        with paused_gc():
+            for contact in self._pending:
+                # Skip contacts deleted or replaced while waiting
+                if by_id.get(contact.id) is contact:
+                    contact_id = contact.id
+                    for gram in self._contact_ngrams(contact):
+                        ngrams[gram].add(contact_id)
+        self._pending.clear()
+
+    def _contacts(self, ids: Iterable[int]) -> List[Contact]:
+        return [self.by_id[contact_id] for contact_id in sorted(ids)]
+
+    def _keys(self, contact: Contact) -> list[tuple[defaultdict[str, set[int]], str]]:
+        keys = [
+            (self.by_name, normalize_text(contact.name)),
+            (self.by_comment, normalize_text(contact.comment)),
+        ]
+        phone = normalize_phone(contact.phone)
+        if phone:
+            keys.append((self.by_phone, phone))
+        for code in {soundex(word) for word in contact.name.split()} - {""}:
+            keys.append((self.phonetic, code))
+        return keys
+
+    @staticmethod
+    def _contact_ngrams(contact: Contact) -> set[str]:
+        return make_ngrams(normalize_text(contact.name)) | make_ngrams(normalize_text(contact.comment))
+
+    @staticmethod
+    def _discard(index: defaultdict[str, set[int]], key: str, contact_id: int) -> None:
+        ids = index.get(key)
+        if ids is None:
+            return
+        ids.discard(contact_id)
+        # Drop empty buckets so the index does not grow with stale keys
+        if not ids:
+            del index[key]
@@ -0,0 +1,329 @@
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Sequence
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from src.backend import ContactBackend
+from src.exceptions import ContactError, FileError
+from src.fuzzy import rank
+from src.model_contact import Contact
+from src.search_index import FUZZY_CANDIDATES, looks_like_phone, make_ngrams, normalize_phone, normalize_text
+
+
+SNAPSHOT_SUFFIX = ".snapshot"
+MAGIC = b"PBSNAP01"
+
+# Header: magic, number of records, offsets of the record table and of the
+# row orders by id, normalized name, phone digits and normalized comment
+HEADER = struct.Struct("<8s6Q")
+# Record: id, then (offset, length) of name, phone, comment,
+# normalized name, phone digits and normalized comment in the string heap
+RECORD = struct.Struct("<q" + "QI" * 6)
+ID, NAME, PHONE, COMMENT, NAME_NORM, PHONE_DIGITS, COMMENT_NORM = range(7)
+# Normalized names and comments are written back to back, each followed by
+# this separator, so a substring search can run over the raw bytes
+SEPARATOR = b"\n"
+
+
+def snapshot_name(file_name: str) -> str:
+    """
+    Returns the path of the snapshot produced for a contacts file.
+    """
+    return file_name + SNAPSHOT_SUFFIX
+
+
+def write_snapshot(file_name: str, contacts: Iterable[Any]) -> None:
+    """
+    Writes contacts into the binary snapshot format.
+
+    Layout: header | string heap | record table | row orders. The record
+    table has fixed-width records in insertion order; each row order is an
+    array('I') of row numbers sorted by a key, used for binary search.
+
+    Args:
+        file_name (str): Path of the snapshot file.
+        contacts (Iterable): Objects with id, name, phone and comment, consumed lazily.
+    """
+    records = bytearray()
+    ids = array('q')
+    keys: list[list[bytes]] = [[], [], []]
+    tmp_name = f"{file_name}.tmp"
+    try:
+        with open(tmp_name, 'wb') as file:
+            file.write(b"\0" * HEADER.size)
+
+            def store(data: bytes, suffix: bytes = b"") -> tuple[int, int]:
+                offset = file.tell()
+                file.write(data + suffix)
+                return offset, len(data)
+
+            for contact in contacts:
+                name_norm = normalize_text(contact.name).encode()
+                comment_norm = normalize_text(contact.comment).encode()
+                phone_digits = normalize_phone(contact.phone).encode()
+                name = store(contact.name.encode())
+                phone = store(contact.phone.encode())
+                comment = store(contact.comment.encode())
+                # The searchable text of a row is written as one block
+                name_norm_ref = store(name_norm, SEPARATOR)
+                comment_norm_ref = store(comment_norm, SEPARATOR)
+                phone_digits_ref = store(phone_digits)
+                records += RECORD.pack(contact.id, *name, *phone, *comment,
+                                       *name_norm_ref, *phone_digits_ref, *comment_norm_ref)
+                ids.append(contact.id)
+                for column, key in zip(keys, (name_norm, phone_digits, comment_norm)):
+                    column.append(key)
+
+            records_offset = file.tell()
+            file.write(records)
+            orders = [sorted(range(len(ids)), key=ids.__getitem__)]
+            orders += [sorted(range(len(column)), key=column.__getitem__) for column in keys]
+            order_offsets = []
+            for order in orders:
+                order_offsets.append(file.tell())
+                file.write(array('I', order).tobytes())
+
+            file.seek(0)
+            file.write(HEADER.pack(MAGIC, len(ids), records_offset, *order_offsets))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_name, file_name)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+
+class SnapshotRecord:
+    """
+    Lightweight read-only view of one snapshot record with the Contact API.
+    """
+
+    __slots__ = ("_backend", "_row")
+
+    def __init__(self, backend: "SnapshotBackend", row: int) -> None:
+        self._backend = backend
+        self._row = row
+
+    @property
+    def id(self) -> int:
+        return self._backend._record(self._row)[0]
+
+    @property
+    def name(self) -> str:
+        return self._backend._field(self._row, NAME).decode()
+
+    @property
+    def phone(self) -> str:
+        return self._backend._field(self._row, PHONE).decode()
+
+    @property
+    def comment(self) -> str:
+        return self._backend._field(self._row, COMMENT).decode()
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, SnapshotRecord)
+                and other._backend is self._backend and other._row == self._row)
+
+    def __hash__(self) -> int:
+        return hash(self._row)
+
+    __str__ = Contact.__str__
+    to_dict = Contact.to_dict
+
+
+class SnapshotContacts(Sequence):
+    """
+    Random-access view of all snapshot records in insertion order.
+    """
+
+    __slots__ = ("_backend",)
+
+    def __init__(self, backend: "SnapshotBackend") -> None:
+        self._backend = backend
+
+    def __len__(self) -> int:
+        return len(self._backend)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [SnapshotRecord(self._backend, row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("snapshot record index out of range")
+        return SnapshotRecord(self._backend, index)
+
+
+class SnapshotBackend(ContactBackend):
+    """
+    Read-only contact store over a memory-mapped snapshot.
+
+    Opening costs the same for any file size: nothing is parsed up front,
+    and records are read from the mapping only when a query touches them.
+    Lookups by id, name, phone and comment use binary search over the row
+    orders; partial search scans the normalized text with mmap.find.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        """
+        Maps the snapshot file into memory.
+
+        Args:
+            file_name (str): Path of the snapshot file.
+
+        Raises:
+            FileError: If the file is missing, is not a snapshot or is truncated.
+        """
+        if not os.path.exists(file_name):
+            raise FileError(f"File '{file_name}' not found.")
+        with open(file_name, 'rb') as file:
+            # An empty file cannot be mapped at all
+            if os.fstat(file.fileno()).st_size < HEADER.size:
+                raise FileError(f"File '{file_name}' is not a phone book snapshot.")
+            self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, self._records_offset, *order_offsets = HEADER.unpack_from(self._mm)
+        if magic != MAGIC:
+            self._mm.close()
+            raise FileError(f"File '{file_name}' is not a phone book snapshot.")
+        size = self._count * 4
+        # A truncated file would fail on the first query far from the cause
+        tables = [(self._records_offset, self._count * RECORD.size)] + [(offset, size) for offset in order_offsets]
+        if any(offset < HEADER.size or offset + length > len(self._mm) for offset, length in tables):
+            self._mm.close()
+            raise FileError(f"File '{file_name}' is a truncated phone book snapshot.")
+        self._view = memoryview(self._mm)
+        self._orders = [self._view[offset:offset + size].cast('I') for offset in order_offsets]
+        self._text_start = HEADER.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def read_only(self) -> bool:
+        return True
+
+    @property
+    def contacts(self) -> SnapshotContacts:
+        return SnapshotContacts(self)
+
+    def iter_contacts(self) -> Iterator[SnapshotRecord]:
+        for row in range(self._count):
+            yield SnapshotRecord(self, row)
+
+    def contact_sequence(self) -> SnapshotContacts:
+        return SnapshotContacts(self)
+
+    def get(self, contact_id: int) -> Optional[SnapshotRecord]:
+        rows = self._equal_rows(ID, contact_id)
+        return SnapshotRecord(self, rows[0]) if rows else None
+
+    def find(self, info: str) -> List[SnapshotRecord]:
+        rows: set[int] = set()
+        if info.strip().isdecimal():
+            rows.update(self._equal_rows(ID, int(info)))
+        text = normalize_text(info).encode()
+        rows.update(self._equal_rows(NAME_NORM, text))
+        rows.update(self._equal_rows(COMMENT_NORM, text))
+        if looks_like_phone(info):
+            rows.update(self._equal_rows(PHONE_DIGITS, normalize_phone(info).encode()))
+        return self._sorted_by_id(rows)
+
+    def search(self, fragment: str) -> List[SnapshotRecord]:
+        text = normalize_text(fragment).encode()
+        if not text:
+            return []
+        return self._sorted_by_id(self._text_rows(text))
+
+    def fuzzy(self, query: str, limit: int, max_distance: int) -> List[Tuple[SnapshotRecord, float]]:
+        """
+        Ranks records whose normalized text contains the most query trigrams.
+
+        There is no n-gram index in the snapshot, so each trigram is located
+        with mmap.find, stopping after FUZZY_CANDIDATES hits per trigram.
+        """
+        counts: Counter[int] = Counter()
+        for gram in make_ngrams(normalize_text(query)):
+            counts.update(self._text_rows(gram.encode(), FUZZY_CANDIDATES))
+        rows = {row for row, _ in counts.most_common(FUZZY_CANDIDATES)}
+        phone = normalize_phone(query).encode()
+        if phone:
+            rows.update(self._equal_rows(PHONE_DIGITS, phone))
+        return rank(query, (SnapshotRecord(self, row) for row in rows), limit, max_distance)
+
+    def replace(self, contacts: Iterable[Contact]) -> None:
+        self._read_only()
+
+    def add(self, name: str, phone: str, comment: str) -> Contact:
+        self._read_only()
+
+    def add_many(self, rows: Iterable[tuple[str, str, str]]) -> List[Contact]:
+        self._read_only()
+
+    def update(self,
+               contact_id: int,
+               name: Optional[str] = None,
+               phone: Optional[str] = None,
+               comment: Optional[str] = None) -> Optional[Contact]:
+        self._read_only()
+
+    def delete(self, contact_id: int) -> bool:
+        self._read_only()
+
+    def close(self) -> None:
+        for order in self._orders:
+            order.release()
+        self._view.release()
+        self._mm.close()
+
+    @staticmethod
+    def _read_only() -> None:
+        raise ContactError("The phone book is opened read-only.")
+
+    def _record(self, row: int) -> tuple[int, ...]:
+        return RECORD.unpack_from(self._mm, self._records_offset + row * RECORD.size)
+
+    def _field(self, row: int, field: int) -> bytes:
+        record = self._record(row)
+        offset, length = record[2 * field - 1], record[2 * field]
+        return self._mm[offset:offset + length]
+
+    def _key(self, field: int) -> Any:
+        if field == ID:
+            return lambda row: self._record(row)[0]
+        return lambda row: self._field(row, field)
+
+    def _equal_rows(self, field: int, value: Any) -> Iterable[int]:
+        order = self._orders[(ID, NAME_NORM, PHONE_DIGITS, COMMENT_NORM).index(field)]
+        key = self._key(field)
+        start = bisect_left(order, value, key=key)
+        end = bisect_right(order, value, lo=start, key=key)
+        return order[start:end].tolist()
+
+    def _text_rows(self, needle: bytes, limit: Optional[int] = None) -> set[int]:
+        """
+        Finds rows whose normalized name or comment contains `needle`.
+        """
+        rows: set[int] = set()
+        if not self._count:
+            return rows
+        # Normalized text of a row starts at its NAME_NORM offset; rows are in file order
+        text_key = lambda row: self._record(row)[2 * NAME_NORM - 1]
+        rows_range = range(self._count)
+        position = self._mm.find(needle, self._text_start, self._records_offset)
+        while position != -1 and (limit is None or len(rows) < limit):
+            # Hits in raw fields and phone digits fall outside the text block
+            row = bisect_right(rows_range, position, key=text_key) - 1
+            if row >= 0:
+                record = self._record(row)
+                text_end = record[2 * COMMENT_NORM - 1] + record[2 * COMMENT_NORM]
+                if position + len(needle) <= text_end:
+                    rows.add(row)
+            position = self._mm.find(needle, position + 1, self._records_offset)
+        return rows
+
+    def _sorted_by_id(self, rows: Iterable[int]) -> List[SnapshotRecord]:
+        return [SnapshotRecord(self, row) for row in sorted(rows, key=lambda row: self._record(row)[0])]
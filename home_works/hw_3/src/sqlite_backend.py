@@ -0,0 +1,223 @@
+import sqlite3
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from src.backend import ContactBackend
+from src.exceptions import FileError
+from src.fuzzy import rank
+from src.model_contact import Contact
+from src.search_index import (FUZZY_CANDIDATES, NGRAM_SIZE, looks_like_phone, make_ngrams, normalize_phone,
+                              normalize_text)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    comment TEXT NOT NULL,
+    -- Normalized copies used for lookups (see src.search_index)
+    name_norm TEXT NOT NULL,
+    phone_digits TEXT NOT NULL,
+    comment_norm TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_contacts_name_norm ON contacts (name_norm);
+CREATE INDEX IF NOT EXISTS ix_contacts_phone_digits ON contacts (phone_digits);
+CREATE INDEX IF NOT EXISTS ix_contacts_comment_norm ON contacts (comment_norm);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5 (
+    name_norm, phone_digits, comment_norm,
+    content = 'contacts', content_rowid = 'id', tokenize = 'trigram'
+);
+CREATE TRIGGER IF NOT EXISTS contacts_ai AFTER INSERT ON contacts BEGIN
+    INSERT INTO contacts_fts (rowid, name_norm, phone_digits, comment_norm)
+    VALUES (new.id, new.name_norm, new.phone_digits, new.comment_norm);
+END;
+CREATE TRIGGER IF NOT EXISTS contacts_ad AFTER DELETE ON contacts BEGIN
+    INSERT INTO contacts_fts (contacts_fts, rowid, name_norm, phone_digits, comment_norm)
+    VALUES ('delete', old.id, old.name_norm, old.phone_digits, old.comment_norm);
+END;
+CREATE TRIGGER IF NOT EXISTS contacts_au AFTER UPDATE ON contacts BEGIN
+    INSERT INTO contacts_fts (contacts_fts, rowid, name_norm, phone_digits, comment_norm)
+    VALUES ('delete', old.id, old.name_norm, old.phone_digits, old.comment_norm);
+    INSERT INTO contacts_fts (rowid, name_norm, phone_digits, comment_norm)
+    VALUES (new.id, new.name_norm, new.phone_digits, new.comment_norm);
+END;
+"""
+
+COLUMNS = "id, name, phone, comment"
+# SQLite INTEGER is a signed 64-bit value
+MIN_INTEGER, MAX_INTEGER = -2 ** 63, 2 ** 63 - 1
+
+INSERT = """
+INSERT INTO contacts (id, name, phone, comment, name_norm, phone_digits, comment_norm)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _row(contact_id: int, name: str, phone: str, comment: str) -> tuple[Any, ...]:
+    return (contact_id, name, phone, comment,
+            normalize_text(name), normalize_phone(phone), normalize_text(comment))
+
+
+class SQLiteBackend(ContactBackend):
+    """
+    Stores contacts in a SQLite database.
+
+    Only the rows a query returns are loaded into memory. Exact lookups use
+    B-tree indexes on normalized columns, partial search uses an FTS5
+    trigram index on name, phone and comment. The database runs in WAL
+    mode, so every change is durable without rewriting any file.
+    """
+
+    def __init__(self, database: str) -> None:
+        """
+        Opens (and creates if needed) the database.
+
+        Args:
+            database (str): Path to the database file or ":memory:".
+
+        Raises:
+            FileError: If the database cannot be opened.
+        """
+        try:
+            self._connection = sqlite3.connect(database)
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+            self._connection.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            raise FileError(f"Failed to open database '{database}': {e}")
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT count(*) FROM contacts").fetchone()[0]
+
+    def iter_contacts(self) -> Iterator[Contact]:
+        for row in self._connection.execute(f"SELECT {COLUMNS} FROM contacts ORDER BY id"):
+            yield Contact(*row)
+
+    def replace(self, contacts: Iterable[Contact]) -> None:
+        with self._connection:
+            self._connection.execute("DELETE FROM contacts")
+            self._connection.executemany(
+                INSERT, (_row(contact.id, contact.name, contact.phone, contact.comment) for contact in contacts))
+
+    def add(self, name: str, phone: str, comment: str) -> Contact:
+        return self.add_many([(name, phone, comment)])[0]
+
+    def add_many(self, rows: Iterable[tuple[str, str, str]]) -> List[Contact]:
+        new_contacts: List[Contact] = []
+
+        def insert_rows(first_id: int) -> Iterator[tuple[Any, ...]]:
+            for contact_id, (name, phone, comment) in enumerate(rows, start=first_id):
+                new_contacts.append(Contact(contact_id, name, phone, comment))
+                yield _row(contact_id, name, phone, comment)
+
+        with self._connection:
+            # AUTOINCREMENT keeps ids of deleted contacts from being reused
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._connection.executemany(INSERT, insert_rows(self._next_id()))
+        return new_contacts
+
+    def get(self, contact_id: int) -> Optional[Contact]:
+        row = self._connection.execute(f"SELECT {COLUMNS} FROM contacts WHERE id = ?", (contact_id,)).fetchone()
+        return Contact(*row) if row else None
+
+    def find(self, info: str) -> List[Contact]:
+        text = normalize_text(info)
+        # The empty string never matches: the query below skips empty phone_digits
+        phone = normalize_phone(info) if looks_like_phone(info) else ""
+        contact_id = int(info) if info.strip().isdecimal() else None
+        if contact_id is not None and not MIN_INTEGER <= contact_id <= MAX_INTEGER:
+            # No contact can have this id, and SQLite cannot bind it
+            contact_id = None
+        return self._query(
+            f"""
+            SELECT {COLUMNS} FROM contacts WHERE id = ?
+            UNION SELECT {COLUMNS} FROM contacts WHERE name_norm = ?
+            UNION SELECT {COLUMNS} FROM contacts WHERE comment_norm = ?
+            UNION SELECT {COLUMNS} FROM contacts WHERE phone_digits = ? AND phone_digits != ''
+            ORDER BY id
+            """,
+            (contact_id, text, text, phone),
+        )
+
+    def search(self, fragment: str) -> List[Contact]:
+        text = normalize_text(fragment)
+        if not text:
+            return []
+        if len(text) < NGRAM_SIZE:
+            # The trigram index cannot match shorter fragments
+            return self._query(
+                f"SELECT {COLUMNS} FROM contacts "
+                "WHERE instr(name_norm, ?) > 0 OR instr(comment_norm, ?) > 0 ORDER BY id",
+                (text, text),
+            )
+        phrase = '"' + text.replace('"', '""') + '"'
+        return self._query(
+            f"SELECT {COLUMNS} FROM contacts WHERE id IN "
+            "(SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH ?) ORDER BY id",
+            (f"{{name_norm comment_norm}}: {phrase}",),
+        )
+
+    def fuzzy(self, query: str, limit: int, max_distance: int) -> List[Tuple[Contact, float]]:
+        """
+        Ranks contacts sharing the most name trigrams with the query.
+
+        Unlike MemoryBackend there is no phonetic index: candidates come from
+        the FTS5 trigram index (best bm25 rank first) and equal phone digits.
+        """
+        candidates = {}
+        phone = normalize_phone(query)
+        if phone:
+            for contact in self._query(f"SELECT {COLUMNS} FROM contacts WHERE phone_digits = ?", (phone,)):
+                candidates[contact.id] = contact
+        grams = make_ngrams(normalize_text(query))
+        if grams:
+            match = " OR ".join('"' + gram.replace('"', '""') + '"' for gram in grams)
+            for contact in self._query(
+                    f"SELECT {COLUMNS} FROM contacts WHERE id IN "
+                    "(SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH ? ORDER BY rank LIMIT ?)",
+                    (f"{{name_norm}}: ({match})", FUZZY_CANDIDATES)):
+                candidates[contact.id] = contact
+        return rank(query, candidates.values(), limit, max_distance)
+
+    def update(self,
+               contact_id: int,
+               name: Optional[str] = None,
+               phone: Optional[str] = None,
+               comment: Optional[str] = None) -> Optional[Contact]:
+        with self._connection:
+            contact = self.get(contact_id)
+            if contact is None:
+                return None
+            # Update only the fields provided
+            contact.name = name or contact.name
+            contact.phone = phone or contact.phone
+            contact.comment = comment or contact.comment
+            _, *values = _row(contact.id, contact.name, contact.phone, contact.comment)
+            self._connection.execute(
+                """
+                UPDATE contacts
+                SET name = ?, phone = ?, comment = ?, name_norm = ?, phone_digits = ?, comment_norm = ?
+                WHERE id = ?
+                """,
+                (*values, contact_id),
+            )
+        return contact
+
+    def delete(self, contact_id: int) -> bool:
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
+        return cursor.rowcount > 0
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _next_id(self) -> int:
+        row = self._connection.execute(
+            "SELECT max(coalesce((SELECT seq FROM sqlite_sequence WHERE name = 'contacts'), 0),"
+            " coalesce((SELECT max(id) FROM contacts), 0))"
+        ).fetchone()
+        return row[0] + 1
+
+    def _query(self, sql: str, parameters: tuple[Any, ...]) -> List[Contact]:
+        return [Contact(*row) for row in self._connection.execute(sql, parameters)]
@@ -0,0 +1,286 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Optional, TextIO
+
+from src.exceptions import FileError
+
+
+@contextmanager
+def atomic_write(file_name: str) -> Iterator[TextIO]:
+    """
+    Opens a temporary file that replaces `file_name` only after a successful write.
+
+    The data is flushed to disk before the rename, so a crash in the middle
+    of a save leaves either the old or the new file, never a broken one.
+
+    Args:
+        file_name (str): Path of the file to replace.
+
+    Yields:
+        TextIO: File object to write to.
+    """
+    tmp_name = f"{file_name}.tmp"
+    try:
+        with open(tmp_name, 'w') as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_name, file_name)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+
+def write_json_array(file_name: str, rows: Iterable[dict[str, Any]]) -> None:
+    """
+    Streams rows into a JSON array file, one row per line.
+
+    Args:
+        file_name (str): Path to the JSON file.
+        rows (Iterable[dict]): Rows to write, consumed lazily.
+    """
+    with atomic_write(file_name) as file:
+        file.write("[")
+        separator = "\n"
+        for row in rows:
+            file.write(separator + json.dumps(row))
+            separator = ",\n"
+        file.write("\n]\n")
+
+
+class JsonLinesStorage:
+    """
+    Stores contacts as JSON Lines with a write-ahead log.
+
+    The snapshot file holds one contact per line. Changes made after the
+    snapshot was written are appended to `<file>.wal`, so saving a few
+    edits costs O(changes). Once the log grows past `compact_threshold`
+    records it is merged into a new snapshot in a background thread.
+
+    Log records look like:
+        {"op": "put", "contact": {"id": 1, "name": ..., ...}}
+        {"op": "delete", "id": 1}
+    """
+
+    def __init__(self, file_name: str, compact_threshold: int = 10_000) -> None:
+        """
+        Initializes the storage for the given snapshot file.
+
+        Args:
+            file_name (str): Path to the JSON Lines snapshot.
+            compact_threshold (int): Number of log records that triggers compaction.
+        """
+        self.file_name = file_name
+        self.log_name = f"{file_name}.wal"
+        # Log that is being merged by a running (or crashed) compaction
+        self.old_log_name = f"{file_name}.wal.old"
+        self.compact_threshold = compact_threshold
+        self._log_records = 0
+        # Guards switching of the snapshot and log files
+        self._lock = threading.Lock()
+        # Serializes full rewrites and compactions
+        self._write_lock = threading.Lock()
+        self._compaction: Optional[threading.Thread] = None
+
+    def exists(self) -> bool:
+        """
+        Returns True if there is anything stored for this file.
+        """
+        return any(os.path.exists(name) for name in (self.file_name, self.log_name, self.old_log_name))
+
+    def iter_contacts(self) -> Iterator[dict[str, Any]]:
+        """
+        Streams stored contacts with all logged changes applied.
+
+        Only the log is kept in memory; the snapshot is read line by line.
+
+        Yields:
+            dict: Contact fields.
+
+        Raises:
+            FileError: If the snapshot contains invalid JSON.
+        """
+        with self._lock:
+            changes = self._read_log(self.old_log_name)
+            changes.update(self._read_log(self.log_name))
+            self._log_records = len(changes)
+            # An open handle keeps reading this snapshot even if a compaction replaces it
+            snapshot = open(self.file_name, 'r') if os.path.exists(self.file_name) else None
+
+        if snapshot is None:
+            yield from self._apply([], changes)
+        else:
+            with snapshot:
+                yield from self._apply(self._iter_lines(snapshot), changes)
+
+    def append(self, records: Iterable[dict[str, Any]]) -> None:
+        """
+        Appends change records to the write-ahead log.
+
+        Args:
+            records (Iterable[dict]): Log records (see class docstring).
+        """
+        with self._lock:
+            self._cut_torn_line(self.log_name)
+            with open(self.log_name, 'a') as file:
+                for record in records:
+                    file.write(json.dumps(record) + "\n")
+                    self._log_records += 1
+                file.flush()
+                os.fsync(file.fileno())
+        if self._log_records >= self.compact_threshold:
+            self.compact_in_background()
+
+    def write(self, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Replaces the stored contacts with the given rows and drops the log.
+
+        Args:
+            rows (Iterable[dict]): Contact fields, consumed lazily.
+        """
+        with self._write_lock:
+            tmp_name = f"{self.file_name}.tmp"
+            self._write_lines(tmp_name, rows)
+            with self._lock:
+                os.replace(tmp_name, self.file_name)
+                for name in (self.log_name, self.old_log_name):
+                    if os.path.exists(name):
+                        os.remove(name)
+                self._log_records = 0
+
+    def compact(self) -> None:
+        """
+        Merges the write-ahead log into a new snapshot.
+
+        The current log is rotated first, so new changes can be appended
+        while the merge is running.
+        """
+        with self._write_lock:
+            with self._lock:
+                if os.path.exists(self.log_name) and not os.path.exists(self.old_log_name):
+                    os.replace(self.log_name, self.old_log_name)
+                    self._log_records = 0
+            if not os.path.exists(self.old_log_name):
+                return
+
+            changes = self._read_log(self.old_log_name)
+            tmp_name = f"{self.file_name}.tmp"
+            self._write_lines(tmp_name, self._merge(changes))
+            with self._lock:
+                os.replace(tmp_name, self.file_name)
+                os.remove(self.old_log_name)
+
+    def compact_in_background(self) -> None:
+        """
+        Starts compaction in a background thread unless one is already running.
+        """
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+        # Not a daemon: the interpreter waits for the compaction to finish on exit
+        self._compaction = threading.Thread(target=self.compact, name="phonebook-compaction")
+        self._compaction.start()
+
+    def wait(self) -> None:
+        """
+        Blocks until the background compaction (if any) has finished.
+        """
+        if self._compaction is not None:
+            self._compaction.join()
+
+    def _merge(self, changes: dict[int, Optional[dict[str, Any]]]) -> Iterator[dict[str, Any]]:
+        if not os.path.exists(self.file_name):
+            yield from self._apply([], changes)
+            return
+        with open(self.file_name, 'r') as file:
+            yield from self._apply(self._iter_lines(file), changes)
+
+    @staticmethod
+    def _apply(rows: Iterable[dict[str, Any]],
+               changes: dict[int, Optional[dict[str, Any]]]) -> Iterator[dict[str, Any]]:
+        """
+        Applies logged changes to snapshot rows. Consumes `changes`.
+        """
+        for row in rows:
+            if row["id"] in changes:
+                row = changes.pop(row["id"])
+            if row is not None:
+                yield row
+        # Contacts added after the snapshot was written
+        for row in changes.values():
+            if row is not None:
+                yield row
+
+    def _iter_lines(self, file: TextIO) -> Iterator[dict[str, Any]]:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                raise FileError(f"File '{self.file_name}' is not a valid JSON Lines file.")
+
+    @staticmethod
+    def _write_lines(file_name: str, rows: Iterable[dict[str, Any]]) -> None:
+        try:
+            with open(file_name, 'w') as file:
+                for row in rows:
+                    file.write(json.dumps(row) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+        except BaseException:
+            if os.path.exists(file_name):
+                os.remove(file_name)
+            raise
+
+    @staticmethod
+    def _cut_torn_line(log_name: str) -> None:
+        """
+        Truncates a log after its last newline, dropping a line torn by a crash during append.
+        """
+        if not os.path.exists(log_name):
+            return
+        with open(log_name, 'rb+') as file:
+            size = file.seek(0, os.SEEK_END)
+            end = size
+            while end > 0:
+                start = max(0, end - 4096)
+                file.seek(start)
+                newline = file.read(end - start).rfind(b"\n")
+                if newline != -1:
+                    end = start + newline + 1
+                    break
+                end = start
+            if end < size:
+                file.truncate(end)
+
+    @staticmethod
+    def _read_log(log_name: str) -> dict[int, Optional[dict[str, Any]]]:
+        """
+        Reads a log into the latest state of every changed contact (None = deleted).
+
+        A last line without a newline was torn by a crash during append and
+        is ignored; append cuts it off before writing.
+
+        Raises:
+            FileError: If a complete line of the log is not a valid record.
+        """
+        changes: dict[int, Optional[dict[str, Any]]] = {}
+        if not os.path.exists(log_name):
+            return changes
+        with open(log_name, 'r') as file:
+            for line in file:
+                if not line.endswith("\n"):
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    raise FileError(f"File '{log_name}' has a broken record.")
+                if record["op"] == "put":
+                    changes[record["contact"]["id"]] = record["contact"]
+                elif record["op"] == "delete":
+                    changes[record["id"]] = None
+        return changes
@@ -1,3 +1,6 @@
+from src.pager import PAGE_SIZE, SORT_KEYS, ContactPager
+
+
 def display_menu():
     """
     Displays the main menu with available options.
@@ -48,6 +51,66 @@ def show_contacts(contacts):
         print(contact)
 
 
+def show_contacts_paged(contacts, total=None, page_size=PAGE_SIZE):
+    """
+    Displays contacts one page at a time with navigation.
+
+    Contacts are read lazily, so only the pages the user opens are
+    rendered. If everything fits on one page, no prompt is shown.
+
+    Args:
+        contacts (Iterable[Contact]): Contacts to display, a sequence or an iterator.
+        total (int, optional): Number of contacts, if `contacts` is an iterator.
+        page_size (int): Number of contacts per page.
+    """
+    pager = ContactPager(contacts, page_size, total)
+    show_contacts(pager.current())
+    if not pager.has_next():
+        return
+    while True:
+        page_count = pager.page_count
+        sort = ""
+        if pager.sort is not None:
+            field, reverse = pager.sort
+            sort = f", sorted by {field}{' (descending)' if reverse else ''}"
+        print(f"-- Page {pager.page + 1} of {page_count if page_count else '?'}{sort} --")
+        command = input("n - next, p - previous, <number> - go to page, "
+                        f"s [-]<{'|'.join(SORT_KEYS)}> - sort, q - back to menu: ").strip().lower()
+        try:
+            if command in ("", "n"):
+                if not pager.has_next():
+                    print("This is the last page.")
+                    continue
+                page = pager.next_page()
+            elif command == "p":
+                page = pager.prev_page()
+            elif command.isdecimal():
+                page = pager.jump(int(command) - 1)
+            elif command.startswith("s "):
+                field = command[2:].strip()
+                page = pager.sort_by(field.lstrip("-"), reverse=field.startswith("-"))
+            elif command == "q":
+                return
+            else:
+                print("Unknown command.")
+                continue
+        except ValueError as e:
+            print(e)
+            continue
+        show_contacts(page)
+
+
+def show_ranked_contacts(results):
+    """
+    Displays contacts with their match scores.
+
+    Args:
+        results (list[tuple[Contact, float]]): Contacts with scores, best first.
+    """
+    for contact, score in results:
+        print(f"[{score:.0%}] {contact}")
+
+
 def show_message(message):
     """
     Displays a message to the user.
@@ -0,0 +1,60 @@
+"""
+Compares memory used by different contact representations.
+
+Run from the hw_3 directory:
+    python -m tests.benchmarks.bench_memory --sizes 100000 1000000
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable, Iterable
+
+from src.model_contact import Contact
+from tests.benchmarks.data import generate_contacts
+
+
+class DictContact:
+    """The original Contact model with a per-instance __dict__, kept as a baseline."""
+
+    def __init__(self, id: int, name: str, phone: str, comment: str) -> None:
+        self.id = id
+        self.name = name
+        self.phone = phone
+        self.comment = comment
+
+
+def build_objects(cls: type, rows: Iterable[tuple[str, str, str]]) -> list[Any]:
+    return [cls(i, name, phone, comment) for i, (name, phone, comment) in enumerate(rows, start=1)]
+
+
+def measure_memory(build: Callable[[Iterable[tuple[str, str, str]]], Any], size: int) -> int:
+    """
+    Returns the number of bytes still allocated by the built structure.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = build(generate_contacts(size))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000], help="numbers of contacts")
+    args = parser.parse_args()
+
+    builders = [
+        ("dict Contact", lambda rows: build_objects(DictContact, rows)),
+        ("slots Contact", lambda rows: build_objects(Contact, rows)),
+    ]
+    print(f"{'model':<16}" + "".join(f"{size:>14}" for size in args.sizes))
+    for title, build in builders:
+        usage = [measure_memory(build, size) for size in args.sizes]
+        print(f"{title:<16}" + "".join(f"{bytes_used / 2**20:>11.1f} MB" for bytes_used in usage))
+
+
+if __name__ == "__main__":
+    main()
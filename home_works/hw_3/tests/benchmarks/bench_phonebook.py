@@ -0,0 +1,80 @@
+"""
+Micro-benchmarks for PhoneBook write operations.
+
+The bulk import only fills the id index; the first lookup and the first
+partial search report the cost of the deferred indexes separately.
+
+Run from the hw_3 directory:
+    python -m tests.benchmarks.bench_phonebook --size 1000000
+"""
+import argparse
+import time
+from typing import Callable
+
+from src.model_contact import Contact
+from src.model_phonebook import PhoneBook
+from tests.benchmarks.data import generate_contacts
+
+
+class LegacyPhoneBook:
+    """The original add/delete logic (max() over ids, list.remove), kept as a baseline."""
+
+    def __init__(self) -> None:
+        self.contacts: list[Contact] = []
+
+    def add_contact(self, name: str, phone: str, comment: str) -> None:
+        contact_id = max([contact.id for contact in self.contacts], default=0) + 1
+        self.contacts.append(Contact(contact_id, name, phone, comment))
+
+    def delete_contact(self, contact_id: int) -> None:
+        for contact in self.contacts:
+            if contact.id == contact_id:
+                self.contacts.remove(contact)
+                return
+
+
+def timed(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def report(title: str, count: int, seconds: float) -> None:
+    print(f"{title:<36}{count:>10}{seconds:>10.3f} s{count / seconds:>14,.0f} ops/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000, help="rows for the bulk import")
+    parser.add_argument("--legacy-size", type=int, default=10_000, help="rows for the quadratic baseline")
+    args = parser.parse_args()
+
+    legacy_rows = list(generate_contacts(args.legacy_size))
+    rows = list(generate_contacts(args.size))
+
+    legacy = LegacyPhoneBook()
+    report("legacy add_contact loop", len(legacy_rows),
+           timed(lambda: [legacy.add_contact(*row) for row in legacy_rows]))
+    report("legacy delete_contact (from back)", 1000,
+           timed(lambda: [legacy.delete_contact(contact_id)
+                          for contact_id in range(len(legacy_rows), len(legacy_rows) - 1000, -1)]))
+
+    phonebook = PhoneBook()
+    report("add_contact loop", len(legacy_rows),
+           timed(lambda: [phonebook.add_contact(*row) for row in legacy_rows]))
+
+    phonebook = PhoneBook()
+    # The import target: seconds for a million rows, the indexes are built by the first queries
+    report("add_contacts bulk import", len(rows), timed(lambda: phonebook.add_contacts(rows)))
+    report("first lookup (builds hash keys)", 1, timed(lambda: phonebook.find_contact(rows[0][0])))
+    report("update_contact", 10_000,
+           timed(lambda: [phonebook.update_contact(contact_id, comment="Updated")
+                          for contact_id in range(1, 10_001)]))
+    report("delete_contact (from back)", 10_000,
+           timed(lambda: [phonebook.delete_contact(contact_id)
+                          for contact_id in range(len(rows), len(rows) - 10_000, -1)]))
+    report("first partial search (builds n-grams)", 1, timed(lambda: phonebook.search_contacts("smith")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compares indexed contact search with linear scans over all contacts.
+
+Run from the hw_3 directory:
+    python -m tests.benchmarks.bench_search --sizes 200000 1000000
+"""
+import argparse
+import json
+import os
+import tempfile
+
+from src.fuzzy import rank
+from src.model_contact import Contact
+from src.model_phonebook import PhoneBook
+from tests.benchmarks.data import generate_contacts, measure
+
+
+def linear_find(contacts: list[Contact], info: str) -> list[Contact]:
+    """The original PhoneBook.find_contact scan, kept as a baseline."""
+    return [contact for contact in contacts
+            if info in (str(contact.id), contact.name, contact.phone, contact.comment)]
+
+
+def linear_search(contacts: list[Contact], fragment: str) -> list[Contact]:
+    """Substring scan over names and comments, kept as a baseline."""
+    fragment = fragment.lower()
+    return [contact for contact in contacts
+            if fragment in contact.name.lower() or fragment in contact.comment.lower()]
+
+
+def scan_fuzzy(contacts: list[Contact], query: str) -> list[tuple[Contact, float]]:
+    """Scores every contact, as a fuzzy search without candidate filtering would."""
+    return rank(query, contacts, 5, 2)
+
+
+def run(size: int) -> None:
+    # Build the book the way operators do: by loading a contacts file
+    rows = [{"id": i, "name": name, "phone": phone, "comment": comment}
+            for i, (name, phone, comment) in enumerate(generate_contacts(size), start=1)]
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "contacts.json")
+        with open(file_name, "w") as file:
+            json.dump(rows, file)
+        phonebook = PhoneBook()
+        phonebook.load_from_file(file_name)
+    last = phonebook.contacts[-1]
+
+    cases = [
+        ("find by id", phonebook.find_contact, linear_find, str(last.id)),
+        ("find by name", phonebook.find_contact, linear_find, last.name),
+        ("find by phone", phonebook.find_contact, linear_find, last.phone),
+        ("search name part", phonebook.search_contacts, linear_search, last.name.split()[-1]),
+        ("fuzzy name typo", phonebook.fuzzy_find, scan_fuzzy, last.name[:-1].replace("o", "u", 1)),
+    ]
+    print(f"{size} contacts")
+    print(f"{'case':<20}{'scan, ms':>12}{'index, ms':>12}{'speedup':>10}")
+    for title, indexed, linear, query in cases:
+        scan_time = measure(linear, phonebook.contacts, query)
+        index_time = measure(indexed, query)
+        print(f"{title:<20}{scan_time * 1000:>12.3f}{index_time * 1000:>12.3f}{scan_time / index_time:>9.0f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200_000, 1_000_000], help="numbers of contacts")
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size)
+
+if __name__ == "__main__":
+    main()
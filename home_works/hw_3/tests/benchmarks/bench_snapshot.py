@@ -0,0 +1,55 @@
+"""
+Compares loading a JSON Lines file with opening its memory-mapped snapshot.
+
+Run from the hw_3 directory:
+    python -m tests.benchmarks.bench_snapshot --size 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+from typing import Any, Callable
+
+from src.model_phonebook import PhoneBook
+from tests.benchmarks.data import generate_contacts
+
+
+def timed(title: str, func: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = func()
+    print(f"{title:<32}{time.perf_counter() - start:>10.4f} s")
+    return result
+
+
+def run_queries(phonebook: PhoneBook, size: int) -> None:
+    phone = f"+1 800 {size // 2 // 10000:03d} {size // 2 % 10000:04d}"
+    timed("  find_contact (phone)", lambda: phonebook.find_contact(phone))
+    timed("  find_contact (id)", lambda: phonebook.find_contact(str(size // 3)))
+    timed("  search_contacts", lambda: phonebook.search_contacts("vip client #999"))
+    timed("  first 20 contacts", lambda: [str(contact) for _, contact in zip(range(20), phonebook.iter_contacts())])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000, help="number of contacts")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "contacts.jsonl")
+        phonebook = PhoneBook()
+        phonebook.add_contacts(generate_contacts(args.size))
+        timed("save_to_file with snapshot", lambda: phonebook.save_to_file(file_name, snapshot=True))
+        phonebook.close()
+
+        phonebook = PhoneBook()
+        timed("load_from_file (.jsonl)", lambda: phonebook.load_from_file(file_name))
+        run_queries(phonebook, args.size)
+        phonebook.close()
+
+        readonly = timed("open_snapshot", lambda: PhoneBook.open_snapshot(file_name))
+        run_queries(readonly, args.size)
+        readonly.close()
+
+
+if __name__ == "__main__":
+    main()
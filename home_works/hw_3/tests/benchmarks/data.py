@@ -0,0 +1,47 @@
+import random
+import time
+from typing import Any, Callable, Iterator
+
+FIRST_NAMES = ["John", "Emma", "William", "Olivia", "James", "Sophia", "Liam", "Ava", "Noah", "Mia"]
+LAST_NAMES = ["Smith", "Johnson", "Brown", "Davis", "Miller", "Wilson", "Moore", "Taylor", "Anderson", "Thomas"]
+COMMENTS = ["Call back later", "Order delivered", "Interested in discounts",
+            "Requested details", "VIP client", "Prefers email", "New customer"]
+
+
+def generate_contacts(count: int, seed: int = 42) -> Iterator[tuple[str, str, str]]:
+    """
+    Generates synthetic (name, phone, comment) rows for benchmarks.
+
+    Args:
+        count (int): Number of rows to generate.
+        seed (int): Seed for reproducible data.
+
+    Yields:
+        tuple: Name, phone and comment of a contact.
+    """
+    rnd = random.Random(seed)
+    for i in range(count):
+        name = f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)} {i}"
+        phone = f"+1 800 {i // 10000:03d} {i % 10000:04d}"
+        comment = f"{rnd.choice(COMMENTS)} #{rnd.randrange(1000)}"
+        yield name, phone, comment
+
+
+def measure(func: Callable[..., Any], *args: Any, repeat: int = 5) -> float:
+    """
+    Measures the best wall-clock time of a function call.
+
+    Args:
+        func (Callable): Function to measure.
+        *args: Arguments for the function.
+        repeat (int): Number of runs.
+
+    Returns:
+        float: Best time in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -139,4 +139,34 @@ def test_run_phonebook_invalid_input(monkeypatch, capsys):
     run_phonebook()
     captured = capsys.readouterr()
 
-    assert "Invalid input. Please enter valid data." in captured.out
\ No newline at end of file
+    assert "Invalid input. Please enter valid data." in captured.out
+
+
+def test_run_phonebook_with_database(monkeypatch, capsys, tmp_path):
+    """
+    Simulates adding and finding a contact with the SQLite backend.
+    """
+    inputs = iter(["4", "Alice", "12345", "Friend", "5", "ali", "8"])  # Add, find, exit
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+
+    run_phonebook(str(tmp_path / "contacts.db"))
+    captured = capsys.readouterr()
+
+    assert "ID: 1, Name: Alice, Phone: 12345, Comment: Friend" in captured.out
+
+
+def test_run_phonebook_fuzzy_find(monkeypatch, capsys):
+    """
+    Simulates a search with a typo that only the fuzzy search can resolve.
+    """
+    inputs = iter(["5", "Alcie", "8"])  # Find contact, exit
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+
+    phonebook = PhoneBook()
+    phonebook.add_contact("Alice", "12345", "Friend")
+    monkeypatch.setattr("src.controller.PhoneBook", lambda: phonebook)
+
+    run_phonebook()
+    captured = capsys.readouterr()
+
+    assert "ID: 1, Name: Alice, Phone: 12345, Comment: Friend" in captured.out
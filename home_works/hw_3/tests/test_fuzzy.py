@@ -0,0 +1,61 @@
+import pytest
+from src.exceptions import ContactError
+from src.fuzzy import bounded_levenshtein
+from src.search_index import soundex
+
+
+@pytest.mark.parametrize(
+    "first, second, max_distance, expected",
+    [
+        ("smith", "smith", 2, 0),
+        ("smith", "smyth", 2, 1),
+        ("jon", "john", 1, 1),
+        ("kitten", "sitting", 3, 3),
+        ("kitten", "sitting", 2, None),
+        ("ab", "abcdef", 2, None),
+    ],
+)
+def test_bounded_levenshtein(first, second, max_distance, expected):
+    assert bounded_levenshtein(first, second, max_distance) == expected
+
+
+@pytest.mark.parametrize(
+    "word, code",
+    [
+        ("Robert", "R163"),
+        ("Rupert", "R163"),
+        ("Ashcraft", "A261"),
+        ("Lee", "L000"),
+        ("Иван", ""),
+    ],
+)
+def test_soundex(word, code):
+    assert soundex(word) == code
+
+
+@pytest.fixture
+def fuzzy_phonebook(empty_phonebook):
+    """Fixture for creating a phonebook with similar names."""
+    empty_phonebook.add_contacts([
+        ("John Smith", "+1 800 123 4567", "Friend"),
+        ("Jane Smyth", "+1 800 765 4321", "Colleague"),
+        ("Robert Brown", "555", "Neighbor"),
+    ])
+    return empty_phonebook
+
+
+def test_fuzzy_find_ranks_typos(fuzzy_phonebook):
+    results = fuzzy_phonebook.fuzzy_find("smiht")
+    assert [contact.id for contact, _ in results] == [1, 2]
+    assert results[0][1] > results[1][1]
+
+
+def test_fuzzy_find_by_sound_and_phone(fuzzy_phonebook):
+    assert fuzzy_phonebook.fuzzy_find("Rupert")[0][0].id == 3
+    assert fuzzy_phonebook.fuzzy_find("18001234567") == [(fuzzy_phonebook.contacts[0], 1.0)]
+
+
+def test_fuzzy_find_limit_and_no_match(fuzzy_phonebook):
+    assert len(fuzzy_phonebook.fuzzy_find("smith", limit=1)) == 1
+    with pytest.raises(ContactError):
+        fuzzy_phonebook.fuzzy_find("qqqqqqqq")
@@ -1,6 +1,7 @@
 import pytest
 import json
 import pytest
+from src.memory_backend import MemoryBackend
 from src.model_phonebook import PhoneBook
 from src.exceptions import FileError, ContactError
 
@@ -69,4 +70,81 @@ def test_save_to_file(sample_phonebook, tmp_path):
     saved_data = json.loads(file_path.read_text())
     assert len(saved_data) == 2
     assert saved_data[0]["name"] == "Alice"
-    assert saved_data[1]["name"] == "Bob"
\ No newline at end of file
+    assert saved_data[1]["name"] == "Bob"
+
+
+def test_find_contact_after_update(sample_phonebook):
+    sample_phonebook.update_contact(1, name="Alicia")
+    assert sample_phonebook.find_contact("alicia")[0].id == 1
+    with pytest.raises(ContactError):
+        sample_phonebook.find_contact("Alice")
+
+
+def test_search_contacts(sample_phonebook):
+    results = sample_phonebook.search_contacts("lic")
+    assert [contact.name for contact in results] == ["Alice"]
+    with pytest.raises(ContactError):
+        sample_phonebook.search_contacts("zzz")
+
+
+def test_save_to_jsonl_appends_changes(sample_phonebook, tmp_path):
+    file_name = str(tmp_path / "contacts.jsonl")
+    sample_phonebook.save_to_file(file_name)
+    sample_phonebook.update_contact(2, comment="Manager")
+    sample_phonebook.delete_contact(1)
+    sample_phonebook.save_to_file(file_name)
+
+    with open(file_name + ".wal") as file:
+        assert len(file.readlines()) == 2
+
+    phonebook = PhoneBook()
+    phonebook.load_from_file(file_name)
+    assert [(contact.id, contact.comment) for contact in phonebook.contacts] == [(2, "Manager")]
+
+
+def test_save_elsewhere_keeps_jsonl_changes(tmp_path):
+    file_name = str(tmp_path / "a.jsonl")
+    phonebook = PhoneBook()
+    phonebook.add_contact("A", "1", "")
+    phonebook.save_to_file(file_name)
+
+    phonebook = PhoneBook()
+    phonebook.load_from_file(file_name)
+    phonebook.add_contact("New", "2", "")
+    phonebook.save_to_file(str(tmp_path / "b.json"))
+    phonebook.save_to_file(file_name)
+
+    phonebook = PhoneBook()
+    phonebook.load_from_file(file_name)
+    assert [contact.name for contact in phonebook.contacts] == ["A", "New"]
+
+
+def test_load_missing_jsonl(tmp_path):
+    with pytest.raises(FileError):
+        PhoneBook().load_from_file(str(tmp_path / "missing.jsonl"))
+
+
+def test_ids_are_not_reused(sample_phonebook):
+    sample_phonebook.delete_contact(2)
+    sample_phonebook.add_contact("Carol", "55555", "Neighbor")
+    assert [contact.id for contact in sample_phonebook.contacts] == [1, 3]
+
+
+def test_add_contacts(sample_phonebook):
+    added = sample_phonebook.add_contacts([("Carol", "55555", "Neighbor"), ("Dave", "77777", "Friend")])
+    assert added == 2
+    assert [contact.id for contact in sample_phonebook.contacts] == [1, 2, 3, 4]
+    assert [contact.name for contact in sample_phonebook.search_contacts("car")] == ["Carol"]
+    assert len(sample_phonebook.find_contact("Friend")) == 2
+
+
+def test_delete_leaves_tombstones_until_compaction(empty_phonebook, monkeypatch):
+    monkeypatch.setattr(MemoryBackend, "COMPACT_MIN_TOMBSTONES", 3)
+    empty_phonebook.add_contacts((f"Name {i}", str(i), "") for i in range(10))
+    empty_phonebook.delete_contact(1)
+    empty_phonebook.delete_contact(2)
+    assert len(empty_phonebook._backend._records) == 10
+    with pytest.raises(ContactError):
+        empty_phonebook.find_contact("Name 0")
+    assert len(empty_phonebook.contacts) == 8
+    assert len(empty_phonebook._backend._records) == 8
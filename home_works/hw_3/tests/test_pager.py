@@ -0,0 +1,75 @@
+import pytest
+from src.model_contact import Contact
+from src.pager import ContactPager
+
+
+@pytest.fixture
+def contacts() -> list[Contact]:
+    """Fixture for seven contacts with names in reverse order of their ids."""
+    return [Contact(i, f"Name {chr(ord('g') - i + 1)}", f"+1 {100 - i}", "") for i in range(1, 8)]
+
+
+def ids(page) -> list[int]:
+    return [contact.id for contact in page]
+
+
+def test_pages_of_a_list(contacts):
+    pager = ContactPager(contacts, page_size=3)
+    assert pager.page_count == 3
+    assert ids(pager.current()) == [1, 2, 3]
+    assert ids(pager.next_page()) == [4, 5, 6]
+    assert ids(pager.next_page()) == [7]
+    # Stays on the last page
+    assert ids(pager.next_page()) == [7]
+    assert ids(pager.prev_page()) == [4, 5, 6]
+    assert ids(pager.jump(0)) == [1, 2, 3]
+    assert ids(pager.prev_page()) == [1, 2, 3]
+
+
+def test_iterator_is_read_lazily(contacts):
+    pulled = []
+
+    def source():
+        for contact in contacts:
+            pulled.append(contact.id)
+            yield contact
+
+    pager = ContactPager(source(), page_size=2)
+    assert pager.page_count is None
+    assert ids(pager.current()) == [1, 2]
+    assert pulled == [1, 2]
+    assert ids(pager.jump(2)) == [5, 6]
+    assert pulled == [1, 2, 3, 4, 5, 6]
+    assert ids(pager.prev_page()) == [3, 4]
+    assert not ContactPager(iter([]), page_size=2).has_next()
+
+
+def test_jump_to_missing_page(contacts):
+    pager = ContactPager(contacts, page_size=3)
+    with pytest.raises(ValueError):
+        pager.jump(3)
+    with pytest.raises(ValueError):
+        pager.jump(-1)
+    assert pager.page == 0
+
+
+def test_sort_by_field(contacts):
+    pager = ContactPager(iter(contacts), page_size=3, total=len(contacts))
+    pager.next_page()
+    assert ids(pager.sort_by("name")) == [7, 6, 5]
+    assert ids(pager.next_page()) == [4, 3, 2]
+    assert ids(pager.sort_by("name", reverse=True)) == [1, 2, 3]
+    assert ids(pager.sort_by("phone")) == [7, 6, 5]
+    assert pager.sort == ("phone", False)
+    # The underlying list keeps its order
+    assert ids(contacts) == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_sort_by_unknown_field(contacts):
+    with pytest.raises(ValueError):
+        ContactPager(contacts).sort_by("email")
+
+
+def test_invalid_page_size(contacts):
+    with pytest.raises(ValueError):
+        ContactPager(contacts, page_size=0)
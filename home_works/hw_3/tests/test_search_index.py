@@ -0,0 +1,113 @@
+import pytest
+from src import search_index
+from src.model_contact import Contact
+from src.search_index import ContactIndex, looks_like_phone, normalize_phone, normalize_text
+
+
+@pytest.fixture
+def index() -> ContactIndex:
+    """Fixture for creating an index with sample contacts."""
+    index = ContactIndex()
+    index.rebuild([
+        Contact(1, "Alice Smith", "+1 800 123-45-67", "Friend from school"),
+        Contact(2, "Bob Brown", "67890", "Colleague"),
+    ])
+    return index
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("  Alice   SMITH ", "alice smith"),
+        ("Bob", "bob"),
+    ],
+)
+def test_normalize_text(value, expected):
+    assert normalize_text(value) == expected
+
+
+def test_normalize_phone():
+    assert normalize_phone("+1 (800) 123-45-67") == "18001234567"
+
+
+@pytest.mark.parametrize(
+    "info, expected_ids",
+    [
+        ("1", [1]),
+        ("alice smith", [1]),
+        ("18001234567", [1]),
+        ("colleague", [2]),
+        ("Alice", []),
+    ],
+)
+def test_lookup(index, info, expected_ids):
+    assert [contact.id for contact in index.lookup(info)] == expected_ids
+
+
+@pytest.mark.parametrize(
+    "fragment, expected_ids",
+    [
+        ("smi", [1]),
+        ("SCHOOL", [1]),
+        ("o", [1, 2]),
+        ("xyz", []),
+    ],
+)
+def test_search(index, fragment, expected_ids):
+    assert [contact.id for contact in index.search(fragment)] == expected_ids
+
+
+def test_remove_drops_all_keys(index):
+    contact = index.by_id[2]
+    index.remove(contact)
+    assert index.lookup("Bob Brown") == []
+    assert index.search("brown") == []
+    assert "bro" not in index.ngrams
+
+
+def test_add_many_defers_keys_until_lookup():
+    index = ContactIndex()
+    alice, bob = Contact(1, "Alice Smith", "123", "Friend"), Contact(2, "Bob Brown", "456", "Colleague")
+    index.add_many([alice, bob])
+    assert not index.by_name and not index.phonetic
+    # Changed and removed before the keys were built
+    index.remove(alice)
+    alice.name = "Alicia"
+    index.add(alice)
+    index.remove(bob)
+    assert [contact.id for contact in index.lookup("alicia")] == [1]
+    assert index.lookup("Alice Smith") == []
+    assert index.lookup("456") == []
+    assert [contact.id for contact in index.fuzzy_candidates("Alicia", 1)] == [1]
+
+
+@pytest.mark.parametrize(
+    "info, expected_ids",
+    [
+        ("Room 101", [2]),
+        ("101", [1]),
+        ("(10) 1", [1]),
+        ("+1-01", [1]),
+    ],
+)
+def test_lookup_phone_only_for_phone_queries(info, expected_ids):
+    index = ContactIndex()
+    index.rebuild([Contact(1, "Alice", "101", "Friend"), Contact(2, "Bob", "555", "Room 101")])
+    assert [contact.id for contact in index.lookup(info)] == expected_ids
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("+1 (800) 123-45-67", True), ("101", True), ("Room 101", False), ("-", False), ("", False)],
+)
+def test_looks_like_phone(value, expected):
+    assert looks_like_phone(value) == expected
+
+
+def test_fuzzy_candidates_skip_long_postings(monkeypatch):
+    monkeypatch.setattr(search_index, "FUZZY_POSTING_LIMIT", 10)
+    index = ContactIndex()
+    index.rebuild([Contact(i, f"John Smith {i}", "", "") for i in range(1, 51)] + [Contact(51, "Jane Qwerty", "", "")])
+    assert 51 in [contact.id for contact in index.fuzzy_candidates("Jane Qwerti", 2)]
+    assert 7 in [contact.id for contact in index.fuzzy_candidates("John Smiht 7", 2)]
+    assert len(index.fuzzy_candidates("John Smith", 1)) == 50
@@ -0,0 +1,170 @@
+import os
+
+import pytest
+from src.exceptions import ContactError, FileError
+from src.model_contact import Contact
+from src.model_phonebook import PhoneBook
+from src.snapshot import SnapshotBackend, snapshot_name, write_snapshot
+
+
+CONTACTS = [
+    Contact(3, "Alice Smith", "+1 800 123-45-67", "Friend"),
+    Contact(1, "Bob", "67890", "Colleague"),
+    Contact(7, "Алиса", "555", "Соседка"),
+]
+
+
+@pytest.fixture
+def snapshot(tmp_path) -> SnapshotBackend:
+    """Fixture for a snapshot with contacts stored out of id order."""
+    file_name = str(tmp_path / "contacts.snapshot")
+    write_snapshot(file_name, CONTACTS)
+    backend = SnapshotBackend(file_name)
+    yield backend
+    backend.close()
+
+
+def test_iter_contacts_keeps_order(snapshot):
+    assert len(snapshot) == 3
+    assert [contact.to_dict() for contact in snapshot.iter_contacts()] == [
+        contact.to_dict() for contact in CONTACTS]
+    assert str(next(snapshot.iter_contacts())) == str(CONTACTS[0])
+
+
+@pytest.mark.parametrize(
+    "info, expected_ids",
+    [
+        ("7", [7]),
+        ("alice smith", [3]),
+        ("18001234567", [3]),
+        ("COLLEAGUE", [1]),
+        ("алиса", [7]),
+        ("Nobody", []),
+    ],
+)
+def test_find(snapshot, info, expected_ids):
+    assert [contact.id for contact in snapshot.find(info)] == expected_ids
+
+
+def test_find_phone_only_for_phone_queries(tmp_path):
+    file_name = str(tmp_path / "contacts.snapshot")
+    write_snapshot(file_name, [Contact(1, "Alice", "101", ""), Contact(2, "Bob", "555", "Room 101")])
+    backend = SnapshotBackend(file_name)
+    assert [contact.id for contact in backend.find("Room 101")] == [2]
+    assert [contact.id for contact in backend.find("101")] == [1]
+    backend.close()
+
+
+@pytest.mark.parametrize(
+    "fragment, expected_ids",
+    [
+        ("smi", [3]),
+        ("o", [1]),
+        ("сед", [7]),
+        ("ice smith", [3]),
+        # Does not match across the name and the comment
+        ("smith friend", []),
+        # Raw phone numbers are not searched
+        ("800", []),
+    ],
+)
+def test_search(snapshot, fragment, expected_ids):
+    assert [contact.id for contact in snapshot.search(fragment)] == expected_ids
+
+
+def test_get_and_fuzzy(snapshot):
+    assert snapshot.get(1).name == "Bob"
+    assert snapshot.get(2) is None
+    contact, score = snapshot.fuzzy("Alise Smith", 5, 2)[0]
+    assert contact.id == 3 and score > 0.8
+
+
+def test_mutations_are_rejected(snapshot):
+    with pytest.raises(ContactError):
+        snapshot.add("Carol", "555", "")
+    with pytest.raises(ContactError):
+        snapshot.delete(1)
+
+
+def test_empty_snapshot(tmp_path):
+    file_name = str(tmp_path / "empty.snapshot")
+    write_snapshot(file_name, [])
+    backend = SnapshotBackend(file_name)
+    assert len(backend) == 0
+    assert backend.find("1") == [] and backend.search("a") == []
+    backend.close()
+
+
+def test_not_a_snapshot(tmp_json_file):
+    with pytest.raises(FileError):
+        SnapshotBackend(tmp_json_file)
+
+
+@pytest.mark.parametrize("data", [b"", b"PBSNAP01"])
+def test_truncated_snapshot(tmp_path, data):
+    file_name = tmp_path / "contacts.snapshot"
+    file_name.write_bytes(data)
+    with pytest.raises(FileError):
+        SnapshotBackend(str(file_name))
+
+
+@pytest.mark.parametrize("cut", [1, 4 * len(CONTACTS), 4 * len(CONTACTS) * 4 + 1])
+def test_truncated_snapshot_body(tmp_path, cut):
+    file_name = tmp_path / "contacts.snapshot"
+    write_snapshot(str(file_name), CONTACTS)
+    file_name.write_bytes(file_name.read_bytes()[:-cut])
+    with pytest.raises(FileError):
+        SnapshotBackend(str(file_name))
+
+
+def test_open_snapshot_rebuilds_stale_snapshot(tmp_path):
+    file_name = str(tmp_path / "contacts.jsonl")
+    phonebook = PhoneBook()
+    phonebook.add_contact("Alice", "12345", "Friend")
+    phonebook.save_to_file(file_name, snapshot=True)
+    assert os.path.exists(snapshot_name(file_name))
+
+    phonebook.add_contact("Bob", "67890", "Colleague")
+    phonebook.save_to_file(file_name)
+    phonebook.close()
+
+    readonly = PhoneBook.open_snapshot(file_name)
+    assert [contact.name for contact in readonly.iter_contacts()] == ["Alice", "Bob"]
+    assert readonly.find_contact("bob")[0].id == 2
+    with pytest.raises(ContactError):
+        readonly.delete_contact(1)
+    readonly.close()
+
+
+def test_save_read_only_book(tmp_path):
+    file_name = str(tmp_path / "contacts.jsonl")
+    phonebook = PhoneBook()
+    phonebook.add_contact("Alice", "12345", "Friend")
+    phonebook.save_to_file(file_name, snapshot=True)
+    phonebook.close()
+    with open(file_name) as file:
+        saved = file.read()
+
+    readonly = PhoneBook.open_snapshot(file_name)
+    with pytest.raises(ContactError):
+        readonly.save_to_file(file_name)
+    with pytest.raises(ContactError):
+        readonly.save_to_file(str(tmp_path / "copy.json"))
+    readonly.close()
+    with open(file_name) as file:
+        assert file.read() == saved
+    assert not os.path.exists(tmp_path / "copy.json")
+
+
+def test_open_snapshot_missing_file(tmp_path):
+    with pytest.raises(FileError):
+        PhoneBook.open_snapshot(str(tmp_path / "missing.jsonl"))
+
+
+def test_contact_sequence(snapshot):
+    sequence = snapshot.contact_sequence()
+    assert len(sequence) == 3
+    assert sequence[-1].id == 7
+    assert [contact.id for contact in sequence[:2]] == [3, 1]
+    with pytest.raises(IndexError):
+        sequence[3]
@@ -0,0 +1,95 @@
+import pytest
+from src.exceptions import ContactError
+from src.model_phonebook import PhoneBook
+from src.sqlite_backend import SQLiteBackend
+
+
+@pytest.fixture
+def sqlite_phonebook(tmp_path) -> PhoneBook:
+    """Fixture for creating a SQLite-backed phonebook with sample data."""
+    phonebook = PhoneBook(SQLiteBackend(str(tmp_path / "contacts.db")))
+    phonebook.add_contact("Alice Smith", "+1 800 123-45-67", "Friend")
+    phonebook.add_contact("Bob", "67890", "Colleague")
+    yield phonebook
+    phonebook.close()
+
+
+@pytest.mark.parametrize(
+    "search_term, expected_ids",
+    [
+        ("1", [1]),
+        ("alice smith", [1]),
+        ("18001234567", [1]),
+        ("COLLEAGUE", [2]),
+    ],
+)
+def test_find_contact(sqlite_phonebook, search_term, expected_ids):
+    assert [contact.id for contact in sqlite_phonebook.find_contact(search_term)] == expected_ids
+
+
+
+def test_find_contact_with_huge_number(sqlite_phonebook):
+    with pytest.raises(ContactError):
+        sqlite_phonebook.find_contact("9" * 30)
+
+
+def test_find_contact_phone_only_for_phone_queries(sqlite_phonebook):
+    sqlite_phonebook.add_contact("Carol", "101", "")
+    sqlite_phonebook.add_contact("Dave", "555", "Room 101")
+    assert [contact.id for contact in sqlite_phonebook.find_contact("Room 101")] == [4]
+    assert [contact.id for contact in sqlite_phonebook.find_contact("101")] == [3]
+
+
+@pytest.mark.parametrize(
+    "fragment, expected_ids",
+    [
+        ("smi", [1]),
+        ("lea", [2]),
+        ("b", [2]),
+    ],
+)
+def test_search_contacts(sqlite_phonebook, fragment, expected_ids):
+    assert [contact.id for contact in sqlite_phonebook.search_contacts(fragment)] == expected_ids
+
+
+def test_update_reindexes(sqlite_phonebook):
+    sqlite_phonebook.update_contact(2, name="Robert")
+    assert sqlite_phonebook.find_contact("robert")[0].phone == "67890"
+    assert sqlite_phonebook.search_contacts("rober")[0].id == 2
+    with pytest.raises(ContactError):
+        sqlite_phonebook.search_contacts("bob")
+
+
+def test_delete_does_not_reuse_ids(sqlite_phonebook):
+    sqlite_phonebook.delete_contact(2)
+    with pytest.raises(ContactError):
+        sqlite_phonebook.delete_contact(2)
+    sqlite_phonebook.add_contact("Carol", "555", "")
+    assert [contact.id for contact in sqlite_phonebook.iter_contacts()] == [1, 3]
+
+
+def test_import_and_export(sqlite_phonebook, tmp_json_file, tmp_path):
+    sqlite_phonebook.load_from_file(tmp_json_file)
+    assert len(sqlite_phonebook) == 1
+    export_file = str(tmp_path / "export.jsonl")
+    sqlite_phonebook.save_to_file(export_file)
+
+    phonebook = PhoneBook()
+    phonebook.load_from_file(export_file)
+    assert [contact.name for contact in phonebook.contacts] == ["Alice"]
+
+
+def test_data_persists(tmp_path):
+    database = str(tmp_path / "contacts.db")
+    phonebook = PhoneBook(SQLiteBackend(database))
+    phonebook.add_contacts([("Alice", "1", ""), ("Bob", "2", "")])
+    phonebook.close()
+
+    phonebook = PhoneBook(SQLiteBackend(database))
+    assert len(phonebook) == 2
+    phonebook.close()
+
+
+def test_fuzzy_find(sqlite_phonebook):
+    results = sqlite_phonebook.fuzzy_find("alise")
+    assert results[0][0].id == 1
@@ -0,0 +1,99 @@
+import json
+import os
+import pytest
+from src.exceptions import FileError
+from src.model_phonebook import PhoneBook
+from src.storage import JsonLinesStorage, write_json_array
+
+
+@pytest.fixture
+def storage(tmp_path) -> JsonLinesStorage:
+    """Fixture for creating a JSON Lines storage with two contacts."""
+    storage = JsonLinesStorage(str(tmp_path / "contacts.jsonl"))
+    storage.write([
+        {"id": 1, "name": "Alice", "phone": "12345", "comment": "Friend"},
+        {"id": 2, "name": "Bob", "phone": "67890", "comment": "Colleague"},
+    ])
+    return storage
+
+
+def test_write_json_array(tmp_path):
+    file_path = tmp_path / "contacts.json"
+    write_json_array(str(file_path), ({"id": i} for i in range(3)))
+    assert json.loads(file_path.read_text()) == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert not (tmp_path / "contacts.json.tmp").exists()
+
+
+def test_iter_contacts_applies_log(storage):
+    storage.append([
+        {"op": "put", "contact": {"id": 1, "name": "Alicia", "phone": "12345", "comment": "Friend"}},
+        {"op": "delete", "id": 2},
+        {"op": "put", "contact": {"id": 3, "name": "Carol", "phone": "555", "comment": ""}},
+    ])
+    assert [row["name"] for row in storage.iter_contacts()] == ["Alicia", "Carol"]
+
+
+def test_compact_merges_log(storage):
+    storage.append([{"op": "delete", "id": 1}])
+    storage.compact()
+    assert not os.path.exists(storage.log_name)
+    with open(storage.file_name) as file:
+        assert [json.loads(line)["id"] for line in file] == [2]
+
+
+def test_background_compaction(tmp_path):
+    storage = JsonLinesStorage(str(tmp_path / "contacts.jsonl"), compact_threshold=2)
+    storage.append([{"op": "put", "contact": {"id": i, "name": str(i)}} for i in range(1, 4)])
+    storage.wait()
+    assert [row["id"] for row in storage.iter_contacts()] == [1, 2, 3]
+    with open(storage.file_name) as file:
+        assert len(file.readlines()) == 3
+
+
+def test_torn_log_line_is_ignored(storage):
+    with open(storage.log_name, "w") as file:
+        file.write('{"op": "delete", "id": 1}\n{"op": "del')
+    assert [row["id"] for row in storage.iter_contacts()] == [2]
+
+
+def test_append_after_torn_log_line(storage):
+    with open(storage.log_name, "w") as file:
+        file.write('{"op": "delete", "id": 1}\n{"op": "del')
+    storage.append([{"op": "put", "contact": {"id": 3, "name": "Carol", "phone": "555", "comment": ""}}])
+    assert [row["id"] for row in storage.iter_contacts()] == [2, 3]
+
+
+def test_broken_log_line_in_the_middle(storage):
+    with open(storage.log_name, "w") as file:
+        file.write('{"op": "delete", "id": 1}\n{"op": "del\n{"op": "delete", "id": 2}\n')
+    with pytest.raises(FileError):
+        list(storage.iter_contacts())
+
+
+def test_save_after_torn_log_line(tmp_path):
+    file_name = str(tmp_path / "contacts.jsonl")
+    phonebook = PhoneBook()
+    for name in "abc":
+        phonebook.add_contact(name, "1", "")
+    phonebook.save_to_file(file_name)
+    phonebook.add_contact("x", "1", "")
+    phonebook.save_to_file(file_name)
+    # A crash in the middle of the last append
+    with open(f"{file_name}.wal", "rb+") as file:
+        file.truncate(os.path.getsize(f"{file_name}.wal") - 5)
+
+    phonebook = PhoneBook()
+    phonebook.load_from_file(file_name)
+    phonebook.add_contact("d", "1", "")
+    phonebook.save_to_file(file_name)
+
+    reloaded = PhoneBook()
+    reloaded.load_from_file(file_name)
+    assert [contact.name for contact in reloaded.iter_contacts()] == ["a", "b", "c", "d"]
+
+
+def test_invalid_snapshot(tmp_path):
+    file_path = tmp_path / "contacts.jsonl"
+    file_path.write_text("{invalid_json\n")
+    with pytest.raises(FileError):
+        list(JsonLinesStorage(str(file_path)).iter_contacts())
@@ -1,5 +1,6 @@
 import pytest
 from src import view
+from src.model_contact import Contact
 
 
 def test_display_menu(capture_output):
@@ -47,3 +48,27 @@ def test_show_contacts(capture_output, contacts, expected_outputs):
     output = capture_output(view.show_contacts, contacts)
     for expected in expected_outputs:
         assert expected in output
+
+
+def test_show_contacts_paged(monkeypatch, capture_output):
+    """Test for paging through contacts."""
+    contacts = [Contact(i, f"Name {i}", str(i), "") for i in range(1, 6)]
+    inputs = iter(["n", "s -id", "7", "q"])
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+
+    output = capture_output(view.show_contacts_paged, iter(contacts), 5, 2)
+    lines = output.splitlines()
+
+    assert lines[:2] == [str(contacts[0]), str(contacts[1])]
+    assert "-- Page 1 of 3 --" in output
+    assert str(contacts[3]) in lines
+    assert "-- Page 1 of 3, sorted by id (descending) --" in output
+    assert lines.index(str(contacts[4])) > lines.index("-- Page 2 of 3 --")
+    assert "Page 7 does not exist." in output
+
+
+def test_show_contacts_paged_single_page(monkeypatch, capture_output):
+    """A single page is shown without a prompt."""
+    monkeypatch.setattr("builtins.input", lambda _: pytest.fail("unexpected prompt"))
+    output = capture_output(view.show_contacts_paged, [Contact(1, "Alice", "12345", "Friend")])
+    assert output == "ID: 1, Name: Alice, Phone: 12345, Comment: Friend"
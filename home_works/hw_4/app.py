@@ -7,14 +7,28 @@ import uvicorn
 import os
 import pandas as pd
 
-from routers.page_router import page_router
-from routers.product_router import product_router
+from routers.page_router import page_router, page_cache
+from services.static_assets import SOURCE_DIR, ImmutableStaticFiles, static_directory
+from routers.product_router import product_router, catalog
 
 # Create a FastAPI application
 app = FastAPI()
 
-# Configure the static directory for images
-app.mount("/pictures", StaticFiles(directory="pictures"), name="pictures")
+# Configure the static directory for images: original pictures and their
+# content-hashed variants built by `python -m services.static_assets`
+app.mount("/pictures", ImmutableStaticFiles(directory=SOURCE_DIR), name="pictures")
+app.mount("/static", ImmutableStaticFiles(directory=static_directory()), name="static")
+
+# Parse the product workbook and compile the templates before the first request instead of during it
+@app.on_event("startup")
+async def load_catalog():
+    page_cache.precompile()
+    await catalog.refresh_async()
+
+# Stop the thread that loads the workbook, dropping loads that have not started yet
+@app.on_event("shutdown")
+async def close_catalog():
+    catalog.close()
 
 # Include the page routers for pages
 app.include_router(page_router)
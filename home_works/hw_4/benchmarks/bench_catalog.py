@@ -0,0 +1,68 @@
+"""
+Latency of loading one category: parsing the workbook or reading the compiled
+Arrow artifact per request vs the cached catalog.
+
+Run from the hw_4 directory:
+    python -m benchmarks.bench_catalog --requests 200
+"""
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+import pandas as pd
+
+from services.catalog import ProductCatalog
+from services.catalog_artifact import compile_products, read_products
+from routers.product_router import EXCEL_FILE_PATH
+
+
+def load_uncached(category: str):
+    """The original per-request path: parse, mask, convert to dicts."""
+    df = pd.read_excel(EXCEL_FILE_PATH, sheet_name=0)
+    df = df[df["category"] == category]
+    return df.to_dict(orient="records")
+
+
+def load_from_artifact(path, category):
+    """The per-request path, but reading the memory-mapped artifact."""
+    df = read_products(path)
+    df = df[df["category"] == category]
+    return df.to_dict(orient="records")
+
+
+def measure(func, categories, requests):
+    timings = []
+    for i in range(requests):
+        start = time.perf_counter()
+        func(categories[i % len(categories)])
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200, help="requests per variant")
+    args = parser.parse_args()
+
+    catalog = ProductCatalog(EXCEL_FILE_PATH)
+    categories = sorted({product["category"] for product in catalog.get_products()})
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Compile a copy, so the benchmark does not leave an artifact next to the real workbook
+        path = os.path.join(directory, "products.xlsx")
+        shutil.copy(EXCEL_FILE_PATH, path)
+        compile_products(path)
+
+        for title, func in (("pd.read_excel per request", load_uncached),
+                            ("Arrow artifact per request", lambda category: load_from_artifact(path, category)),
+                            ("ProductCatalog (cached)", catalog.get_products)):
+            p50, p99 = measure(func, categories, args.requests)
+            print(f"{title:<28}p50 {p50 * 1000:>9.3f} ms   p99 {p99 * 1000:>9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Name filtering in one category: list-of-dicts scan vs the columnar ProductStore.
+
+Run from the hw_4 directory:
+    python -m benchmarks.bench_store --rows 100000
+"""
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from services.product_store import ProductStore
+
+CATEGORIES = ["oils", "filters", "batteries", "lights", "tools", "wipers", "parts", "cosmetics", "accessories"]
+WORDS = ["Oil", "Air", "Fuel", "Cabin", "Car", "Truck", "Motorcycle", "Solar", "Lithium", "Gel", "Brake", "Gear"]
+
+
+def generate_products(rows, seed=42):
+    rnd = random.Random(seed)
+    return pd.DataFrame({
+        "name": [f"{rnd.choice(WORDS)} {rnd.choice(WORDS).lower()} {i}" for i in range(rows)],
+        "price": [round(rnd.uniform(10, 10_000), 2) for _ in range(rows)],
+        "description": ["" for _ in range(rows)],
+        "image_url": ["/pictures/logo.png" for _ in range(rows)],
+        "stock": [rnd.randrange(100) for _ in range(rows)],
+        "category": [rnd.choice(CATEGORIES) for _ in range(rows)],
+    })
+
+
+def best_time(func, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000, help="number of products")
+    args = parser.parse_args()
+
+    df = generate_products(args.rows)
+    records = df.to_dict(orient="records")
+    by_category = {}
+    for product in records:
+        by_category.setdefault(product["category"], []).append(product)
+    store = ProductStore(df)
+
+    for query, prefix in (("gel 12", False), ("truck", False), ("lithium", True)):
+        def scan():
+            name = query.lower()
+            products = by_category["oils"]
+            if prefix:
+                return [product for product in products if product["name"].lower().startswith(name)]
+            return [product for product in products if name in product["name"].lower()]
+
+        def columnar():
+            return store.search("oils", query, prefix)
+
+        assert scan() == columnar()
+        kind = "prefix" if prefix else "substring"
+        print(f"{kind:<10}{query!r:<12}{len(columnar()):>7} hits"
+              f"  scan {best_time(scan) * 1000:>8.3f} ms  columnar {best_time(columnar) * 1000:>8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Load test of the catalog under concurrent clients while the workbook keeps changing.
+
+Every client sends requests in a loop, as an async handler would; the
+workbook's mtime is bumped periodically to force reloads. The blocking
+variant parses inside the coroutine like the original handler did, the
+async variant uses the worker thread with a single in-flight load.
+
+Run from the hw_4 directory:
+    python -m benchmarks.load_catalog --clients 100 --requests 50
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from services.catalog import ProductCatalog
+from routers.product_router import EXCEL_FILE_PATH
+
+
+def percentile(timings, fraction):
+    return timings[min(len(timings) - 1, int(len(timings) * fraction))]
+
+
+async def run(variant, path, clients, requests, reload_interval):
+    catalog = ProductCatalog(path)
+    catalog.refresh()
+    categories = sorted(catalog.categories)
+    loads = 0
+    load = catalog._load
+
+    def counting_load(mtime):
+        nonlocal loads
+        loads += 1
+        load(mtime)
+
+    catalog._load = counting_load
+
+    async def handler(category):
+        if variant == "blocking":
+            return catalog.get_products(category)
+        return await catalog.get_products_async(category)
+
+    timings = []
+
+    async def client(number):
+        for i in range(requests):
+            start = time.perf_counter()
+            await handler(categories[(number + i) % len(categories)])
+            timings.append(time.perf_counter() - start)
+            # Think time between requests of one client
+            await asyncio.sleep(0.001)
+
+    async def touch():
+        while True:
+            await asyncio.sleep(reload_interval)
+            os.utime(path, ns=(time.time_ns(), time.time_ns()))
+
+    toucher = asyncio.create_task(touch())
+    start = time.perf_counter()
+    await asyncio.gather(*(client(number) for number in range(clients)))
+    elapsed = time.perf_counter() - start
+    toucher.cancel()
+
+    timings.sort()
+    print(f"{variant:<10}{len(timings) / elapsed:>10.0f} req/s"
+          f"  p50 {statistics.median(timings) * 1000:>8.2f} ms"
+          f"  p95 {percentile(timings, 0.95) * 1000:>8.2f} ms"
+          f"  p99 {percentile(timings, 0.99) * 1000:>8.2f} ms"
+          f"  loads {loads}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=100, help="concurrent clients")
+    parser.add_argument("--requests", type=int, default=50, help="requests per client")
+    parser.add_argument("--reload-interval", type=float, default=0.2, help="seconds between workbook changes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "products.xlsx")
+        shutil.copy(EXCEL_FILE_PATH, path)
+        for variant in ("blocking", "async"):
+            asyncio.run(run(variant, path, args.clients, args.requests, args.reload_interval))
+
+
+if __name__ == "__main__":
+    main()
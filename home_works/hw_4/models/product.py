@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, HttpUrl, field_validator
-from typing import Optional
+from typing import List, Optional
 
 class Product(BaseModel):
     name: str = Field(..., min_length=3, max_length=100, description="Название продукта")
@@ -25,4 +25,12 @@ class Product(BaseModel):
     def validate_category(cls, value):
         if not value.isalpha():
             raise ValueError("Категория должна содержать только буквы")
-        return value.capitalize()
\ No newline at end of file
+        return value.capitalize()
+
+
+class ProductPage(BaseModel):
+    items: List[dict] = Field(..., description="Продукты страницы")
+    total: int = Field(..., description="Количество всех найденных продуктов")
+    limit: int = Field(..., description="Наибольшее количество продуктов на странице")
+    offset: int = Field(..., description="Номер первого продукта страницы")
+    next_offset: Optional[int] = Field(None, description="offset следующей страницы, null на последней")
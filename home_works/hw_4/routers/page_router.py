@@ -5,34 +5,46 @@ from fastapi.staticfiles import StaticFiles
 
 import os
 
+from services.page_cache import PageCache
+from services.static_assets import AssetManifest
+
 # Initialize the router for page
 page_router = APIRouter()
 
 # Configure the templates directory
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "../templates"))
+TEMPLATES_DIR = os.path.join(BASE_DIR, "../templates")
+templates = Jinja2Templates(directory=TEMPLATES_DIR)
+
+# Picture URLs in templates point to the built, content-hashed files
+assets = AssetManifest()
+assets.register(templates)
+
+# These pages never change between requests, so they are rendered once
+# and revalidated with ETag/Last-Modified; rebuilt pictures change their URLs
+page_cache = PageCache(templates, TEMPLATES_DIR, watch=[assets.path])
 
 # Route for the home page
 @page_router.get("/", response_class=HTMLResponse)
 async def index(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request, "title": "Главная страница"})
+    return page_cache.response(request, "index.html", {"title": "Главная страница"})
 
 # Route for the "Contacts" page
 @page_router.get("/contacts/", response_class=HTMLResponse)
 async def contacts(request: Request):
-    return templates.TemplateResponse("contact.html", {"request": request, "title": "Контакты"})
+    return page_cache.response(request, "contact.html", {"title": "Контакты"})
 
 # Route for the "Delivery" page
 @page_router.get("/delivery/", response_class=HTMLResponse)
 async def delivery(request: Request):
-    return templates.TemplateResponse("delivery.html", {"request": request, "title": "Доставка"})
+    return page_cache.response(request, "delivery.html", {"title": "Доставка"})
 
 # Route for the "How to Get There" page
 @page_router.get("/map/", response_class=HTMLResponse)
 async def map(request: Request):
-    return templates.TemplateResponse("map.html", {"request": request, "title": "Как добраться"})
+    return page_cache.response(request, "map.html", {"title": "Как добраться"})
 
 # Route for the "About Us" page
 @page_router.get("/about/", response_class=HTMLResponse)
 async def about(request: Request):
-    return templates.TemplateResponse("about.html", {"request": request, "title": "О нас"})
\ No newline at end of file
+    return page_cache.response(request, "about.html", {"title": "О нас"})
\ No newline at end of file
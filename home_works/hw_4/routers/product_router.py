@@ -1,47 +1,85 @@
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.templating import Jinja2Templates
-import pandas as pd
 import os
 
+from models.product import ProductPage
+from services.catalog import ProductCatalog
+from routers.page_router import assets
+
 # Initialize router for products
 product_router = APIRouter()
 
 # Jinja configuration for templates
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # Configuring the templates directory
 templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "../templates"))
+assets.register(templates)
 
 EXCEL_FILE_PATH = os.path.join(BASE_DIR, "../products.xlsx")
 
+# Products are parsed once and served from memory until the workbook changes
+catalog = ProductCatalog(EXCEL_FILE_PATH)
+
+# Default and largest number of products on one page
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
 # Function to load product data from Excel by category
-def load_products_from_excel(category: str = None):
+async def load_products_from_excel(category: str = None, name: str = None, prefix: bool = False,
+                                   offset: int = 0, limit: int = None):
     try:
-        # Load the Excel file
-        df = pd.read_excel(EXCEL_FILE_PATH, sheet_name=0)
-        
-        # Filter by category if specified
-        if category:
-            df = df[df["category"] == category]
-        
-        # Convert to a list of dictionaries
-        products = df.to_dict(orient="records")
-        return products
+        # Prebuilt slice of the category, the workbook is re-read (in a worker thread) only when modified
+        return await catalog.get_page_async(category, name, prefix, offset, limit)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading data from Excel: {str(e)}")
 
 
+# Chooses JSON over HTML if the client prefers application/json in its Accept header
+def wants_json(request: Request) -> bool:
+    quality = {}
+    for media_range in request.headers.get("accept", "").split(","):
+        media_type, *params = [part.strip() for part in media_range.split(";")]
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        quality[media_type.lower()] = max(q, quality.get(media_type.lower(), 0.0))
+    return quality.get("application/json", 0.0) > quality.get("text/html", 0.0)
+
+
 # General function to display product page by category
-@product_router.get("/{category}", response_class=HTMLResponse)
-async def get_category_page(request: Request, category: str, name: str = None):
+# JSON is described by ProductPage, HTML is added as the other media type of the same response
+@product_router.get("/{category}",
+                    response_class=ORJSONResponse,
+                    response_model=ProductPage,
+                    responses={200: {"content": {"text/html": {}},
+                                     "description": "HTML page of the category, or JSON if the Accept header prefers it"}})
+async def get_category_page(request: Request,
+                            category: str,
+                            name: str = None,
+                            prefix: bool = False,
+                            limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+                            offset: int = Query(0, ge=0)):
     try:
-        # Load products for the specified category
-        products = load_products_from_excel(category)
-        
-        # If name is specified, filter products by name
-        if name:
-            products = [product for product in products if name.lower() in product["name"].lower()]
-        
-        # Return page with products for the given category
-        return templates.TemplateResponse(f"{category}.html", {"request": request, "products": products, "title": category.capitalize()})
+        # Load one page of products for the specified category, filtered by name if it is specified
+        products, total = await load_products_from_excel(category, name, prefix, offset, limit)
+        next_offset = offset + limit if offset + limit < total else None
+
+        if wants_json(request):
+            # orjson serializes the product dictionaries (including NaN as null) much faster than json
+            response = ORJSONResponse({"items": products, "total": total, "limit": limit,
+                                       "offset": offset, "next_offset": next_offset})
+        else:
+            # Return page with products for the given category
+            response = templates.TemplateResponse(f"{category}.html", {
+                "request": request, "products": products, "title": category.capitalize(),
+                "total": total, "limit": limit, "offset": offset, "next_offset": next_offset})
+        # The same URL returns HTML or JSON depending on the Accept header
+        response.headers["Vary"] = "Accept"
+        return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from services.catalog_artifact import artifact_path, read_products
+from services.product_store import ProductStore
+
+
+logger = logging.getLogger(__name__)
+
+
+class ProductCatalog:
+    """
+    Product catalog parsed from the Excel workbook once and kept in memory.
+
+    Products are put into a columnar ProductStore when the workbook is
+    loaded, so a request only searches a prebuilt category slice. They are
+    read from the compiled Arrow artifact when it is up to date (see
+    services.catalog_artifact), and read again only after the workbook or
+    the artifact changes.
+
+    Async handlers should use get_products_async: parsing then runs in a
+    worker thread, and concurrent requests share a single in-flight load.
+    While a changed workbook is being reloaded, requests are served from
+    the previous version.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        # Modification times of the workbook and its compiled artifact that were loaded
+        self._version: Optional[Tuple[int, int]] = None
+        self._store: Optional[ProductStore] = None
+        # Started on the first async load; one worker is enough, as loads are coalesced
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[asyncio.Future] = None
+
+    def get_products(self, category: str = None, name: str = None, prefix: bool = False) -> List[dict]:
+        """
+        Returns the products of a category, or all products.
+
+        The product dictionaries are shared between requests and must not be modified.
+
+        Args:
+            category: Category of the products, all products if empty.
+            name: Case-insensitive part of the product name to filter by.
+            prefix: Match only names starting with `name`.
+        """
+        self.refresh()
+        return self._select(category, name, prefix)
+
+    async def get_products_async(self, category: str = None, name: str = None, prefix: bool = False) -> List[dict]:
+        """
+        Same as get_products, without blocking the event loop.
+        """
+        await self.refresh_async()
+        return self._select(category, name, prefix)
+
+    async def get_page_async(self,
+                             category: str = None,
+                             name: str = None,
+                             prefix: bool = False,
+                             offset: int = 0,
+                             limit: Optional[int] = None) -> Tuple[List[dict], int]:
+        """
+        Returns one page of get_products and the number of all matching products.
+        """
+        await self.refresh_async()
+        if self._store is None:
+            return [], 0
+        return self._store.page(category, name, prefix, offset, limit)
+
+    @property
+    def categories(self) -> List[str]:
+        return self._store.categories if self._store is not None else []
+
+    def refresh(self) -> None:
+        """
+        Reloads the workbook if it changed since the last load.
+        """
+        version = self._current_version()
+        if version != self._version:
+            self._reload(version)
+
+    async def refresh_async(self) -> None:
+        """
+        Reloads the workbook in a worker thread if it changed since the last load.
+
+        Requests arriving while a load is running share it instead of
+        starting another one. Only the first load is awaited; later ones
+        run in the background while the previous data is served.
+        """
+        version = self._current_version()
+        if version == self._version:
+            return
+        if self._pending is None:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="catalog")
+            loop = asyncio.get_running_loop()
+            self._pending = loop.run_in_executor(self._executor, self._reload, version)
+            self._pending.add_done_callback(self._clear_pending)
+        if self._version is None:
+            # A cancelled request must not cancel the load other requests wait for
+            await asyncio.shield(self._pending)
+
+    def close(self) -> None:
+        """
+        Stops the worker thread, waiting for a running load to finish.
+
+        A later async load starts a new worker.
+        """
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _clear_pending(self, future: asyncio.Future) -> None:
+        if self._pending is future:
+            self._pending = None
+        if not future.cancelled() and future.exception() is not None:
+            # The next request retries, as the workbook is still newer than the data
+            logger.warning("Failed to reload %s: %s", self.path, future.exception())
+
+    def _current_version(self) -> Tuple[int, int]:
+        artifact = artifact_path(self.path)
+        artifact_mtime = os.stat(artifact).st_mtime_ns if os.path.exists(artifact) else 0
+        return os.stat(self.path).st_mtime_ns, artifact_mtime
+
+    def _select(self, category: Optional[str], name: Optional[str], prefix: bool) -> List[dict]:
+        if self._store is None:
+            return []
+        return self._store.search(category, name, prefix)
+
+    def _reload(self, version: Tuple[int, int]) -> None:
+        with self._lock:
+            # Another thread may have reloaded the workbook while we waited
+            if version != self._version:
+                self._load(version)
+
+    def _load(self, version: Tuple[int, int]) -> None:
+        store = ProductStore(read_products(self.path))
+        # Swap the new store in before the version, so readers never see a half-built catalog
+        self._store = store
+        self._version = version
@@ -0,0 +1,111 @@
+import hashlib
+import os
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import HTMLResponse, Response
+from fastapi.templating import Jinja2Templates
+
+
+class CachedPage(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: str
+    # Modification time (seconds) the Last-Modified header was built from
+    timestamp: int
+
+
+class PageCache:
+    """
+    Cache of rendered pages whose output depends only on the template and its context.
+
+    Every page is rendered once and served with ETag and Last-Modified, so
+    browsers revalidate it and get 304 Not Modified. The templates directory
+    (and any extra `watch` files) is checked for changes at most once per
+    CHECK_INTERVAL seconds; on change the rendered pages are dropped and
+    the templates compiled again.
+    """
+
+    CHECK_INTERVAL = 1.0
+
+    def __init__(self, templates: Jinja2Templates, directory: str, watch: Iterable[str] = ()):
+        self.templates = templates
+        self.directory = directory
+        self.watch = list(watch)
+        self._pages: Dict[Tuple, CachedPage] = {}
+        self._mtimes: Dict[str, int] = {}
+        self._checked = float("-inf")
+
+    def precompile(self) -> None:
+        """
+        Compiles all templates, so the first requests do not pay for it.
+        """
+        self._check_templates(force=True)
+
+    def response(self, request: Request, name: str, context: dict) -> Response:
+        """
+        Returns the rendered page, or 304 if the client already has it.
+
+        Args:
+            request: Incoming request with the conditional headers.
+            name: Template file name.
+            context: Template variables; must not include the request.
+        """
+        page = self._get(name, context)
+        headers = {
+            "ETag": page.etag,
+            "Last-Modified": page.last_modified,
+            # Cache, but revalidate on every visit so template changes show up
+            "Cache-Control": "no-cache",
+        }
+        if self._not_modified(request, page):
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(page.body, headers=headers)
+
+    def _get(self, name: str, context: dict) -> CachedPage:
+        self._check_templates()
+        key = (name, tuple(sorted(context.items())))
+        page = self._pages.get(key)
+        if page is None:
+            body = self.templates.get_template(name).render(context).encode()
+            timestamp = max(self._mtimes.values(), default=0) // 10 ** 9
+            page = CachedPage(body=body,
+                              etag=f'"{hashlib.sha1(body).hexdigest()}"',
+                              last_modified=formatdate(timestamp, usegmt=True),
+                              timestamp=timestamp)
+            self._pages[key] = page
+        return page
+
+    def _check_templates(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._checked < self.CHECK_INTERVAL:
+            return
+        self._checked = now
+        mtimes = {entry.path: entry.stat().st_mtime_ns
+                  for entry in os.scandir(self.directory) if entry.is_file()}
+        for path in self.watch:
+            if os.path.exists(path):
+                mtimes[path] = os.stat(path).st_mtime_ns
+        if force or mtimes != self._mtimes:
+            self._mtimes = mtimes
+            self._pages.clear()
+            env = self.templates.env
+            for name in env.list_templates():
+                env.get_template(name)
+
+    @staticmethod
+    def _not_modified(request: Request, page: CachedPage) -> bool:
+        if_none_match: Optional[str] = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or page.etag in tags
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return parsedate_to_datetime(if_modified_since).timestamp() >= page.timestamp
+            except (TypeError, ValueError):
+                return False
+        return False
@@ -0,0 +1,79 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class ProductStore:
+    """
+    Read-only columnar product table.
+
+    Rows are sorted by category, so every category is a contiguous slice
+    found through a dictionary. Every field is kept as a NumPy column and
+    dictionaries are built only for the rows of the returned page.
+    Lowercase names are kept in one more column, and name search runs
+    vectorized over the slice of one category.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        df = df.sort_values("category", kind="stable").reset_index(drop=True)
+        self._fields: List[str] = [str(field) for field in df.columns]
+        self._columns: List[np.ndarray] = [df[field].to_numpy() for field in df.columns]
+        self._size = len(df)
+        self._names = df["name"].astype(str).str.lower().to_numpy(dtype=str)
+        self._slices: Dict[str, slice] = {
+            category: slice(int(rows[0]), int(rows[-1]) + 1)
+            for category, rows in df.groupby("category", sort=False).indices.items()
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self._slices)
+
+    def search(self, category: Optional[str] = None, name: Optional[str] = None, prefix: bool = False) -> List[dict]:
+        """
+        Returns products of a category whose name contains (or starts with) `name`.
+
+        Args:
+            category: Category to search in, all products if empty.
+            name: Case-insensitive part of the name, no filtering if empty.
+            prefix: Match only names starting with `name`.
+        """
+        return self.page(category, name, prefix)[0]
+
+    def page(self,
+             category: Optional[str] = None,
+             name: Optional[str] = None,
+             prefix: bool = False,
+             offset: int = 0,
+             limit: Optional[int] = None) -> Tuple[List[dict], int]:
+        """
+        Same as search, but returns only `limit` products starting at `offset`.
+
+        Returns:
+            The products of the page and the number of all matching products.
+        """
+        rows = self._slices.get(category, slice(0, 0)) if category else slice(0, self._size)
+        if not name:
+            total = rows.stop - rows.start
+            start = rows.start + offset
+            stop = rows.stop if limit is None else min(rows.stop, start + limit)
+            return self._rows(slice(start, stop)), total
+        # A view of the category's names, not a copy
+        names = self._names[rows]
+        query = name.lower()
+        if prefix:
+            mask = np.char.startswith(names, query)
+        else:
+            mask = np.char.find(names, query) >= 0
+        matches = np.flatnonzero(mask)
+        selected = matches[offset:] if limit is None else matches[offset:offset + limit]
+        return self._rows(selected + rows.start), len(matches)
+
+    def _rows(self, index) -> List[dict]:
+        # tolist() turns NumPy scalars into the plain Python values templates and JSON expect
+        values = [column[index].tolist() for column in self._columns]
+        return [dict(zip(self._fields, row)) for row in zip(*values)]
@@ -0,0 +1,177 @@
+"""
+Builds content-hashed, resized and WebP variants of the pictures.
+
+Run from the hw_4 directory (needs Pillow):
+    python -m services.static_assets [--source pictures] [--output static]
+
+Every file gets a copy named `<name>.<hash>.<ext>`. Raster images also get
+WebP variants at the widths in WIDTHS (not wider than the original). The
+mapping from original names to built files is stored in manifest.json and
+used by the `asset_url` and `webp_srcset` template helpers.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+from typing import Dict, Optional
+
+from fastapi.staticfiles import StaticFiles
+from fastapi.templating import Jinja2Templates
+from starlette.responses import Response
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(BASE_DIR, "pictures")
+BUILD_DIR = os.path.join(BASE_DIR, "static")
+MANIFEST_NAME = "manifest.json"
+
+WIDTHS = (480, 960)
+WEBP_QUALITY = 80
+RASTER_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+# Built files can be cached forever: a new version gets a new name
+IMMUTABLE = "public, max-age=31536000, immutable"
+HASHED_NAME = re.compile(r"\.[0-9a-f]{12}(\.w\d+)?\.\w+$")
+
+logger = logging.getLogger(__name__)
+
+
+def hashed_name(name: str, data: bytes, suffix: str = "", extension: Optional[str] = None) -> str:
+    stem, original_extension = os.path.splitext(name)
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    return f"{stem}.{digest}{suffix}{extension or original_extension}"
+
+
+def build(source_dir: str = SOURCE_DIR, build_dir: str = BUILD_DIR) -> Dict[str, dict]:
+    """
+    Builds the variants of every file in source_dir and writes the manifest.
+
+    Returns:
+        The manifest: original name -> {"src", "width", "webp": {width: name}}.
+    """
+    from io import BytesIO
+
+    from PIL import Image
+
+    os.makedirs(build_dir, exist_ok=True)
+    manifest: Dict[str, dict] = {}
+    for name in sorted(os.listdir(source_dir)):
+        path = os.path.join(source_dir, name)
+        if not os.path.isfile(path):
+            continue
+        with open(path, "rb") as file:
+            data = file.read()
+        entry = {"src": hashed_name(name, data), "webp": {}}
+        shutil.copyfile(path, os.path.join(build_dir, entry["src"]))
+
+        if os.path.splitext(name)[1].lower() in RASTER_EXTENSIONS:
+            with Image.open(path) as image:
+                entry["width"] = image.width
+                widths = [width for width in WIDTHS if width < image.width] + [image.width]
+                for width in widths:
+                    variant = image.convert("RGBA" if "A" in image.getbands() or image.mode == "P" else "RGB")
+                    # Keeps the aspect ratio, the height limit never applies
+                    variant.thumbnail((width, image.height))
+                    buffer = BytesIO()
+                    variant.save(buffer, "WEBP", quality=WEBP_QUALITY, method=6)
+                    webp = buffer.getvalue()
+                    webp_name = hashed_name(name, webp, suffix=f".w{width}", extension=".webp")
+                    with open(os.path.join(build_dir, webp_name), "wb") as file:
+                        file.write(webp)
+                    entry["webp"][str(width)] = webp_name
+        manifest[name] = entry
+
+    tmp_path = os.path.join(build_dir, f"{MANIFEST_NAME}.tmp")
+    with open(tmp_path, "w") as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(tmp_path, os.path.join(build_dir, MANIFEST_NAME))
+    return manifest
+
+
+def static_directory(build_dir: str = BUILD_DIR, source_dir: str = SOURCE_DIR) -> str:
+    """
+    Returns the directory to serve under /static: the build, or the original pictures if it is missing.
+    """
+    if os.path.isdir(build_dir):
+        return build_dir
+    logger.warning("%s not found, serving %s under /static; run `python -m services.static_assets` "
+                   "to build the pictures and restart the app", build_dir, source_dir)
+    return source_dir
+
+
+class AssetManifest:
+    """
+    Maps picture names to the URLs of their built variants.
+
+    Without a built manifest the original files under /pictures are used.
+    The manifest is re-read when its file changes.
+    """
+
+    def __init__(self, build_dir: str = BUILD_DIR, build_url: str = "/static", source_url: str = "/pictures"):
+        self.path = os.path.join(build_dir, MANIFEST_NAME)
+        self.build_url = build_url
+        self.source_url = source_url
+        self._mtime: Optional[int] = None
+        self._entries: Dict[str, dict] = {}
+
+    def url(self, name: str) -> str:
+        entry = self._entry(name)
+        if entry is None:
+            return f"{self.source_url}/{name}"
+        return f"{self.build_url}/{entry['src']}"
+
+    def webp_srcset(self, name: str) -> str:
+        entry = self._entry(name)
+        if entry is None:
+            return ""
+        return ", ".join(f"{self.build_url}/{file} {width}w" for width, file in entry["webp"].items())
+
+    def register(self, templates: Jinja2Templates) -> None:
+        """
+        Makes `asset_url(name)` and `webp_srcset(name)` available in templates.
+        """
+        templates.env.globals["asset_url"] = self.url
+        templates.env.globals["webp_srcset"] = self.webp_srcset
+
+    def _entry(self, name: str) -> Optional[dict]:
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            self._mtime, self._entries = None, {}
+            return None
+        if mtime != self._mtime:
+            with open(self.path) as file:
+                self._entries = json.load(file)
+            self._mtime = mtime
+        return self._entries.get(name)
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """
+    StaticFiles with immutable caching of content-hashed files.
+
+    Range and conditional requests (If-None-Match/If-Modified-Since) are
+    handled by StaticFiles itself.
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if HASHED_NAME.search(os.path.basename(full_path)):
+            response.headers["Cache-Control"] = IMMUTABLE
+        return response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", default=SOURCE_DIR, help="directory with the original pictures")
+    parser.add_argument("--output", default=BUILD_DIR, help="directory for the built files")
+    args = parser.parse_args()
+    manifest = build(args.source, args.output)
+    print(f"Built {len(manifest)} files into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
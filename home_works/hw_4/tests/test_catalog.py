@@ -0,0 +1,100 @@
+import asyncio
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from services import catalog as catalog_module
+from services.catalog import ProductCatalog
+
+
+def products(name):
+    return pd.DataFrame({"name": [name], "price": [100.0], "category": ["oils"]})
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Replaces the workbook parser with a slow one returning the number of the load as the product name."""
+    calls = []
+
+    def read_products(path):
+        calls.append(threading.current_thread().name)
+        time.sleep(0.05)
+        return products(f"Oil {len(calls)}")
+
+    monkeypatch.setattr(catalog_module, "read_products", read_products)
+    return calls
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "products.xlsx"
+    path.write_bytes(b"")
+    return path
+
+
+def touch(path):
+    mtime = os.stat(path).st_mtime_ns + 10 ** 9
+    os.utime(path, ns=(mtime, mtime))
+
+
+def names(products):
+    return [product["name"] for product in products]
+
+
+def test_concurrent_refreshes_share_one_load(loads, workbook):
+    catalog = ProductCatalog(str(workbook))
+
+    async def requests():
+        return await asyncio.gather(*(catalog.get_products_async("oils") for _ in range(20)))
+
+    assert all(names(result) == ["Oil 1"] for result in asyncio.run(requests()))
+    assert len(loads) == 1 and loads[0].startswith("catalog")
+    catalog.close()
+
+
+def test_changed_mtime_triggers_reload(loads, workbook):
+    catalog = ProductCatalog(str(workbook))
+    assert names(catalog.get_products("oils")) == ["Oil 1"]
+    assert names(catalog.get_products("oils")) == ["Oil 1"]
+    touch(workbook)
+    assert names(catalog.get_products("oils")) == ["Oil 2"]
+    assert len(loads) == 2
+
+
+def test_reload_serves_previous_version(loads, workbook):
+    catalog = ProductCatalog(str(workbook))
+
+    async def requests():
+        first = await catalog.get_products_async("oils")
+        touch(workbook)
+        # The changed workbook is loaded in the background
+        during = await catalog.get_products_async("oils")
+        await catalog._pending
+        after = await catalog.get_products_async("oils")
+        return names(first), names(during), names(after)
+
+    assert asyncio.run(requests()) == (["Oil 1"], ["Oil 1"], ["Oil 2"])
+    catalog.close()
+
+
+def test_close_stops_the_worker(loads, workbook):
+    catalog = ProductCatalog(str(workbook))
+    asyncio.run(catalog.refresh_async())
+    executor = catalog._executor
+    catalog.close()
+    assert executor._shutdown
+    catalog.close()
+    touch(workbook)
+
+    async def reload():
+        await catalog.refresh_async()
+        await catalog._pending
+
+    # A later load starts a new worker
+    asyncio.run(reload())
+    assert catalog._executor is not executor
+    assert names(catalog.get_products("oils")) == ["Oil 2"]
+    catalog.close()
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+from fastapi.templating import Jinja2Templates
+from starlette.requests import Request
+
+from services.page_cache import PageCache
+
+
+def make_request(**headers):
+    return Request({"type": "http",
+                    "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]})
+
+
+@pytest.fixture
+def templates_dir(tmp_path):
+    (tmp_path / "page.html").write_text("<h1>{{ title }}</h1>")
+    return tmp_path
+
+
+@pytest.fixture
+def cache(templates_dir):
+    cache = PageCache(Jinja2Templates(directory=str(templates_dir)), str(templates_dir))
+    # Check the templates on every request
+    cache.CHECK_INTERVAL = 0
+    return cache
+
+
+def test_renders_page(cache):
+    response = cache.response(make_request(), "page.html", {"title": "Home"})
+    assert response.status_code == 200
+    assert response.body == b"<h1>Home</h1>"
+    assert response.headers["etag"] and response.headers["last-modified"]
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_not_modified_by_etag(cache):
+    etag = cache.response(make_request(), "page.html", {"title": "Home"}).headers["etag"]
+    for if_none_match in (etag, f'W/{etag}', f'"other", {etag}', "*"):
+        response = cache.response(make_request(if_none_match=if_none_match), "page.html", {"title": "Home"})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+    response = cache.response(make_request(if_none_match='"other"'), "page.html", {"title": "Home"})
+    assert response.status_code == 200
+
+
+def test_not_modified_since(cache):
+    last_modified = cache.response(make_request(), "page.html", {"title": "Home"}).headers["last-modified"]
+    response = cache.response(make_request(if_modified_since=last_modified), "page.html", {"title": "Home"})
+    assert response.status_code == 304
+    for if_modified_since in ("Thu, 01 Jan 1970 00:00:00 GMT", "not a date"):
+        response = cache.response(make_request(if_modified_since=if_modified_since), "page.html", {"title": "Home"})
+        assert response.status_code == 200
+
+
+def test_etag_takes_precedence_over_date(cache):
+    last_modified = cache.response(make_request(), "page.html", {"title": "Home"}).headers["last-modified"]
+    response = cache.response(make_request(if_none_match='"other"', if_modified_since=last_modified),
+                              "page.html", {"title": "Home"})
+    assert response.status_code == 200
+
+
+def test_template_change_drops_cached_pages(cache, templates_dir):
+    first = cache.response(make_request(), "page.html", {"title": "Home"})
+    path = templates_dir / "page.html"
+    path.write_text("<h2>{{ title }}</h2>")
+    mtime = os.stat(path).st_mtime_ns + 10 ** 9
+    os.utime(path, ns=(mtime, mtime))
+
+    second = cache.response(make_request(if_none_match=first.headers["etag"]), "page.html", {"title": "Home"})
+    assert second.status_code == 200
+    assert second.body == b"<h2>Home</h2>"
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.headers["last-modified"] != first.headers["last-modified"]
+
+
+def test_watched_file_change_drops_cached_pages(cache, templates_dir, tmp_path_factory):
+    manifest = tmp_path_factory.mktemp("static") / "manifest.json"
+    manifest.write_text("{}")
+    cache.watch.append(str(manifest))
+    first = cache.response(make_request(), "page.html", {"title": "Home"})
+    mtime = os.stat(manifest).st_mtime_ns + 10 ** 9
+    os.utime(manifest, ns=(mtime, mtime))
+    second = cache.response(make_request(), "page.html", {"title": "Home"})
+    assert second.headers["last-modified"] != first.headers["last-modified"]
@@ -0,0 +1,64 @@
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app import app
+from routers.product_router import MAX_LIMIT, wants_json
+
+
+def make_request(accept):
+    headers = [(b"accept", accept.encode())] if accept is not None else []
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, False),
+    ("*/*", False),
+    ("text/html", False),
+    ("application/json", True),
+    ("Application/JSON", True),
+    ("text/html, application/json", False),
+    ("text/html;q=0.9, application/json", True),
+    ("application/json;q=0.5, text/html;q=0.8", False),
+    ("application/json;q=abc, text/html;q=0.1", False),
+])
+def test_wants_json(accept, expected):
+    assert wants_json(make_request(accept)) == expected
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("query", [
+    "limit=0",
+    f"limit={MAX_LIMIT + 1}",
+    "limit=abc",
+    "offset=-1",
+])
+def test_invalid_limit_and_offset(client, query):
+    response = client.get(f"/api/products/oils?{query}", headers={"Accept": "application/json"})
+    assert response.status_code == 422
+
+
+def test_json_page(client):
+    response = client.get("/api/products/oils?limit=4&offset=8", headers={"Accept": "application/json"})
+    assert response.status_code == 200
+    assert response.headers["vary"] == "Accept"
+    page = response.json()
+    assert len(page["items"]) == page["total"] - 8
+    assert {product["category"] for product in page["items"]} == {"oils"}
+    assert (page["limit"], page["offset"], page["next_offset"]) == (4, 8, None)
+
+
+def test_html_page(client):
+    response = client.get("/api/products/oils?limit=4", headers={"Accept": "text/html"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+
+
+def test_openapi_describes_both_media_types():
+    response = app.openapi()["paths"]["/api/products/{category}"]["get"]["responses"]["200"]
+    assert response["content"]["application/json"]["schema"] == {"$ref": "#/components/schemas/ProductPage"}
+    assert "text/html" in response["content"]
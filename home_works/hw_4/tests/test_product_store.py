@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+from services.product_store import ProductStore
+
+
+@pytest.fixture
+def store():
+    return ProductStore(pd.DataFrame({
+        "name": ["Motor oil", "Gear oil", "Air filter", "Oil filter", "Cabin filter"],
+        "price": [100.0, 200.0, 300.0, 400.0, 500.0],
+        "stock": [1, 2, 3, 4, 5],
+        "category": ["oils", "oils", "filters", "filters", "filters"],
+    }))
+
+
+def names(products):
+    return [product["name"] for product in products]
+
+
+def test_categories(store):
+    assert len(store) == 5
+    assert sorted(store.categories) == ["filters", "oils"]
+
+
+@pytest.mark.parametrize("offset, limit, expected", [
+    (0, None, ["Air filter", "Oil filter", "Cabin filter"]),
+    (0, 2, ["Air filter", "Oil filter"]),
+    (2, 2, ["Cabin filter"]),
+    (3, 2, []),
+    (100, 2, []),
+])
+def test_page_bounds(store, offset, limit, expected):
+    products, total = store.page("filters", offset=offset, limit=limit)
+    assert names(products) == expected
+    assert total == 3
+
+
+@pytest.mark.parametrize("offset, limit, expected", [
+    (1, 1, ["Oil filter"]),
+    (2, 5, ["Cabin filter"]),
+    (3, 5, []),
+])
+def test_page_bounds_with_name(store, offset, limit, expected):
+    products, total = store.page("filters", "filter", offset=offset, limit=limit)
+    assert names(products) == expected
+    assert total == 3
+
+
+def test_page_by_prefix(store):
+    products, total = store.page("filters", "OIL", prefix=True)
+    assert names(products) == ["Oil filter"]
+    assert total == 1
+
+
+def test_page_of_unknown_category(store):
+    assert store.page("tools") == ([], 0)
+
+
+def test_page_returns_plain_values(store):
+    products, _ = store.page("oils", limit=1)
+    assert products == [{"name": "Motor oil", "price": 100.0, "stock": 1, "category": "oils"}]
+    assert type(products[0]["stock"]) is int
@@ -1,13 +1,39 @@
+import os
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from probes import ReadinessMonitor, register_env_probes
+
+# Dependency probes run in the background; /ready only reads their last results
+readiness = ReadinessMonitor(interval=float(os.environ.get("READY_INTERVAL", "5")),
+                             timeout=float(os.environ.get("READY_TIMEOUT", "2")))
+register_env_probes(readiness)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await readiness.start()
+    yield
+    await readiness.stop()
 
 # Create a FastAPI application
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
+# Liveness: the process is up and serving requests
 @app.get("/ping/")
 async def ping():
     return {"message": "pong"}
 
+# Readiness: all dependency probes passed in their last (recent) run
+@app.get("/ready")
+async def ready():
+    is_ready, checks = readiness.status()
+    return JSONResponse(status_code=200 if is_ready else 503,
+                        content={"status": "ready" if is_ready else "not ready", "checks": checks})
+
 # Entry point to run the application
 if __name__ == '__main__':
-    uvicorn.run("app:app", host='0.0.0.0', port=8000)
\ No newline at end of file
+    uvicorn.run("app:app", host='0.0.0.0', port=8000)
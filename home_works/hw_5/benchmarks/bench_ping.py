@@ -0,0 +1,221 @@
+"""
+Load test of the /ping/ endpoint under uvicorn.
+
+Starts the app in a uvicorn subprocess for every combination of the given
+event loops and HTTP implementations, drives it with keep-alive asyncio
+clients and prints the results as JSON: throughput and p50/p95/p99
+latency per configuration. With --baseline the results are compared with
+a previous run, and the exit code is 1 on a regression.
+
+Run from the hw_5 directory:
+    python -m benchmarks.bench_ping --workers 1 --loop asyncio uvloop --http h11 httptools \
+        --concurrency 100 --duration 10 --output ping.json
+"""
+import argparse
+import asyncio
+import importlib.util
+import itertools
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+HOST = "127.0.0.1"
+PATH = "/ping/"
+# Packages needed by uvicorn's --loop and --http options
+REQUIRED_PACKAGES = {"uvloop": "uvloop", "httptools": "httptools", "asyncio": None, "h11": "h11"}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, workers: int, loop: str, http: str) -> subprocess.Popen:
+    command = [sys.executable, "-m", "uvicorn", "app:app", "--host", HOST, "--port", str(port),
+               "--workers", str(workers), "--loop", loop, "--http", http, "--no-access-log", "--log-level", "warning"]
+    return subprocess.Popen(command, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+async def wait_ready(port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection(HOST, port)
+            await request(reader, writer, port)
+            writer.close()
+            return
+        except (OSError, asyncio.IncompleteReadError):
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"uvicorn did not start on port {port}")
+            await asyncio.sleep(0.1)
+
+
+async def request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, port: int) -> int:
+    """
+    Sends one keep-alive GET and reads the whole response.
+
+    Returns:
+        HTTP status code.
+    """
+    writer.write(f"GET {PATH} HTTP/1.1\r\nHost: {HOST}:{port}\r\n\r\n".encode())
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    length = 0
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def client(port: int, stop_at: float, latencies: List[float], errors: Dict[str, int]) -> None:
+    reader, writer = await asyncio.open_connection(HOST, port)
+    try:
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            try:
+                status = await request(reader, writer, port)
+            except (OSError, asyncio.IncompleteReadError) as e:
+                errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+                writer.close()
+                reader, writer = await asyncio.open_connection(HOST, port)
+                continue
+            if status == 200:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors[str(status)] = errors.get(str(status), 0) + 1
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Returns None when there are no values: NaN is not valid JSON and fails every comparison."""
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+async def drive(port: int, concurrency: int, duration: float, warmup: float) -> dict:
+    await wait_ready(port)
+    if warmup:
+        await asyncio.gather(*(client(port, time.perf_counter() + warmup, [], {}) for _ in range(concurrency)))
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, start + duration, latencies, errors) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def latency_ms(fraction: float) -> Optional[float]:
+        value = percentile(latencies, fraction)
+        return None if value is None else round(value * 1000, 3)
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {name: latency_ms(fraction)
+                       for name, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))},
+    }
+
+
+def run_configuration(args: argparse.Namespace, loop: str, http: str) -> dict:
+    configuration = {"workers": args.workers, "loop": loop, "http": http}
+    missing = [REQUIRED_PACKAGES[name] for name in (loop, http)
+               if REQUIRED_PACKAGES.get(name) and importlib.util.find_spec(REQUIRED_PACKAGES[name]) is None]
+    if missing:
+        return {**configuration, "skipped": f"not installed: {', '.join(missing)}"}
+    port = free_port()
+    server = start_server(port, args.workers, loop, http)
+    try:
+        return {**configuration, **asyncio.run(drive(port, args.concurrency, args.duration, args.warmup))}
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def regressions(results: List[dict], baseline: dict, tolerance: float) -> List[str]:
+    """
+    Lists configurations whose p99 grew or throughput dropped by more than `tolerance`.
+
+    A configuration measured in the baseline that is now skipped or has no
+    successful request is a regression too.
+    """
+    key = lambda result: (result["workers"], result["loop"], result["http"])
+    previous = {key(result): result for result in baseline.get("results", [])
+                if "rps" in result and result["latency_ms"]["p99"] is not None}
+    found = []
+    for result in results:
+        old = previous.get(key(result))
+        if old is None:
+            continue
+        name = "{}/{}/{}w".format(result["loop"], result["http"], result["workers"])
+        if "rps" not in result:
+            found.append(f"{name}: not measured ({result.get('skipped', 'no result')})")
+            continue
+        if result["latency_ms"]["p99"] is None:
+            found.append(f"{name}: no successful requests, errors {result['errors']}")
+            continue
+        if result["latency_ms"]["p99"] > old["latency_ms"]["p99"] * (1 + tolerance):
+            found.append(f"{name}: p99 {old['latency_ms']['p99']} -> {result['latency_ms']['p99']} ms")
+        if result["rps"] < old["rps"] * (1 - tolerance):
+            found.append(f"{name}: {old['rps']} -> {result['rps']} req/s")
+    return found
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--loop", nargs="+", default=["asyncio"], choices=["asyncio", "uvloop"])
+    parser.add_argument("--http", nargs="+", default=["h11"], choices=["h11", "httptools"])
+    parser.add_argument("--concurrency", type=int, default=100, help="concurrent keep-alive connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of measured load")
+    parser.add_argument("--warmup", type=float, default=2.0, help="seconds of load before measuring")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report of a previous run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed relative regression")
+    args = parser.parse_args()
+
+    results = [run_configuration(args, loop, http) for loop, http in itertools.product(args.loop, args.http)]
+    report = {
+        "endpoint": PATH,
+        "revision": git_revision(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            found = regressions(results, json.load(file), args.tolerance)
+        for line in found:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        sys.exit(1 if found else 0)
+
+
+if __name__ == "__main__":
+    main()
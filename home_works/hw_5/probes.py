@@ -0,0 +1,137 @@
+import asyncio
+import inspect
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Dict, Optional, Union
+
+# A probe returns normally when the dependency is usable and raises otherwise;
+# it may be a coroutine function or a blocking function (run in a thread)
+Check = Callable[[], Union[None, Awaitable[None]]]
+
+
+@dataclass
+class ProbeResult:
+    ok: bool
+    detail: str
+    duration_ms: float
+    checked_at: float
+
+
+class ReadinessMonitor:
+    """
+    Runs dependency probes in the background and keeps their latest results.
+
+    Probes run concurrently every `interval` seconds, each limited by
+    `timeout`. The readiness endpoint only reads the cached results, so a
+    slow or heavy check never delays it or runs more often because of
+    frequent polling. Results older than `max_age` count as failures, so a
+    stuck monitor does not report stale success.
+    """
+
+    def __init__(self, interval: float = 5.0, timeout: float = 2.0, max_age: Optional[float] = None):
+        self.interval = interval
+        self.timeout = timeout
+        self.max_age = max_age if max_age is not None else 3 * interval
+        self._probes: Dict[str, Check] = {}
+        self._results: Dict[str, ProbeResult] = {}
+        self._checked_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, check: Optional[Check] = None):
+        """
+        Registers a probe; usable as a decorator.
+
+        Example:
+            @monitor.register("db")
+            async def check_db():
+                await connection.execute("SELECT 1")
+        """
+        if check is None:
+            return lambda function: self.register(name, function)
+        self._probes[name] = check
+        return check
+
+    async def start(self) -> None:
+        """
+        Runs the probes once and keeps running them in the background.
+        """
+        await self.run_probes()
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> tuple:
+        """
+        Returns the cached readiness and per-probe results without running anything.
+
+        Returns:
+            (ready, {name: result dict})
+        """
+        now = time.time()
+        fresh = self._checked_at is not None and now - self._checked_at <= self.max_age
+        checks = {name: asdict(result) for name, result in self._results.items()}
+        ready = fresh and all(result.ok for result in self._results.values())
+        return ready, checks
+
+    async def run_probes(self) -> None:
+        names = list(self._probes)
+        results = await asyncio.gather(*(self._run_probe(self._probes[name]) for name in names))
+        # Replace all results at once, readers never see a mix of two rounds
+        self._results = dict(zip(names, results))
+        self._checked_at = time.time()
+
+    async def _run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.run_probes()
+
+    async def _run_probe(self, check: Check) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            if inspect.iscoroutinefunction(check):
+                await asyncio.wait_for(check(), self.timeout)
+            else:
+                await asyncio.wait_for(asyncio.to_thread(check), self.timeout)
+            ok, detail = True, "ok"
+        except asyncio.TimeoutError:
+            ok, detail = False, f"timed out after {self.timeout} s"
+        except Exception as e:
+            ok, detail = False, f"{type(e).__name__}: {e}"
+        duration_ms = round((time.perf_counter() - start) * 1000, 3)
+        return ProbeResult(ok=ok, detail=detail, duration_ms=duration_ms, checked_at=time.time())
+
+
+def tcp_probe(host: str, port: int) -> Check:
+    """
+    Creates a probe that succeeds if a TCP connection to host:port can be opened.
+    """
+    async def check() -> None:
+        _, writer = await asyncio.open_connection(host, port)
+        writer.close()
+        await writer.wait_closed()
+    return check
+
+
+def register_env_probes(monitor: ReadinessMonitor, variable: str = "READY_TCP_PROBES") -> None:
+    """
+    Registers TCP probes listed in an environment variable.
+
+    Format: `name=host:port,...`, e.g. `db=postgres:5432,cache=redis:6379`.
+
+    Raises:
+        ValueError: If an entry does not match the format, naming the variable and the entry.
+    """
+    for item in filter(None, (part.strip() for part in os.environ.get(variable, "").split(","))):
+        name, _, address = item.partition("=")
+        host, _, port = address.strip().rpartition(":")
+        if not name.strip() or not host or not port.isdigit() or not 0 < int(port) < 65536:
+            raise ValueError(f"{variable}: invalid probe {item!r}, expected name=host:port")
+        monitor.register(name.strip(), tcp_probe(host, int(port)))
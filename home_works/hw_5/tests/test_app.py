@@ -0,0 +1,47 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Probes of the app's monitor, restored after the test."""
+    monkeypatch.setattr(app_module.readiness, "_probes", {})
+    return app_module.readiness._probes
+
+
+def test_ping():
+    response = TestClient(app_module.app).get("/ping/")
+    assert response.json() == {"message": "pong"}
+
+
+def test_ready(probes):
+    probes["db"] = lambda: None
+    with TestClient(app_module.app) as client:
+        response = client.get("/ready")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ready"
+    assert body["checks"]["db"]["ok"] and body["checks"]["db"]["detail"] == "ok"
+
+
+def test_not_ready(probes):
+    def check_db():
+        raise ConnectionError("refused")
+
+    probes["db"] = check_db
+    with TestClient(app_module.app) as client:
+        response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "not ready"
+    assert response.json()["checks"]["db"]["detail"] == "ConnectionError: refused"
+
+
+def test_ready_reads_cached_results(probes):
+    calls = []
+    probes["db"] = lambda: calls.append("db")
+    with TestClient(app_module.app) as client:
+        for _ in range(5):
+            assert client.get("/ready").status_code == 200
+    assert calls == ["db"]
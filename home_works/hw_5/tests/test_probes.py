@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from probes import ReadinessMonitor, register_env_probes, tcp_probe
+
+
+def test_probe_results_are_cached():
+    calls = []
+    monitor = ReadinessMonitor(interval=60)
+
+    @monitor.register("db")
+    async def check_db():
+        calls.append("db")
+
+    async def main():
+        await monitor.start()
+        try:
+            for _ in range(10):
+                ready, checks = monitor.status()
+        finally:
+            await monitor.stop()
+        return ready, checks
+
+    ready, checks = asyncio.run(main())
+    # Reading the status never runs the probes again
+    assert calls == ["db"]
+    assert ready and checks["db"]["ok"] and checks["db"]["detail"] == "ok"
+
+
+def test_failed_and_slow_probes():
+    monitor = ReadinessMonitor(timeout=0.05)
+    monitor.register("ok", lambda: None)
+
+    @monitor.register("broken")
+    def check_broken():
+        raise ConnectionError("refused")
+
+    @monitor.register("slow")
+    async def check_slow():
+        await asyncio.sleep(1)
+
+    asyncio.run(monitor.run_probes())
+    ready, checks = monitor.status()
+    assert not ready
+    assert checks["ok"]["ok"]
+    assert checks["broken"] == {**checks["broken"], "ok": False, "detail": "ConnectionError: refused"}
+    assert not checks["slow"]["ok"] and checks["slow"]["detail"].startswith("timed out")
+
+
+def test_stale_results_are_not_ready(monkeypatch):
+    monitor = ReadinessMonitor(interval=1, max_age=10)
+    monitor.register("ok", lambda: None)
+    assert monitor.status() == (False, {})
+    asyncio.run(monitor.run_probes())
+    assert monitor.status()[0]
+    monkeypatch.setattr(monitor, "_checked_at", monitor._checked_at - 11)
+    assert not monitor.status()[0]
+
+
+def test_tcp_probe():
+    async def main():
+        server = await asyncio.start_server(lambda reader, writer: writer.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            await tcp_probe("127.0.0.1", port)()
+        with pytest.raises(OSError):
+            await tcp_probe("127.0.0.1", port)()
+
+    asyncio.run(main())
+
+
+def test_register_env_probes(monkeypatch):
+    monkeypatch.setenv("READY_TCP_PROBES", "db=postgres:5432, cache = redis:6379,")
+    monitor = ReadinessMonitor()
+    register_env_probes(monitor)
+    assert list(monitor._probes) == ["db", "cache"]
+
+
+@pytest.mark.parametrize("value", ["db:abc", "db", "db=postgres", "db=postgres:abc", "db=:5432",
+                                   "=postgres:5432", "db=postgres:0", "db=postgres:70000"])
+def test_register_env_probes_rejects_malformed_entries(monkeypatch, value):
+    monkeypatch.setenv("READY_TCP_PROBES", f"cache=redis:6379,{value}")
+    with pytest.raises(ValueError, match=f"READY_TCP_PROBES: invalid probe '{value}'"):
+        register_env_probes(ReadinessMonitor())
@@ -0,0 +1,73 @@
+"""
+Measures HttpClient against a local aiohttp stand-in server.
+
+Fetching the items of a slow endpoint with a new session per request (the
+old fetch_api) is timed against the shared client. The behaviour of the
+client (pagination, retries, the concurrency limit) is checked by
+tests/test_http_client.py. Run from the hw_6 directory:
+    python -m benchmarks.bench_http_client [--requests 500] [--delay 0.01]
+"""
+import argparse
+import asyncio
+import time
+
+import aiohttp
+from aiohttp import web
+
+from http_client import HttpClient
+
+HOST = "127.0.0.1"
+
+
+def make_app(delay: float) -> web.Application:
+    async def item(request: web.Request) -> web.Response:
+        await asyncio.sleep(delay)
+        return web.json_response({"id": int(request.match_info["id"])})
+
+    app = web.Application()
+    app.router.add_get("/item/{id}", item)
+    return app
+
+
+async def fetch_with_new_sessions(urls):
+    """The old fetch_api: a new session, connection and DNS lookup per request."""
+    async def fetch(url):
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                return await response.json()
+    return await asyncio.gather(*(fetch(url) for url in urls))
+
+
+async def run(requests: int, delay: float, concurrency: int) -> None:
+    runner = web.AppRunner(make_app(delay), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, HOST, 0).start()
+    base = f"http://{HOST}:{runner.addresses[0][1]}"
+    urls = [f"{base}/item/{i}" for i in range(requests)]
+    try:
+        async with HttpClient(concurrency=concurrency) as client:
+            start = time.perf_counter()
+            await client.get_many(urls)
+            shared = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await fetch_with_new_sessions(urls)
+        separate = time.perf_counter() - start
+        print(f"{requests} requests: shared client {shared:.3f} s ({requests / shared:,.0f} req/s), "
+              f"session per request {separate:.3f} s ({requests / separate:,.0f} req/s)")
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--delay", type=float, default=0.01, help="server latency of /item, seconds")
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.delay, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Measures how fast the bulk loader inserts synthetic users and posts.
+
+Needs the PostgreSQL from docker-compose.yml with the tables created. Every
+run happens in a transaction that is rolled back, so the database is left
+unchanged. Run from the hw_6 directory:
+    python -m benchmarks.bench_loader --posts 100000 [--copy]
+"""
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from bulk_loader import bulk_load_posts, bulk_load_users
+from config import db_url
+
+# Far above the ids of the jsonplaceholder data
+FIRST_ID = 10_000_000
+
+
+def make_data(users: int, posts: int):
+    users_data = [
+        {"id": FIRST_ID + i, "name": f"Bench User {i}", "username": f"bench_{i}", "email": f"bench_{i}@example.com"}
+        for i in range(users)
+    ]
+    posts_data = [
+        {"id": FIRST_ID + i, "userId": FIRST_ID + i % users, "title": f"Post {i}", "body": "lorem ipsum " * 20}
+        for i in range(posts)
+    ]
+    return users_data, posts_data
+
+
+async def run(users: int, posts: int, use_copy: bool) -> None:
+    users_data, posts_data = make_data(users, posts)
+    # SQL echo would dominate the timings
+    engine = create_async_engine(db_url, echo=False)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession)
+    try:
+        async with session_factory() as session:
+            async with session.begin() as transaction:
+                for report in (await bulk_load_users(session, users_data, use_copy),
+                               await bulk_load_posts(session, posts_data, use_copy)):
+                    print(report)
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--copy", action="store_true", help="load with COPY instead of INSERT")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(run(args.users, args.posts, args.copy))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import User, Post
+
+# asyncpg allows at most 32767 bind parameters per statement
+CHUNK_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LoadReport:
+    """Result of a bulk load into one table."""
+
+    table: str
+    received: int
+    inserted: int
+    seconds: float
+
+    @property
+    def skipped(self) -> int:
+        return self.received - self.inserted
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.received / self.seconds if self.seconds else float("inf")
+
+    def __str__(self):
+        return (f"{self.table}: {self.inserted} inserted, {self.skipped} skipped "
+                f"in {self.seconds:.3f} s ({self.rows_per_second:,.0f} rows/s)")
+
+
+def chunked(rows: Sequence, size: int = CHUNK_SIZE) -> Iterator[Sequence]:
+    """Splits rows into consecutive chunks of at most `size` items."""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def user_rows(users_data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Converts API users into rows of the users table."""
+    return [
+        {"id": user["id"], "name": user["name"], "username": user["username"], "email": user["email"]}
+        for user in users_data
+    ]
+
+
+def post_rows(posts_data: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Converts API posts into rows of the post table."""
+    return [
+        {"id": post["id"], "user_id": post["userId"], "title": post["title"], "body": post["body"]}
+        for post in posts_data
+    ]
+
+
+async def insert_ignore(session: AsyncSession, model, rows: Sequence[Dict[str, Any]],
+                        chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Inserts rows with multi-row INSERT ... ON CONFLICT DO NOTHING statements.
+
+    Rows that violate any unique constraint (already loaded) are skipped by
+    the database, so no existence checks are needed. Nothing is committed:
+    the caller owns the transaction.
+
+    Returns:
+        Number of inserted rows.
+    """
+    inserted = 0
+    for chunk in chunked(rows, chunk_size):
+        statement = insert(model).values(list(chunk)).on_conflict_do_nothing().returning(model.id)
+        result = await session.execute(statement)
+        inserted += len(result.scalars().all())
+    return inserted
+
+
+async def copy_insert_ignore(session: AsyncSession, model, rows: Sequence[Dict[str, Any]]) -> int:
+    """
+    Same as insert_ignore, but sends the rows with COPY through asyncpg.
+
+    COPY cannot skip conflicts, so the rows are copied into a temporary
+    table dropped on commit and moved with one INSERT ... SELECT ... ON
+    CONFLICT DO NOTHING. Faster than insert_ignore for large loads.
+
+    Returns:
+        Number of inserted rows.
+    """
+    if not rows:
+        return 0
+    table = model.__tablename__
+    staging = f"{table}_staging"
+    columns = list(rows[0])
+    column_list = ", ".join(columns)
+    await session.execute(text(
+        f"CREATE TEMPORARY TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+    ))
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        staging, records=[tuple(row[column] for column in columns) for row in rows], columns=columns
+    )
+    result = await session.execute(text(
+        f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {staging} "
+        f"ON CONFLICT DO NOTHING"
+    ))
+    await session.execute(text(f"DROP TABLE {staging}"))
+    return result.rowcount
+
+
+async def load_rows(session: AsyncSession, model, rows: Sequence[Dict[str, Any]],
+                    use_copy: bool = False) -> LoadReport:
+    """Loads rows into the model's table and measures the throughput."""
+    start = time.perf_counter()
+    if use_copy:
+        inserted = await copy_insert_ignore(session, model, rows)
+    else:
+        inserted = await insert_ignore(session, model, rows)
+    report = LoadReport(model.__tablename__, len(rows), inserted, time.perf_counter() - start)
+    logger.info("Loaded %s", report)
+    return report
+
+
+async def bulk_load_users(session: AsyncSession, users_data: Iterable[Dict[str, Any]],
+                          use_copy: bool = False) -> LoadReport:
+    """Inserts the users that are not in the database yet."""
+    return await load_rows(session, User, user_rows(users_data), use_copy)
+
+
+async def load_user_ids(session: AsyncSession) -> Set[int]:
+    """Reads the ids of all users."""
+    return set((await session.execute(select(User.id))).scalars().all())
+
+
+async def bulk_load_posts(session: AsyncSession, posts_data: Iterable[Dict[str, Any]],
+                          use_copy: bool = False, user_ids: Optional[Set[int]] = None) -> LoadReport:
+    """
+    Inserts the posts that are not in the database yet.
+
+    Posts of unknown users are skipped: the user ids are read once (or
+    passed in as `user_ids`) instead of being checked per post.
+    """
+    rows = post_rows(posts_data)
+    if user_ids is None:
+        user_ids = await load_user_ids(session)
+    known = [row for row in rows if row["user_id"] in user_ids]
+    if len(known) < len(rows):
+        logger.warning("Skipping %d posts of unknown users.", len(rows) - len(known))
+    return await load_rows(session, Post, known, use_copy)
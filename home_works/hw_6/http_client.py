@@ -0,0 +1,267 @@
+import asyncio
+import json
+import logging
+import random
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+import aiohttp
+
+# Responses worth retrying: rate limiting and temporary server failures
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+logger = logging.getLogger(__name__)
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = set("0123456789+-.eE")
+_LITERALS = ("null", "true", "false", "NaN", "Infinity", "-Infinity")
+
+
+def _is_truncated(text: str) -> bool:
+    """Tells whether more data could turn `text`, the tail of a failed decode, into valid JSON."""
+    text = text.lstrip(_WHITESPACE)
+    return (not text or set(text) <= _NUMBER_CHARS
+            or any(literal.startswith(text) for literal in _LITERALS))
+
+
+def _decode_element(buffer: str, position: int):
+    """
+    Decodes the array element at `position`.
+
+    Returns:
+        The element and the position after it, or None if the buffer ends
+        before the element does.
+
+    Raises:
+        ValueError: If the element is malformed.
+    """
+    try:
+        item, end = _decoder.raw_decode(buffer, position)
+    except json.JSONDecodeError as e:
+        # Inside a string the parser stops at its end or at a \uXXXX escape ending the buffer
+        if (e.msg.startswith("Unterminated string")
+                or (e.msg.startswith("Invalid \\uXXXX") and len(buffer) - e.pos <= 5)
+                or _is_truncated(buffer[e.pos:])):
+            return None
+        raise ValueError(f"Invalid element of the JSON array: {e.msg}") from e
+    # A number or a literal is complete only when a delimiter follows it
+    if not isinstance(item, (dict, list, str)) and (end == len(buffer) or buffer[end] not in _WHITESPACE + ",]"):
+        if set(buffer[end:]) <= _NUMBER_CHARS:
+            return None
+        raise ValueError(f"Invalid element of the JSON array: {buffer[position:end + 1]!r}")
+    return item, end
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """
+    Yields the elements of a top-level JSON array as its bytes arrive.
+
+    Only the current element is kept in memory, not the whole document.
+    Malformed input is reported as soon as it arrives.
+
+    Raises:
+        ValueError: If the data is not a single valid JSON array.
+    """
+    buffer = ""
+    position = 0
+    started = finished = False
+    # After an element a separator is due; after a comma another element
+    expect_separator = expect_element = False
+    pending = b""
+    async for chunk in chunks:
+        # A chunk may end in the middle of a multi-byte character
+        pending += chunk
+        try:
+            text = pending.decode()
+            pending = b""
+        except UnicodeDecodeError as e:
+            if e.end < len(pending):
+                raise ValueError("Response is not valid UTF-8") from e
+            text = pending[:e.start].decode()
+            pending = pending[e.start:]
+        buffer = buffer[position:] + text
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position == len(buffer):
+                break
+            char = buffer[position]
+            if finished:
+                raise ValueError("Unexpected data after the JSON array")
+            if not started:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                started = True
+                position += 1
+            elif expect_separator:
+                if char not in ",]":
+                    raise ValueError(f"Expected ',' or ']' between elements of the JSON array, got {char!r}")
+                finished = char == "]"
+                expect_separator = False
+                expect_element = char == ","
+                position += 1
+            elif char == "]" and not expect_element:
+                finished = True
+                position += 1
+            else:
+                decoded = _decode_element(buffer, position)
+                if decoded is None:
+                    # The element is not complete yet
+                    break
+                item, position = decoded
+                expect_separator = True
+                expect_element = False
+                yield item
+    if pending:
+        raise ValueError("Response is not valid UTF-8")
+    if not finished:
+        raise ValueError("Unexpected end of the JSON array")
+
+
+class HttpClient:
+    """
+    Reusable JSON HTTP client with one pooled aiohttp session.
+
+    All requests share the session, so keep-alive connections and resolved
+    DNS names are reused. At most `limit_per_host` connections are opened
+    per host and at most `concurrency` requests run at once; the rest wait
+    for a slot. Connection errors, timeouts and RETRY_STATUSES responses are
+    retried up to `retries` times with exponential backoff and jitter.
+
+    Example:
+        async with HttpClient(limit_per_host=10) as client:
+            users, posts = await client.get_many([USERS_DATA_URL, POSTS_DATA_URL])
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 10, concurrency: int = 20,
+                 retries: int = 3, backoff: float = 0.5, timeout: float = 10.0):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        # A stream may be paused by its consumer for any time, so only idle sockets time out
+        self.stream_timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "HttpClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host,
+                                             ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Fetches a URL and returns the decoded JSON body."""
+        data, _ = await self._get(url, params)
+        return data
+
+    async def get_many(self, urls: Iterable[str]) -> List[Any]:
+        """Fetches several URLs concurrently, results are in the order of the URLs."""
+        return list(await asyncio.gather(*(self.get_json(url) for url in urls)))
+
+    async def get_paginated(self, url: str, page_size: int = 50, page_param: str = "_page",
+                            limit_param: str = "_limit", max_pages: int = 1000) -> List[Any]:
+        """
+        Fetches all pages of a list endpoint and concatenates them in page order.
+
+        The first page is fetched alone. If the response has an X-Total-Count
+        header, all remaining pages are then fetched concurrently. Otherwise
+        pages are fetched in concurrent batches until a short page arrives.
+
+        Args:
+            url: Endpoint returning a JSON list per page.
+            page_size: Items requested per page.
+            page_param: Query parameter with the page number, starting from 1.
+            limit_param: Query parameter with the page size.
+            max_pages: Safety limit for endpoints without a total count.
+        """
+        def fetch(page: int):
+            return self._get(url, {page_param: page, limit_param: page_size})
+
+        items, headers = await fetch(1)
+        if len(items) < page_size:
+            return items
+
+        total = headers.get("X-Total-Count")
+        if total is not None:
+            last_page = min(max_pages, -(-int(total) // page_size))
+            for page_items, _ in await asyncio.gather(*(fetch(page) for page in range(2, last_page + 1))):
+                items.extend(page_items)
+            return items
+
+        page = 2
+        while page <= max_pages:
+            pages = range(page, min(page + self.concurrency, max_pages + 1))
+            for page_items, _ in await asyncio.gather(*(fetch(number) for number in pages)):
+                items.extend(page_items)
+                if len(page_items) < page_size:
+                    return items
+            page += len(pages)
+        return items
+
+    async def iter_items(self, url: str, params: Optional[Dict[str, Any]] = None,
+                         chunk_size: int = 64 * 1024) -> AsyncIterator[Any]:
+        """
+        Yields the items of a JSON list endpoint while the response is downloading.
+
+        The request holds a concurrency slot until the body is read. It is
+        not retried: items already yielded cannot be taken back. There is no
+        total timeout, since the consumer may pause the download; only
+        `stream_timeout` applies, to connecting and to each socket read.
+        """
+        self._check_started()
+        async with self._semaphore:
+            async with self._session.get(url, params=params, timeout=self.stream_timeout) as response:
+                response.raise_for_status()
+                async for item in iter_json_array(response.content.iter_chunked(chunk_size)):
+                    yield item
+
+    def _check_started(self) -> None:
+        if self._session is None:
+            raise RuntimeError("HttpClient is not started, use it as 'async with HttpClient() as client'")
+
+    async def _get(self, url: str, params: Optional[Dict[str, Any]] = None):
+        self._check_started()
+        attempt = 0
+        while True:
+            try:
+                # The slot is held only for the request itself, not while backing off
+                async with self._semaphore:
+                    async with self._session.get(url, params=params) as response:
+                        if response.status not in RETRY_STATUSES or attempt >= self.retries:
+                            response.raise_for_status()
+                            return await response.json(), response.headers
+                        delay = self._retry_after(response)
+                        reason = f"HTTP {response.status}"
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.retries:
+                    raise
+                delay = None
+                reason = f"{type(e).__name__}: {e}"
+            attempt += 1
+            if delay is None:
+                delay = self.backoff * 2 ** (attempt - 1) * (1 + random.random())
+            logger.warning("GET %s failed (%s), retry %d/%d in %.2f s", url, reason, attempt, self.retries, delay)
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _retry_after(response: aiohttp.ClientResponse) -> Optional[float]:
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return None
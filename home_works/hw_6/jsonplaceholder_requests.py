@@ -1,6 +1,6 @@
 import logging
-import aiohttp
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional
+from http_client import HttpClient
 
 # API URLs
 USERS_DATA_URL = "https://jsonplaceholder.typicode.com/users"
@@ -10,21 +10,29 @@ POSTS_DATA_URL = "https://jsonplaceholder.typicode.com/posts"
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def fetch_api(url: str) -> List[Dict[str, Any]]:
-    """Fetch data from the given API URL using aiohttp."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            response.raise_for_status()
-            return await response.json()
+async def fetch_api(url: str, client: Optional[HttpClient] = None) -> List[Dict[str, Any]]:
+    """Fetch data from the given API URL, through the shared client if one is given."""
+    if client is not None:
+        return await client.get_json(url)
+    async with HttpClient() as own_client:
+        return await own_client.get_json(url)
 
-async def fetch_users_data() -> List[Dict[str, Any]]:
+async def fetch_users_data(client: Optional[HttpClient] = None) -> List[Dict[str, Any]]:
     """Fetches user data from the API and returns the list of users."""
-    data = await fetch_api(USERS_DATA_URL)
+    data = await fetch_api(USERS_DATA_URL, client)
     logger.info("Fetched %d users", len(data))
     return data
 
-async def fetch_posts_data() -> List[Dict[str, Any]]:
+async def fetch_posts_data(client: Optional[HttpClient] = None) -> List[Dict[str, Any]]:
     """Fetches post data from the API and returns the list of posts."""
-    data = await fetch_api(POSTS_DATA_URL)
+    data = await fetch_api(POSTS_DATA_URL, client)
     logger.info("Fetched %d posts", len(data))
-    return data
\ No newline at end of file
+    return data
+
+def stream_users_data(client: HttpClient) -> AsyncIterator[Dict[str, Any]]:
+    """Yields users one by one while the response is downloading."""
+    return client.iter_items(USERS_DATA_URL)
+
+def stream_posts_data(client: HttpClient) -> AsyncIterator[Dict[str, Any]]:
+    """Yields posts one by one while the response is downloading."""
+    return client.iter_items(POSTS_DATA_URL)
@@ -1,10 +1,13 @@
 import asyncio
 import logging
+from typing import Optional, Set
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import select
-from models import Base, User, Post
-from jsonplaceholder_requests import fetch_users_data, fetch_posts_data
+from models import Base
+from bulk_loader import LoadReport, bulk_load_users, bulk_load_posts, load_user_ids
+from http_client import HttpClient
+from jsonplaceholder_requests import stream_users_data, stream_posts_data
+from pipeline import run_pipeline
 from config import db_url, db_echo
 
 # Database connection settings
@@ -15,60 +18,14 @@ AsyncSessionLocal = sessionmaker(bind=engine, class_=AsyncSession, expire_on_com
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def create_user(session: AsyncSession, user_data: dict):
-    """Creates and saves a user to the database if they do not already exist"""
-    existing_user = await session.execute(select(User).where(User.username == user_data["username"]))
-    if existing_user.scalars().first():
-        logger.info(f"User {user_data['username']} already exists. Skipping.")
-        return None
-
-    user = User(
-        id=user_data["id"],
-        name=user_data["name"],
-        username=user_data["username"],
-        email=user_data["email"]
-    )
-    
-    session.add(user)
-    await session.commit()
-    logger.info(f"User {user_data['username']} added to the database.")
-    return user
-
-async def create_post(session: AsyncSession, post_data: dict):
-    """Creates and saves a post if the user exists"""
-    existing_user = await session.execute(select(User.id).where(User.id == post_data["userId"]))
-    user_id = existing_user.scalars().first()
-
-    if not user_id:
-        logger.warning(f"User with ID {post_data['userId']} not found. Skipping post.")
-        return
-
-    existing_post = await session.execute(select(Post).where(Post.id == post_data["id"]))
-    if existing_post.scalars().first():
-        logger.info(f"Post with ID {post_data['id']} already exists. Skipping.")
-        return
-
-    post = Post(
-        id=post_data["id"],  # Use the ID from the API
-        user_id=user_id,
-        title=post_data["title"],
-        body=post_data["body"]
-    )
-    session.add(post)
-    await session.commit()
-    logger.info(f"Post '{post_data['title']}' added to the database.")
-
-async def save_users_to_db(session: AsyncSession, users_data: list):
-    """Adds all users to the database"""
-    for user_data in users_data:
-        await create_user(session, user_data)
-    logger.info(f"Saved {len(users_data)} users to the database.")
-
-async def save_posts_to_db(session: AsyncSession, posts_data: list):
-    """Adds all posts to the database"""
-    for post_data in posts_data:
-        await create_post(session, post_data)
-    logger.info(f"Saved {len(posts_data)} posts to the database.")
+async def save_users_to_db(session: AsyncSession, users_data: list, use_copy: bool = False) -> LoadReport:
+    """Adds the new users to the database in chunked INSERT ... ON CONFLICT DO NOTHING statements"""
+    return await bulk_load_users(session, users_data, use_copy)
+
+async def save_posts_to_db(session: AsyncSession, posts_data: list, use_copy: bool = False,
+                           user_ids: Optional[Set[int]] = None) -> LoadReport:
+    """Adds the new posts of known users to the database in chunked statements; `user_ids` saves reading them"""
+    return await bulk_load_posts(session, posts_data, use_copy, user_ids)
 
 async def initialize_database():
     """Creates tables in the database if they do not exist"""
@@ -76,18 +33,51 @@ async def initialize_database():
         await conn.run_sync(Base.metadata.create_all)
     logger.info("Database initialized.")
 
+async def stream_to_db(client: HttpClient):
+    """
+    Streams users and posts from the API into the database.
+
+    Both responses are parsed while they download and loaded in batches,
+    each batch in its own transaction. Posts need their users, so post
+    batches wait until all users are loaded; meanwhile the bounded queue
+    pauses the posts download.
+
+    A failed run leaves the batches committed before the failure in the
+    database. Rerunning is safe: rows that are already there are skipped
+    by ON CONFLICT DO NOTHING, so a rerun only adds the missing ones.
+    """
+    async def load_users(batch: list) -> LoadReport:
+        async with AsyncSessionLocal() as session, session.begin():
+            return await save_users_to_db(session, batch)
+
+    users_task = asyncio.create_task(run_pipeline("users", stream_users_data(client), load_users))
+
+    async def known_user_ids() -> set:
+        await users_task
+        async with AsyncSessionLocal() as session:
+            return await load_user_ids(session)
+
+    user_ids_task = asyncio.create_task(known_user_ids())
+
+    async def load_posts(batch: list) -> LoadReport:
+        # Shielded: a cancelled consumer must not cancel the shared task
+        user_ids = await asyncio.shield(user_ids_task)
+        async with AsyncSessionLocal() as session, session.begin():
+            return await save_posts_to_db(session, batch, user_ids=user_ids)
+
+    try:
+        return await asyncio.gather(users_task, run_pipeline("post", stream_posts_data(client), load_posts))
+    finally:
+        users_task.cancel()
+        user_ids_task.cancel()
+
 async def main():
-    """Main function: loads data and saves it to the database"""
+    """Main function: streams the data from the API into the database"""
     await initialize_database()
 
-    users_data, posts_data = await asyncio.gather(
-        fetch_users_data(),
-        fetch_posts_data()
-    )
-
-    async with AsyncSessionLocal() as session:
-        await save_users_to_db(session, users_data)
-        await save_posts_to_db(session, posts_data)
+    # One pooled session for all requests
+    async with HttpClient() as client:
+        await stream_to_db(client)
 
     logger.info("Data successfully loaded into the database.")
 
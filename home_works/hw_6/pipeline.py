@@ -0,0 +1,80 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from bulk_loader import CHUNK_SIZE, LoadReport
+
+# Batches waiting for a consumer; when full, the producer stops reading the response
+QUEUE_SIZE = 4
+CONSUMERS = 2
+
+Batch = List[Dict[str, Any]]
+LoadBatch = Callable[[Batch], Awaitable[LoadReport]]
+
+logger = logging.getLogger(__name__)
+
+
+async def produce(items: AsyncIterator[Dict[str, Any]], queue: asyncio.Queue, batch_size: int,
+                  consumers: int) -> None:
+    """Groups the items into batches and puts them on the queue, then one None per consumer."""
+    batch: Batch = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            # Waits while the queue is full: the network read pauses until the DB catches up
+            await queue.put(batch)
+            batch = []
+    if batch:
+        await queue.put(batch)
+    for _ in range(consumers):
+        await queue.put(None)
+
+
+async def consume(queue: asyncio.Queue, load_batch: LoadBatch) -> List[int]:
+    """Loads batches from the queue until None arrives; returns [received, inserted]."""
+    totals = [0, 0]
+    while True:
+        batch: Optional[Batch] = await queue.get()
+        if batch is None:
+            return totals
+        report = await load_batch(batch)
+        totals[0] += report.received
+        totals[1] += report.inserted
+
+
+async def run_pipeline(table: str, items: AsyncIterator[Dict[str, Any]], load_batch: LoadBatch,
+                       batch_size: int = CHUNK_SIZE, queue_size: int = QUEUE_SIZE,
+                       consumers: int = CONSUMERS) -> LoadReport:
+    """
+    Streams items into the database while they are still being fetched.
+
+    A producer collects the items into batches of `batch_size` and puts
+    them on a bounded queue; `consumers` tasks take batches and load them
+    with `load_batch`, each in its own transaction. At most
+    `queue_size + consumers` batches are in memory at any time, whatever
+    the size of the source. If any task fails, the others are cancelled
+    and the error is raised.
+
+    Returns:
+        Totals of all batches, timed from the first read to the last write.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    start = time.perf_counter()
+    producer = asyncio.create_task(produce(items, queue, batch_size, consumers))
+    workers = [asyncio.create_task(consume(queue, load_batch)) for _ in range(consumers)]
+    tasks = [producer, *workers]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            task.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    received = sum(worker.result()[0] for worker in workers)
+    inserted = sum(worker.result()[1] for worker in workers)
+    report = LoadReport(table, received, inserted, time.perf_counter() - start)
+    logger.info("Streamed %s", report)
+    return report
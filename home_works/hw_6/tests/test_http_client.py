@@ -0,0 +1,216 @@
+import asyncio
+import json
+import threading
+from collections import Counter
+from typing import Tuple
+
+import aiohttp
+import pytest
+from aiohttp import web
+from http_client import HttpClient, iter_json_array
+
+HOST = "127.0.0.1"
+TOTAL_ITEMS = 237
+FAILURES_BEFORE_SUCCESS = 2
+
+
+async def iter_chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def parse(data: bytes, chunk_size: int = 1) -> list:
+    async def collect():
+        return [item async for item in iter_json_array(iter_chunks(data, chunk_size))]
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+def test_iter_json_array_split_chunks(chunk_size):
+    items = [{"id": 1, "tags": ["a", "b"]}, "text", 12, -1.5e3, None, True, False, [], {}]
+    data = json.dumps(items, indent=2).encode()
+    assert parse(data, chunk_size) == items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+def test_iter_json_array_split_multibyte_characters(chunk_size):
+    items = ["Алиса", "\U0001d11e", {"ключ": "ሴ"}]
+    data = json.dumps(items, ensure_ascii=False).encode()
+    assert parse(data, chunk_size) == items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3])
+def test_iter_json_array_split_escapes(chunk_size):
+    assert parse(br'["\u1234", "\ud834\udd1e", "\"\\"]', chunk_size) == ["\u1234", "\U0001d11e", '"\\']
+
+
+@pytest.mark.parametrize("data", [b"[]", b" [ ] \n", b"[1]\n"])
+def test_iter_json_array_whitespace(data):
+    assert parse(data) == json.loads(data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"[1 2]",
+        b"[,,1]",
+        b"[1,,2]",
+        b"[1,]",
+        b"[1]garbage",
+        b"[1]]",
+        b"[nul]",
+        b"[truex]",
+        b"[1.x]",
+        b'[{"a" 1}]',
+        b'["\\u12G4"]',
+        b"[1",
+        b"",
+        b'{"a": 1}',
+        b"[\xff]",
+        b'["\xd0"]',
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 1024])
+def test_iter_json_array_malformed(data, chunk_size):
+    with pytest.raises(ValueError):
+        parse(data, chunk_size)
+
+
+def test_iter_json_array_fails_before_reading_the_rest():
+    read = []
+
+    async def chunks():
+        for chunk in (b"[1, nul", b"]", b", 2" * 1000, b"]"):
+            read.append(chunk)
+            yield chunk
+
+    async def collect():
+        return [item async for item in iter_json_array(chunks())]
+
+    with pytest.raises(ValueError, match="Invalid element"):
+        asyncio.run(collect())
+    assert len(read) == 2
+
+
+def make_app() -> Tuple[web.Application, dict]:
+    """A stand-in for jsonplaceholder: paginated items, a flaky endpoint and a slow one."""
+    state = {"in_flight": 0, "max_in_flight": 0, "failures": Counter()}
+
+    async def items(request: web.Request) -> web.Response:
+        page = int(request.query.get("_page", 1))
+        limit = int(request.query.get("_limit", TOTAL_ITEMS))
+        start = (page - 1) * limit
+        data = [{"id": i} for i in range(start + 1, min(start + limit, TOTAL_ITEMS) + 1)]
+        headers = {} if "no_total" in request.query else {"X-Total-Count": str(TOTAL_ITEMS)}
+        return web.json_response(data, headers=headers)
+
+    async def flaky(request: web.Request) -> web.Response:
+        key = request.match_info["key"]
+        if state["failures"][key] < FAILURES_BEFORE_SUCCESS:
+            state["failures"][key] += 1
+            return web.json_response({"error": "unavailable"}, status=503, headers={"Retry-After": "0"})
+        return web.json_response({"key": key})
+
+    async def item(request: web.Request) -> web.Response:
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+            return web.json_response({"id": int(request.match_info["id"])})
+        finally:
+            state["in_flight"] -= 1
+
+    app = web.Application()
+    app.router.add_get("/items", items)
+    app.router.add_get("/flaky/{key}", flaky)
+    app.router.add_get("/item/{id}", item)
+    return app, state
+
+
+@pytest.fixture
+def server():
+    """Fixture for the stand-in server, run on its own event loop in a thread; yields (base url, state)."""
+    app, state = make_app()
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(app, access_log=None)
+
+    async def start() -> str:
+        await runner.setup()
+        await web.TCPSite(runner, HOST, 0).start()
+        port = runner.addresses[0][1]
+        return f"http://{HOST}:{port}"
+
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    base = asyncio.run_coroutine_threadsafe(start(), loop).result()
+    yield base, state
+    asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def with_client(action, **options):
+    """Runs `action(client)` with a started HttpClient and returns its result."""
+    async def run():
+        async with HttpClient(backoff=0.01, **options) as client:
+            return await action(client)
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("query", ["", "?no_total=1"])
+def test_get_paginated(server, query):
+    base, _ = server
+    items = with_client(lambda client: client.get_paginated(f"{base}/items{query}", page_size=20))
+    assert [item["id"] for item in items] == list(range(1, TOTAL_ITEMS + 1))
+
+
+def test_get_paginated_single_page(server):
+    base, _ = server
+    items = with_client(lambda client: client.get_paginated(f"{base}/items", page_size=TOTAL_ITEMS + 1))
+    assert len(items) == TOTAL_ITEMS
+
+
+def test_get_many_retries_after_503(server):
+    base, state = server
+    results = with_client(lambda client: client.get_many([f"{base}/flaky/{key}" for key in "abc"]))
+    assert [result["key"] for result in results] == list("abc")
+    assert state["failures"] == {key: FAILURES_BEFORE_SUCCESS for key in "abc"}
+
+
+def test_get_json_gives_up_after_last_retry(server):
+    base, state = server
+    with pytest.raises(aiohttp.ClientResponseError) as error:
+        with_client(lambda client: client.get_json(f"{base}/flaky/d"), retries=1)
+    assert error.value.status == 503
+    assert state["failures"]["d"] == 2
+
+
+def test_get_many_keeps_request_order(server):
+    base, _ = server
+    urls = [f"{base}/item/{i}" for i in range(100)]
+    results = with_client(lambda client: client.get_many(reversed(urls)))
+    assert [result["id"] for result in results] == list(range(99, -1, -1))
+
+
+@pytest.mark.parametrize("concurrency", [1, 5])
+def test_get_many_concurrency_limit(server, concurrency):
+    base, state = server
+    urls = [f"{base}/item/{i}" for i in range(30)]
+    with_client(lambda client: client.get_many(urls), concurrency=concurrency)
+    assert state["max_in_flight"] == concurrency
+
+
+def test_iter_items(server):
+    base, _ = server
+
+    async def collect(client):
+        return [item async for item in client.iter_items(f"{base}/items", chunk_size=16)]
+
+    items = with_client(collect)
+    assert [item["id"] for item in items] == list(range(1, TOTAL_ITEMS + 1))
+
+
+def test_client_not_started():
+    with pytest.raises(RuntimeError):
+        asyncio.run(HttpClient().get_json(f"http://{HOST}/"))
@@ -1,6 +1,68 @@
+import os
+from dataclasses import dataclass, fields
+
+
+def parse_setting(kind, value: str):
+    """Converts an environment value to bool, float or int."""
+    if kind in (bool, "bool"):
+        return value.strip().lower() in ("1", "true", "yes", "on")
+    if kind in (float, "float"):
+        return float(value)
+    return int(value)
+
+
+def env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    return default if value is None else parse_setting(bool, value)
+
+
 # Retrieve database connection string and echo setting from environment variables
-db_url = "postgresql+asyncpg://user:password@db:5432/blog"
-db_echo = True
+db_url = os.getenv("DB_URL", "postgresql+asyncpg://user:password@db:5432/blog")
+# SQL logging slows every query down; enable with DB_ECHO=1 when debugging
+db_echo = env_bool("DB_ECHO", False)
+
+
+@dataclass(frozen=True)
+class EngineSettings:
+    """Connection pool and driver settings of the async engine."""
+
+    url: str = db_url
+    echo: bool = db_echo
+    # Connections kept open, and extra ones allowed under load
+    pool_size: int = 5
+    max_overflow: int = 10
+    # Seconds to wait for a free connection before failing
+    pool_timeout: float = 30.0
+    # Reconnect connections older than this, before the server or a proxy drops them
+    pool_recycle: int = 1800
+    # Test connections when taken from the pool (one round-trip per checkout)
+    pool_pre_ping: bool = True
+    # Prepared statements SQLAlchemy caches per asyncpg connection; 0 turns off
+    # this cache and asyncpg's own one, as pgbouncer in transaction mode requires
+    statement_cache_size: int = 100
+
+    @classmethod
+    def from_env(cls, prefix: str = "DB_") -> "EngineSettings":
+        """
+        Reads the settings from DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT,
+        DB_POOL_RECYCLE, DB_POOL_PRE_PING and DB_STATEMENT_CACHE_SIZE.
+
+        Raises:
+            ValueError: If a variable is not a number, naming the variable.
+        """
+        values = {}
+        for field in fields(cls):
+            if field.name in ("url", "echo"):
+                continue
+            name = prefix + field.name.upper()
+            value = os.getenv(name)
+            if value is not None:
+                try:
+                    values[field.name] = parse_setting(field.type, value)
+                except ValueError:
+                    raise ValueError(f"{name}: invalid value {value!r}") from None
+        return cls(**values)
+
 
 # Naming conventions for database objects
 convention = {
@@ -10,3 +72,6 @@ convention = {
     "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
     "pk": "pk_%(table_name)s",
 }
+
+# Enables GET /benchmark/engine, which puts load on the database
+benchmark_enabled = env_bool("DB_BENCHMARK_ENABLED", False)
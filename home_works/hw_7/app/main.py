@@ -1,11 +1,26 @@
 from fastapi import FastAPI
-from app.routers import users, posts
-from app.services.data_loader import main as load_data
+from app.routers import (
+    users,
+    posts,
+    tags,
+    publication_tag_association,
+    import_status,
+    benchmark,
+)
+from app.services.import_job import import_job
 
 app = FastAPI(title="FastAPI Project")
 
 app.include_router(users.router, prefix="/users", tags=["Users"])
 app.include_router(posts.router, prefix="/posts", tags=["Posts"])
+app.include_router(tags.router, prefix="/tags", tags=["Tags"])
+app.include_router(
+    publication_tag_association.router,
+    prefix="/publication-tags",
+    tags=["Publication Tags"],
+)
+app.include_router(import_status.router, prefix="/import", tags=["Import"])
+app.include_router(benchmark.router, prefix="/benchmark", tags=["Benchmark"])
 
 
 @app.get("/")
@@ -15,4 +30,10 @@ async def root():
 
 @app.on_event("startup")
 async def startup_event():
-    await load_data()
+    # The import runs in the background, the app serves requests right away
+    import_job.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await import_job.stop()
@@ -1,9 +1,9 @@
-from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy import create_engine, event, MetaData
 from sqlalchemy.orm import DeclarativeBase, declared_attr, Mapped, mapped_column
 import asyncpg
 
 from app.config import db_url, convention
+from app.services.database import engine
 
 
 class Base(DeclarativeBase):
@@ -19,12 +19,6 @@ class Base(DeclarativeBase):
         return cls.__name__.lower()
 
 
-engine = create_async_engine(
-    db_url,
-    echo=True,  # Enable echo for debugging
-)
-
-
 def set_foreign_keys_on(dbapi_conn, connection_record):
     """Enable foreign key constraints for SQLite."""
     if "sqlite:///" not in db_url:
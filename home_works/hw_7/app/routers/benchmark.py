@@ -0,0 +1,41 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from app.config import benchmark_enabled
+from app.services.engine_benchmark import DEFAULT_VARIANTS, compare
+
+router = APIRouter()
+
+MAX_REQUESTS = 20_000
+MAX_CONCURRENCY = 500
+# Every variant runs all the requests again
+MAX_VARIANTS = 5
+
+
+@router.get("/engine")
+async def benchmark_engine(
+    requests: int = Query(2000, ge=1, le=MAX_REQUESTS),
+    concurrency: int = Query(50, ge=1, le=MAX_CONCURRENCY),
+    variant: Optional[List[str]] = Query(
+        None,
+        description="Settings to compare with the current ones, "
+        f"e.g. pool_size=20,statement_cache_size=0; repeatable up to {MAX_VARIANTS} "
+        "times",
+    ),
+):
+    """
+    Compares query throughput and latency of engines with different settings.
+
+    Disabled unless DB_BENCHMARK_ENABLED is set: it loads the database.
+    """
+    if not benchmark_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if variant and len(variant) > MAX_VARIANTS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {MAX_VARIANTS} variants are allowed"
+        )
+    try:
+        results = await compare(variant or DEFAULT_VARIANTS, requests, concurrency)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"requests": requests, "concurrency": concurrency, "results": results}
@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from app.services.import_job import import_job
+
+router = APIRouter()
+
+
+@router.get("/")
+async def get_import_status():
+    return import_job.progress()
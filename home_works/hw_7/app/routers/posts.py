@@ -1,14 +1,44 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload, selectinload
 from app.models.post import Post
+from app.schemas import Page, PostRead, TagRead, UserRead
 from app.services.database import get_db
+from app.services.eager_loading import Include, entity_query, parse_include, to_item
+from app.services.pagination import PageParams, keyset_page, selected_fields
 
 router = APIRouter()
 
+INCLUDES = {
+    "user": Include(Post.user, joinedload, UserRead),
+    "tags": Include(Post.tags, selectinload, TagRead, many=True),
+}
+INCLUDE_QUERY = Query(None, description="Related objects to embed: user,tags")
+
+
+@router.get("/", response_model=Page[PostRead], response_model_exclude_unset=True)
+async def get_posts(
+    params: PageParams = Depends(),
+    include: Optional[str] = INCLUDE_QUERY,
+    db: AsyncSession = Depends(get_db),
+):
+    includes = parse_include(include, INCLUDES)
+    return await keyset_page(db, Post, PostRead, params, includes)
+
 
-@router.get("/")
-async def get_posts(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Post))
-    posts = result.scalars().all()
-    return posts
+@router.get("/{post_id}", response_model=PostRead, response_model_exclude_unset=True)
+async def get_post(
+    post_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated fields"),
+    include: Optional[str] = INCLUDE_QUERY,
+    db: AsyncSession = Depends(get_db),
+):
+    names = selected_fields(fields, PostRead, Post)
+    includes = parse_include(include, INCLUDES)
+    query = entity_query(Post, names, includes).where(Post.id == post_id)
+    post = (await db.execute(query)).unique().scalar_one_or_none()
+    if post is None:
+        raise HTTPException(status_code=404, detail="Post not found")
+    return to_item(post, PostRead, names, includes)
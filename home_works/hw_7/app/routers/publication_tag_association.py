@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 from app.models.publication_tag_association import PostTagAssociation
+from app.schemas import Page, PostTagAssociationRead
 from app.services.database import get_db
+from app.services.pagination import PageParams, keyset_page
 
 router = APIRouter()
 
 
-@router.get("/")
-async def get_publication_tag_association(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(PostTagAssociation))
-    return result.scalars().all()
+@router.get(
+    "/", response_model=Page[PostTagAssociationRead], response_model_exclude_unset=True
+)
+async def get_publication_tag_association(
+    params: PageParams = Depends(), db: AsyncSession = Depends(get_db)
+):
+    return await keyset_page(db, PostTagAssociation, PostTagAssociationRead, params)
@@ -1,14 +1,13 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 from app.models.tag import Tag
+from app.schemas import Page, TagRead
 from app.services.database import get_db
+from app.services.pagination import PageParams, keyset_page
 
 router = APIRouter()
 
 
-@router.get("/")
-async def get_tags(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Tag))
-    tags = result.scalars().all()
-    return tags
+@router.get("/", response_model=Page[TagRead], response_model_exclude_unset=True)
+async def get_tags(params: PageParams = Depends(), db: AsyncSession = Depends(get_db)):
+    return await keyset_page(db, Tag, TagRead, params)
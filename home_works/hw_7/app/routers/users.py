@@ -1,14 +1,13 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 from app.models.user import User
+from app.schemas import Page, UserRead
 from app.services.database import get_db
+from app.services.pagination import PageParams, keyset_page
 
 router = APIRouter()
 
 
-@router.get("/")
-async def get_users(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(User))
-    users = result.scalars().all()
-    return users
+@router.get("/", response_model=Page[UserRead], response_model_exclude_unset=True)
+async def get_users(params: PageParams = Depends(), db: AsyncSession = Depends(get_db)):
+    return await keyset_page(db, User, UserRead, params)
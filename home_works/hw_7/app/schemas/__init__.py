@@ -0,0 +1,5 @@
+from .page import Page
+from .user import UserRead
+from .post import PostRead
+from .tag import TagRead
+from .publication_tag_association import PostTagAssociationRead
@@ -0,0 +1,12 @@
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a list endpoint with keyset pagination."""
+
+    items: List[T]
+    # Pass as `cursor` to get the next page; None on the last page
+    next_cursor: Optional[int]
@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel
+
+from .tag import TagRead
+from .user import UserRead
+
+
+class PostRead(BaseModel):
+    """Post as returned by the API; fields not selected with `fields=` are left out."""
+
+    id: int
+    user_id: Optional[int] = None
+    title: Optional[str] = None
+    body: Optional[str] = None
+    created_at: Optional[datetime] = None
+    # Present only when requested with `include=`
+    user: Optional[UserRead] = None
+    tags: Optional[List[TagRead]] = None
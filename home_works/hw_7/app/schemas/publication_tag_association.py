@@ -0,0 +1,10 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class PostTagAssociationRead(BaseModel):
+    """Post-tag link as returned by the API; unselected fields are left out."""
+
+    id: int
+    post_id: Optional[int] = None
+    tag_id: Optional[int] = None
@@ -0,0 +1,11 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+class TagRead(BaseModel):
+    """Tag as returned by the API; fields not selected with `fields=` are left out."""
+
+    id: int
+    name: Optional[str] = None
+    created_at: Optional[datetime] = None
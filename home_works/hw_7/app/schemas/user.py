@@ -0,0 +1,11 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class UserRead(BaseModel):
+    """User as returned by the API; fields not selected with `fields=` are left out."""
+
+    id: int
+    name: Optional[str] = None
+    username: Optional[str] = None
+    email: Optional[str] = None
@@ -1,8 +1,11 @@
 import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from .database import AsyncSessionLocal
 from .jsonplaceholder_requests import fetch_users_data, fetch_posts_data
@@ -12,51 +15,141 @@ from app.models import Base, User, Post
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-
-async def create_user(session: AsyncSession, user_data: dict):
-    existing_user = await session.execute(
-        select(User).where(User.username == user_data["username"])
+# Rows per multi-row INSERT; asyncpg allows at most 32767 bind parameters
+BATCH_SIZE = 1000
+
+
+@dataclass
+class LoadStats:
+    """Counters of a data load, per table."""
+
+    stage: str = "pending"
+    received: Dict[str, int] = field(default_factory=dict)
+    inserted: Dict[str, int] = field(default_factory=dict)
+    skipped: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def count(
+        self, table: str, inserted: int = 0, skipped: int = 0, received: int = 0
+    ) -> None:
+        self.received[table] = self.received.get(table, 0) + received
+        self.inserted[table] = self.inserted.get(table, 0) + inserted
+        self.skipped[table] = self.skipped.get(table, 0) + skipped
+
+    def as_dict(self) -> dict:
+        return {
+            "stage": self.stage,
+            "received": self.received,
+            "inserted": self.inserted,
+            "skipped": self.skipped,
+            "elapsed": round(self.elapsed, 3),
+        }
+
+
+@dataclass
+class ExistingKeys:
+    """Unique keys already in the database, read with one query per table."""
+
+    user_ids: Set[int]
+    usernames: Set[str]
+    emails: Set[str]
+    post_ids: Set[int]
+
+
+async def fetch_existing_keys(session: AsyncSession) -> ExistingKeys:
+    users = (
+        await session.execute(select(User.id, User.username, User.email))
+    ).all()
+    post_ids = (await session.execute(select(Post.id))).scalars().all()
+    return ExistingKeys(
+        user_ids={row.id for row in users},
+        usernames={row.username for row in users},
+        emails={row.email for row in users},
+        post_ids=set(post_ids),
     )
-    if existing_user.scalars().first():
-        return
-
-    user = User(
-        id=user_data["id"],
-        name=user_data["name"],
-        username=user_data["username"],
-        email=user_data["email"],
-    )
-    session.add(user)
-    await session.commit()
 
 
-async def create_post(session: AsyncSession, post_data: dict):
-    existing_user = await session.execute(
-        select(User.id).where(User.id == post_data["userId"])
+def new_users(users_data: list, keys: ExistingKeys) -> List[dict]:
+    """
+    Returns the users that violate no unique key, and adds their keys to `keys`.
+    """
+    rows = []
+    for user_data in users_data:
+        if (
+            user_data["id"] in keys.user_ids
+            or user_data["username"] in keys.usernames
+            or user_data["email"] in keys.emails
+        ):
+            continue
+        keys.user_ids.add(user_data["id"])
+        keys.usernames.add(user_data["username"])
+        keys.emails.add(user_data["email"])
+        rows.append(
+            {
+                "id": user_data["id"],
+                "name": user_data["name"],
+                "username": user_data["username"],
+                "email": user_data["email"],
+            }
+        )
+    return rows
+
+
+def new_posts(posts_data: list, keys: ExistingKeys) -> List[dict]:
+    """
+    Returns the new posts of known users, and adds their ids to `keys`.
+    """
+    rows = []
+    for post_data in posts_data:
+        if (
+            post_data["id"] in keys.post_ids
+            or post_data["userId"] not in keys.user_ids
+        ):
+            continue
+        keys.post_ids.add(post_data["id"])
+        rows.append(
+            {
+                "id": post_data["id"],
+                "user_id": post_data["userId"],
+                "title": post_data["title"],
+                "body": post_data["body"],
+            }
+        )
+    return rows
+
+
+async def insert_batches(
+    session: AsyncSession, model, rows: Sequence[dict], stats: LoadStats
+) -> None:
+    for start in range(0, len(rows), BATCH_SIZE):
+        batch = rows[start : start + BATCH_SIZE]
+        await session.execute(insert(model).values(batch))
+        # Counted per batch, so progress is visible while a table loads
+        stats.count(model.__tablename__, inserted=len(batch))
+
+
+async def save_users_to_db(
+    session: AsyncSession, users_data: list, keys: ExistingKeys, stats: LoadStats
+):
+    rows = new_users(users_data, keys)
+    stats.count(
+        User.__tablename__,
+        received=len(users_data),
+        skipped=len(users_data) - len(rows),
     )
-    user_id = existing_user.scalars().first()
+    await insert_batches(session, User, rows, stats)
 
-    if not user_id:
-        return
 
-    post = Post(
-        id=post_data["id"],
-        user_id=user_id,
-        title=post_data["title"],
-        body=post_data["body"],
+async def save_posts_to_db(
+    session: AsyncSession, posts_data: list, keys: ExistingKeys, stats: LoadStats
+):
+    rows = new_posts(posts_data, keys)
+    stats.count(
+        Post.__tablename__,
+        received=len(posts_data),
+        skipped=len(posts_data) - len(rows),
     )
-    session.add(post)
-    await session.commit()
-
-
-async def save_users_to_db(session: AsyncSession, users_data: list):
-    for user_data in users_data:
-        await create_user(session, user_data)
-
-
-async def save_posts_to_db(session: AsyncSession, posts_data: list):
-    for post_data in posts_data:
-        await create_post(session, post_data)
+    await insert_batches(session, Post, rows, stats)
 
 
 async def initialize_database():
@@ -65,15 +158,51 @@ async def initialize_database():
         await conn.commit()
 
 
-async def main():
+async def is_loaded() -> bool:
+    """
+    Tells whether users and posts are already in the database.
+
+    main() loads both tables in one transaction, so rows in both mean that
+    an earlier import finished.
+    """
     await initialize_database()
+    async with AsyncSessionLocal() as session:
+        for model in (User, Post):
+            if await session.scalar(select(model.id).limit(1)) is None:
+                return False
+    return True
+
+
+async def main(stats: Optional[LoadStats] = None) -> LoadStats:
+    """
+    Loads users and posts that are not in the database yet.
+
+    The existing keys are read once and the payload is diffed against them
+    in memory, so only new rows are sent, in multi-row INSERTs inside one
+    transaction. Pass `stats` to follow the progress while it runs.
+    """
+    start = time.perf_counter()
+    stats = stats if stats is not None else LoadStats()
+    stats.stage = "initializing database"
+    await initialize_database()
+    stats.stage = "fetching"
     users_data, posts_data = await asyncio.gather(
         fetch_users_data(), fetch_posts_data()
     )
 
-    async with AsyncSessionLocal() as session:
-        await save_users_to_db(session, users_data)
-        await save_posts_to_db(session, posts_data)
+    async with AsyncSessionLocal() as session, session.begin():
+        stats.stage = "reconciling"
+        keys = await fetch_existing_keys(session)
+        stats.stage = "inserting users"
+        await save_users_to_db(session, users_data, keys, stats)
+        stats.stage = "inserting posts"
+        await save_posts_to_db(session, posts_data, keys, stats)
+        stats.stage = "committing"
+
+    stats.stage = "done"
+    stats.elapsed = time.perf_counter() - start
+    logger.info("Data loaded: %s", stats.as_dict())
+    return stats
 
 
 if __name__ == "__main__":
@@ -1,9 +1,47 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from typing import Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from alembic import command
-from app.config import db_url, db_echo
+from app.config import EngineSettings
+
+
+def create_engine_from_settings(
+    settings: Optional[EngineSettings] = None,
+) -> AsyncEngine:
+    """
+    Creates the async engine with the pool and statement cache settings.
+
+    Without arguments the settings are read from the environment, see
+    EngineSettings.from_env.
+    """
+    settings = settings or EngineSettings.from_env()
+    url = make_url(settings.url)
+    options = {"echo": settings.echo, "pool_pre_ping": settings.pool_pre_ping}
+    if url.drivername.startswith("sqlite"):
+        # SQLite connections are cheap and not shared between threads
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.pool_timeout,
+            pool_recycle=settings.pool_recycle,
+        )
+    if url.drivername == "postgresql+asyncpg":
+        # SQLAlchemy prepares statements itself and keeps this LRU cache per connection
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.statement_cache_size)}
+        )
+        if settings.statement_cache_size == 0:
+            # asyncpg also caches statements of its own; pgbouncer needs both off
+            options["connect_args"] = {"statement_cache_size": 0}
+    return create_async_engine(url, **options)
+
 
-engine = create_async_engine(db_url, echo=db_echo)
+engine = create_engine_from_settings()
 AsyncSessionLocal = sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
 )
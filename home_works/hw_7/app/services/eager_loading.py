@@ -0,0 +1,71 @@
+from typing import Callable, Dict, NamedTuple, Optional, Sequence, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.orm import load_only
+
+
+class Include(NamedTuple):
+    """
+    A relationship a client can ask for with `include=`.
+
+    Use joinedload for many-to-one relationships: the related row comes in
+    the same query and rows are not duplicated. Use selectinload for
+    collections: one extra `WHERE id IN (...)` query for the whole page.
+    """
+
+    attribute: object
+    loader: Callable
+    schema: Type[BaseModel]
+    many: bool = False
+
+
+def parse_include(
+    include: Optional[str], available: Dict[str, Include]
+) -> Dict[str, Include]:
+    """
+    Parses `include=`, e.g. "user,tags".
+
+    Raises:
+        HTTPException: 400 if a name is not in `available`.
+    """
+    if not include:
+        return {}
+    names = [name.strip() for name in include.split(",") if name.strip()]
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown include: {', '.join(unknown)}. "
+            f"Allowed: {', '.join(available)}",
+        )
+    return {name: available[name] for name in names}
+
+
+def entity_query(model, names: Sequence[str], includes: Dict[str, Include]):
+    """
+    Selects ORM objects with only the `names` columns and the included
+    relationships loaded up front, so serializing them runs no more queries.
+    """
+    return select(model).options(
+        load_only(*(getattr(model, name) for name in names)),
+        *(item.loader(item.attribute) for item in includes.values()),
+    )
+
+
+def to_item(
+    obj, schema: Type[BaseModel], names: Sequence[str], includes: Dict[str, Include]
+) -> BaseModel:
+    data = {name: getattr(obj, name) for name in names}
+    for name, item in includes.items():
+        value = getattr(obj, name)
+        if item.many:
+            data[name] = [
+                item.schema.model_validate(v, from_attributes=True) for v in value
+            ]
+        elif value is not None:
+            data[name] = item.schema.model_validate(value, from_attributes=True)
+        else:
+            data[name] = None
+    return schema(**data)
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from dataclasses import asdict, fields, replace
+from typing import List, Optional
+
+from sqlalchemy import select
+
+from app.config import EngineSettings, parse_setting
+from app.models import Post
+from app.services.database import create_engine_from_settings
+
+# A typical API query: one page of posts after a cursor
+QUERY = select(Post.id, Post.title).order_by(Post.id).limit(20)
+TUNABLE = {field.name: field.type for field in fields(EngineSettings)}
+TUNABLE.pop("url")
+
+# Compared with the current settings when no variants are given
+DEFAULT_VARIANTS = [
+    "pool_size=20,max_overflow=20",
+    "pool_pre_ping=false",
+    "statement_cache_size=0",
+]
+
+
+def parse_variant(text: str, base: EngineSettings) -> EngineSettings:
+    """
+    Applies overrides like "pool_size=20,statement_cache_size=0" to `base`.
+
+    Raises:
+        ValueError: On an unknown setting or a bad value.
+    """
+    overrides = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, _, value = item.partition("=")
+        name = name.strip()
+        if name not in TUNABLE:
+            raise ValueError(f"Unknown setting {name!r}, allowed: {', '.join(TUNABLE)}")
+        try:
+            overrides[name] = parse_setting(TUNABLE[name], value)
+        except ValueError:
+            raise ValueError(f"Invalid value {value!r} for {name}") from None
+    return replace(base, **overrides)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Returns None when there are no values, NaN would not serialize to JSON."""
+    if not sorted_values:
+        return None
+    return sorted_values[
+        min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    ]
+
+
+async def measure(settings: EngineSettings, requests: int, concurrency: int) -> dict:
+    """
+    Runs `requests` queries from `concurrency` tasks on a new engine.
+
+    Every query checks a connection out of the pool, so pool size, overflow,
+    pre-ping and the statement cache all show up in the numbers. Pool
+    timeouts and other errors are counted, not raised.
+    """
+    engine = create_engine_from_settings(settings)
+    latencies: List[float] = []
+    errors: dict = {}
+    remaining = iter(range(requests))
+
+    async def worker():
+        for number in remaining:
+            start = time.perf_counter()
+            try:
+                async with engine.connect() as connection:
+                    await connection.execute(QUERY.where(Post.id > number % 100))
+            except Exception as e:
+                errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+            else:
+                latencies.append(time.perf_counter() - start)
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await engine.dispose()
+
+    latencies.sort()
+
+    def latency_ms(fraction: float) -> Optional[float]:
+        value = percentile(latencies, fraction)
+        return None if value is None else round(value * 1000, 3)
+
+    result = asdict(settings)
+    del result["url"]
+    return {
+        "settings": result,
+        "queries": len(latencies),
+        "errors": errors,
+        "qps": round(len(latencies) / elapsed, 1),
+        "latency_ms": {
+            name: latency_ms(fraction)
+            for name, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+        },
+    }
+
+
+async def compare(variants: List[str], requests: int, concurrency: int) -> List[dict]:
+    """
+    Measures the current settings and each variant of them, one after another.
+    """
+    base = EngineSettings.from_env()
+    configurations = [base] + [parse_variant(text, base) for text in variants]
+    results = []
+    for settings in configurations:
+        results.append(await measure(settings, requests, concurrency))
+    return results
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import func, select
+
+from .data_loader import LoadStats, is_loaded, main as load_data
+from .database import engine
+
+logger = logging.getLogger(__name__)
+
+# Key of the PostgreSQL advisory lock held by the replica that imports
+IMPORT_LOCK_KEY = 7_300_001
+
+
+class ImportJob:
+    """
+    Imports the jsonplaceholder data in the background.
+
+    Every replica starts the job at startup, but only the one that gets the
+    PostgreSQL advisory lock imports; the others finish at once with the
+    "skipped" state. The lock belongs to the database session, so it is
+    released if the importing replica dies. A replica that gets the lock
+    after an import finished skips too, so restarts and replicas started
+    later do not import again. The app serves requests while the import
+    runs; `progress()` reports how far it got and `reason` why it skipped.
+    """
+
+    def __init__(self, lock_key: int = IMPORT_LOCK_KEY):
+        self.lock_key = lock_key
+        self.state = "idle"
+        self.error: Optional[str] = None
+        self.reason: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.stats = LoadStats()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def progress(self) -> dict:
+        return {
+            "state": self.state,
+            "error": self.error,
+            "reason": self.reason,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            **self.stats.as_dict(),
+        }
+
+    def skip(self, reason: str) -> None:
+        self.state = "skipped"
+        self.reason = reason
+        logger.info("%s Skipping the import.", reason)
+
+    async def _run(self) -> None:
+        self.state = "waiting for lock"
+        self.started_at = time.time()
+        try:
+            async with engine.connect() as connection:
+                locked = await connection.scalar(
+                    select(func.pg_try_advisory_lock(self.lock_key))
+                )
+                # The lock outlives the transaction; do not stay idle in it
+                await connection.commit()
+                if not locked:
+                    self.skip("Another replica is importing the data.")
+                    return
+                try:
+                    self.state = "checking"
+                    if await is_loaded():
+                        self.skip("The data is already loaded.")
+                        return
+                    self.state = "running"
+                    self.stats = LoadStats()
+                    await load_data(self.stats)
+                    self.state = "done"
+                finally:
+                    try:
+                        await connection.scalar(
+                            select(func.pg_advisory_unlock(self.lock_key))
+                        )
+                        await connection.commit()
+                    except BaseException:
+                        # A pooled connection would keep the lock, closing it frees it
+                        await connection.invalidate()
+                        raise
+        except asyncio.CancelledError:
+            self.state = "cancelled"
+            raise
+        except Exception as e:
+            self.state = "failed"
+            self.error = f"{type(e).__name__}: {e}"
+            logger.exception("Data import failed")
+        finally:
+            self.finished_at = time.time()
+
+
+import_job = ImportJob()
@@ -0,0 +1,107 @@
+from typing import Dict, List, Optional, Type
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas import Page
+from app.services.eager_loading import Include, entity_query, to_item
+
+DEFAULT_LIMIT = 50
+# Hard cap: no request can make the server read and serialize more rows
+MAX_LIMIT = 200
+# Ids are INTEGER columns; a larger cursor would fail in the database, not here
+MAX_CURSOR = 2**31 - 1
+
+
+class PageParams:
+    """Query parameters shared by the list endpoints."""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(
+            None, description="next_cursor of the previous page"
+        ),
+        limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+        fields: Optional[str] = Query(
+            None, description="Comma-separated fields to return, e.g. id,title"
+        ),
+    ):
+        self.cursor = parse_cursor(cursor)
+        self.limit = limit
+        self.fields = fields
+
+
+def parse_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Parses `cursor=`, the next_cursor of a previous page.
+
+    Raises:
+        HTTPException: 400 if it is not an integer from 0 to MAX_CURSOR.
+    """
+    if cursor is None:
+        return None
+    if not (cursor.isascii() and cursor.isdigit()) or int(cursor) > MAX_CURSOR:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor!r}")
+    return int(cursor)
+
+
+def selected_fields(fields: Optional[str], schema: Type[BaseModel], model) -> List[str]:
+    """
+    Parses `fields=`; all schema fields if it is empty. The id is always included.
+
+    Only fields backed by a column of the model can be selected.
+
+    Raises:
+        HTTPException: 400 if a field is not in the schema.
+    """
+    columns = model.__table__.columns
+    allowed = [name for name in schema.model_fields if name in columns]
+    if not fields:
+        return allowed
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. "
+            f"Allowed: {', '.join(allowed)}",
+        )
+    return ["id"] + [name for name in allowed if name in requested and name != "id"]
+
+
+async def keyset_page(
+    db: AsyncSession,
+    model,
+    schema: Type[BaseModel],
+    params: PageParams,
+    includes: Optional[Dict[str, Include]] = None,
+) -> Page:
+    """
+    Returns the page of rows with id greater than the cursor, ordered by id.
+
+    Without includes only the selected columns are read, as plain rows
+    rather than ORM objects. With includes ORM objects are loaded together
+    with the requested relationships. One extra row is fetched to know
+    whether a next page exists.
+    """
+    names = selected_fields(params.fields, schema, model)
+    if includes:
+        query = entity_query(model, names, includes)
+    else:
+        query = select(*(getattr(model, name) for name in names))
+    query = query.order_by(model.id)
+    if params.cursor is not None:
+        query = query.where(model.id > params.cursor)
+    result = await db.execute(query.limit(params.limit + 1))
+    if includes:
+        rows = result.unique().scalars().all()
+        items = [to_item(obj, schema, names, includes) for obj in rows[: params.limit]]
+    else:
+        rows = result.all()
+        items = [schema(**row._asdict()) for row in rows[: params.limit]]
+    return Page(
+        items=items,
+        next_cursor=rows[params.limit - 1].id if len(rows) > params.limit else None,
+    )
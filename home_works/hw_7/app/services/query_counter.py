@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+
+
+class QueryCounter:
+    """
+    Records the SQL statements an engine executes while the block runs.
+
+    Works with async engines too (listens on `engine.sync_engine`).
+
+    Example:
+        with QueryCounter(engine) as counter:
+            await client.get("/posts/?include=user,tags")
+        print(counter.count, counter.statements)
+    """
+
+    def __init__(self, engine):
+        self.engine = getattr(engine, "sync_engine", engine)
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@contextmanager
+def assert_max_queries(engine, expected: int) -> Iterator[QueryCounter]:
+    """
+    Fails if the block runs more than `expected` statements, e.g. because
+    of an N+1 pattern; the error lists the statements.
+
+    Raises:
+        AssertionError: If more statements ran.
+    """
+    with QueryCounter(engine) as counter:
+        yield counter
+    if counter.count > expected:
+        statements = "\n".join(
+            f"{number}. {statement}"
+            for number, statement in enumerate(counter.statements, 1)
+        )
+        raise AssertionError(
+            f"Expected at most {expected} queries, {counter.count} ran:\n{statements}"
+        )
@@ -0,0 +1,39 @@
+import asyncio
+import os
+import tempfile
+
+# The app creates its engine on import, point it at SQLite first
+DB_DIR = tempfile.mkdtemp()
+os.environ["DB_URL"] = f"sqlite+aiosqlite:///{os.path.join(DB_DIR, 'blog.db')}"
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects.postgresql import CITEXT
+from sqlalchemy.ext.compiler import compiles
+
+from app.main import app
+from app.models import Base
+from app.services.database import engine
+
+
+@compiles(CITEXT, "sqlite")
+def compile_citext(type_, compiler, **kw):
+    return "TEXT COLLATE NOCASE"
+
+
+async def reset_database():
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+
+
+@pytest.fixture
+def database():
+    """Fixture for empty tables."""
+    asyncio.run(reset_database())
+
+
+@pytest.fixture
+def client(database) -> TestClient:
+    """Fixture for a client of the app over empty tables, without the startup import."""
+    return TestClient(app)
@@ -0,0 +1,64 @@
+import pytest
+
+from app.config import EngineSettings
+from app.routers import benchmark
+from app.services import database
+from app.services.engine_benchmark import parse_variant
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(benchmark, "benchmark_enabled", True)
+
+
+def test_parse_variant():
+    base = EngineSettings(pool_size=5)
+    settings = parse_variant("pool_size=20, pool_pre_ping=false,", base)
+    assert settings == EngineSettings(pool_size=20, pool_pre_ping=False)
+    assert parse_variant("", base) == base
+
+
+@pytest.mark.parametrize(
+    "variant, message",
+    [
+        ("pool_size=abc", "Invalid value 'abc' for pool_size"),
+        ("pool_size", "Invalid value '' for pool_size"),
+        ("unknown=1", "Unknown setting 'unknown'"),
+        ("url=sqlite://", "Unknown setting 'url'"),
+    ],
+)
+def test_bad_variant(client, enabled, variant, message):
+    response = client.get("/benchmark/engine", params={"variant": variant})
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith(message)
+
+
+def test_too_many_variants(client, enabled):
+    response = client.get("/benchmark/engine", params={"variant": ["pool_size=1"] * 6})
+    assert response.status_code == 400
+
+
+def test_disabled(client):
+    assert client.get("/benchmark/engine").status_code == 404
+
+
+@pytest.mark.parametrize(
+    "statement_cache_size, connect_args",
+    [(100, None), (0, {"statement_cache_size": 0})],
+)
+def test_statement_cache_size(monkeypatch, statement_cache_size, connect_args):
+    created = {}
+    monkeypatch.setattr(
+        database,
+        "create_async_engine",
+        lambda url, **options: created.update(url=url, **options),
+    )
+    settings = EngineSettings(
+        url="postgresql+asyncpg://user:password@db:5432/blog",
+        statement_cache_size=statement_cache_size,
+    )
+    database.create_engine_from_settings(settings)
+    assert created["url"].query["prepared_statement_cache_size"] == str(
+        statement_cache_size
+    )
+    assert created.get("connect_args") == connect_args
@@ -0,0 +1,62 @@
+import pytest
+
+from app.config import EngineSettings, parse_setting
+
+
+@pytest.mark.parametrize(
+    "kind, value, expected",
+    [
+        (bool, "1", True),
+        (bool, " Yes ", True),
+        ("bool", "on", True),
+        (bool, "0", False),
+        (bool, "false", False),
+        (float, "2.5", 2.5),
+        ("float", "30", 30.0),
+        (int, "20", 20),
+        ("int", " 7 ", 7),
+    ],
+)
+def test_parse_setting(kind, value, expected):
+    assert parse_setting(kind, value) == expected
+
+
+def test_from_env_defaults(monkeypatch):
+    for name in ("POOL_SIZE", "MAX_OVERFLOW", "POOL_TIMEOUT", "POOL_PRE_PING"):
+        monkeypatch.delenv(f"DB_{name}", raising=False)
+    settings = EngineSettings.from_env()
+    assert (settings.pool_size, settings.max_overflow) == (5, 10)
+    assert settings.pool_timeout == 30.0 and settings.pool_pre_ping is True
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "2.5")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "600")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+    monkeypatch.setenv("DB_STATEMENT_CACHE_SIZE", "0")
+    settings = EngineSettings.from_env()
+    assert settings == EngineSettings(
+        pool_size=20,
+        max_overflow=0,
+        pool_timeout=2.5,
+        pool_recycle=600,
+        pool_pre_ping=False,
+        statement_cache_size=0,
+    )
+
+
+def test_from_env_with_prefix(monkeypatch):
+    monkeypatch.setenv("TEST_POOL_SIZE", "3")
+    assert EngineSettings.from_env(prefix="TEST_").pool_size == 3
+
+
+@pytest.mark.parametrize(
+    "name, value",
+    [("DB_POOL_SIZE", "abc"), ("DB_POOL_TIMEOUT", ""), ("DB_POOL_RECYCLE", "1.5")],
+)
+def test_from_env_rejects_bad_values(monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValueError, match=f"{name}: invalid value"):
+        EngineSettings.from_env()
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, insert, select
+
+from app.models import Post, User
+from app.services import data_loader
+from app.services.data_loader import is_loaded
+from app.services.database import engine
+
+
+USERS = [
+    {"id": 1, "name": "User", "username": "user", "email": "u@example.com"},
+    {"id": 2, "name": "Second", "username": "second", "email": "s@example.com"},
+    {"id": 3, "name": "Third", "username": "third", "email": "t@example.com"},
+]
+POSTS = [
+    {"id": post_id, "userId": user_id, "title": f"Post {post_id}", "body": ""}
+    for post_id, user_id in ((1, 1), (2, 1), (3, 2), (4, 3))
+]
+
+
+async def add_rows(*models):
+    async with engine.begin() as connection:
+        if User in models:
+            await connection.execute(
+                insert(User),
+                {"id": 1, "name": "User", "username": "user", "email": "u@example.com"},
+            )
+        if Post in models:
+            await connection.execute(
+                insert(Post), {"id": 1, "user_id": 1, "title": "Post", "body": ""}
+            )
+
+
+def test_is_loaded_on_empty_tables(database):
+    assert not asyncio.run(is_loaded())
+
+
+def test_is_loaded_needs_users_and_posts(database):
+    asyncio.run(add_rows(User))
+    assert not asyncio.run(is_loaded())
+    asyncio.run(add_rows(Post))
+    assert asyncio.run(is_loaded())
+
+
+@pytest.fixture
+def payload(monkeypatch):
+    """Replaces the JSONPlaceholder requests with USERS and POSTS."""
+
+    async def fetch_users():
+        return USERS
+
+    async def fetch_posts():
+        return POSTS
+
+    monkeypatch.setattr(data_loader, "fetch_users_data", fetch_users)
+    monkeypatch.setattr(data_loader, "fetch_posts_data", fetch_posts)
+
+
+async def count_rows(model):
+    async with engine.connect() as connection:
+        return await connection.scalar(select(func.count()).select_from(model))
+
+
+def test_load(database, payload):
+    stats = asyncio.run(data_loader.main())
+    assert stats.stage == "done"
+    assert stats.inserted == {"users": 3, "post": 4}
+    assert stats.skipped == {"users": 0, "post": 0}
+    assert asyncio.run(count_rows(User)) == 3
+    assert asyncio.run(count_rows(Post)) == 4
+
+
+def test_rerun_inserts_nothing(database, payload):
+    asyncio.run(data_loader.main())
+    stats = asyncio.run(data_loader.main())
+    assert stats.received == {"users": 3, "post": 4}
+    assert stats.inserted == {"users": 0, "post": 0}
+    assert stats.skipped == {"users": 3, "post": 4}
+    assert asyncio.run(count_rows(User)) == 3
+    assert asyncio.run(count_rows(Post)) == 4
+
+
+def test_partial_load(database, payload):
+    # User 1 with post 1 is left from an earlier load
+    asyncio.run(add_rows(User, Post))
+    stats = asyncio.run(data_loader.main())
+    assert stats.inserted == {"users": 2, "post": 3}
+    assert stats.skipped == {"users": 1, "post": 1}
+    assert asyncio.run(count_rows(User)) == 3
+    assert asyncio.run(count_rows(Post)) == 4
+
+
+def test_new_users_and_posts_after_partial_load():
+    keys = data_loader.ExistingKeys(
+        user_ids={1},
+        usernames={"user", "taken"},
+        emails={"u@example.com"},
+        post_ids={1},
+    )
+    users = USERS + [
+        {"id": 4, "name": "Dup", "username": "taken", "email": "d@example.com"},
+        {"id": 5, "name": "Dup", "username": "dup", "email": "s@example.com"},
+    ]
+    assert [row["id"] for row in data_loader.new_users(users, keys)] == [2, 3]
+    assert keys.user_ids == {1, 2, 3}
+    # Posts of users 4 and 5 are skipped, as the users were not inserted
+    posts = POSTS + [{"id": 5, "userId": 4, "title": "", "body": ""}]
+    assert [row["id"] for row in data_loader.new_posts(posts, keys)] == [2, 3, 4]
+    assert data_loader.new_posts(posts, keys) == []
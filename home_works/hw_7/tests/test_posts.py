@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+from sqlalchemy import insert
+
+from app.models import Post, PostTagAssociation, Tag, User
+from app.services.database import engine
+from app.services.query_counter import assert_max_queries
+
+USERS = 3
+POSTS = 12
+TAGS = 4
+
+
+async def seed():
+    async with engine.begin() as connection:
+        await connection.execute(
+            insert(User),
+            [
+                {
+                    "id": i,
+                    "name": f"User {i}",
+                    "username": f"user{i}",
+                    "email": f"user{i}@example.com",
+                }
+                for i in range(1, USERS + 1)
+            ],
+        )
+        await connection.execute(
+            insert(Post),
+            [
+                {
+                    "id": i,
+                    "user_id": i % USERS + 1,
+                    "title": f"Post {i}",
+                    "body": "text",
+                }
+                for i in range(1, POSTS + 1)
+            ],
+        )
+        await connection.execute(
+            insert(Tag), [{"id": i, "name": f"tag{i}"} for i in range(1, TAGS + 1)]
+        )
+        await connection.execute(
+            insert(PostTagAssociation),
+            [
+                {"post_id": post_id, "tag_id": tag_id}
+                for post_id in range(1, POSTS + 1)
+                for tag_id in range(1, post_id % TAGS + 1)
+            ],
+        )
+
+
+@pytest.fixture
+def blog(client):
+    """Fixture for a client over posts with users and tags."""
+    asyncio.run(seed())
+    return client
+
+
+def test_posts_include_user_and_tags_in_two_queries(blog):
+    # One query for the posts joined with their users, one for the tags of the page
+    with assert_max_queries(engine, 2):
+        response = blog.get("/posts/", params={"include": "user,tags"})
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["id"] for item in items] == list(range(1, POSTS + 1))
+    for item in items:
+        assert item["user"]["id"] == item["user_id"]
+        assert [tag["name"] for tag in item["tags"]] == [
+            f"tag{i}" for i in range(1, item["id"] % TAGS + 1)
+        ]
+
+
+def test_query_count_does_not_grow_with_the_page(blog):
+    for limit in (1, POSTS):
+        with assert_max_queries(engine, 2):
+            response = blog.get(
+                "/posts/", params={"include": "user,tags", "limit": limit}
+            )
+        assert len(response.json()["items"]) == limit
+
+
+def test_post_include_user_and_tags(blog):
+    with assert_max_queries(engine, 2):
+        response = blog.get("/posts/5", params={"include": "user,tags"})
+    assert response.json()["user"]["id"] == 5 % USERS + 1
+    assert len(response.json()["tags"]) == 5 % TAGS
+
+
+def test_unknown_include(blog):
+    response = blog.get("/posts/", params={"include": "comments"})
+    assert response.status_code == 400
+
+
+def test_cursor_round_trip(blog):
+    ids, cursor = [], None
+    for _ in range(POSTS):
+        params = {"limit": 5} if cursor is None else {"limit": 5, "cursor": cursor}
+        page = blog.get("/posts/", params=params).json()
+        ids += [item["id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+        assert cursor == ids[-1]
+    assert ids == list(range(1, POSTS + 1))
+
+
+@pytest.mark.parametrize(
+    "params, expected_ids",
+    [
+        ({"limit": POSTS}, list(range(1, POSTS + 1))),
+        ({"limit": 2, "cursor": POSTS - 2}, [POSTS - 1, POSTS]),
+        ({"limit": 5, "cursor": POSTS}, []),
+    ],
+)
+def test_last_page(blog, params, expected_ids):
+    page = blog.get("/posts/", params=params).json()
+    assert [item["id"] for item in page["items"]] == expected_ids
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.parametrize("cursor", ["abc", "-1", "1.5", "", "²", str(2**31)])
+def test_invalid_cursor(blog, cursor):
+    response = blog.get("/posts/", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert "Invalid cursor" in response.json()["detail"]
+
+
+def test_fields(blog):
+    page = blog.get("/posts/", params={"fields": "title", "limit": 2}).json()
+    assert page["items"] == [{"id": 1, "title": "Post 1"}, {"id": 2, "title": "Post 2"}]
+    post = blog.get("/posts/3", params={"fields": "user_id, body"}).json()
+    assert post == {"id": 3, "user_id": 3 % USERS + 1, "body": "text"}
+
+
+@pytest.mark.parametrize("url", ["/posts/", "/posts/1", "/users/", "/tags/"])
+def test_unknown_fields(blog, url):
+    response = blog.get(url, params={"fields": "title,secret,password"})
+    assert response.status_code == 400
+    detail = response.json()["detail"]
+    assert detail.startswith("Unknown fields: ")
+    assert "secret, password" in detail